@@ -25,6 +25,10 @@ def make_parser():
     parser.add_argument("--emailuser", action="store_true")
     parser.add_argument("--disabletimezone", action="store_true")
     parser.add_argument("--bench", action="store_true")
+    parser.add_argument(
+        "--bench-output",
+        help="Append benchmark results to this file, as one JSON object per line",
+    )
     return parser
 
 
@@ -80,9 +84,14 @@ def runtests():
     if args.disabletimezone:
         os.environ["DISABLE_TIMEZONE"] = "1"
 
+    if args.bench_output:
+        os.environ["WAGTAIL_BENCHMARK_OUTPUT"] = os.path.abspath(args.bench_output)
+
     if args.bench:
         benchmarks = [
             "wagtail.admin.tests.benches",
+            "wagtail.tests.benches",
+            "wagtail.images.tests.benches",
         ]
 
         argv = [sys.argv[0], "test", "-v2"] + benchmarks + rest
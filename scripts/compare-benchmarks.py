@@ -0,0 +1,81 @@
+"""
+Compares two sets of benchmark results written by `runtests.py --bench-output`,
+such as those from the main branch and from a feature branch:
+
+    python runtests.py --bench --bench-output=main.jsonl
+    git checkout my-branch
+    python runtests.py --bench --bench-output=branch.jsonl
+    python scripts/compare-benchmarks.py main.jsonl branch.jsonl
+"""
+import argparse
+import json
+
+
+def load_results(path):
+    # If a benchmark was run more than once, the latest result is used
+    results = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                result = json.loads(line)
+                results[result["name"], result["database"]] = result
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="Percentage change in median time to report as a regression or improvement",
+    )
+    args = parser.parse_args()
+
+    before = load_results(args.before)
+    after = load_results(args.after)
+
+    for key in sorted(set(before) & set(after)):
+        name, database = key
+        before_time = before[key]["time_median"]
+        after_time = after[key]["time_median"]
+        change = (after_time - before_time) * 100 / before_time
+
+        if change >= args.threshold:
+            status = "SLOWER"
+        elif change <= -args.threshold:
+            status = "faster"
+        else:
+            status = ""
+
+        queries = ""
+        if before[key]["queries_max"] != after[key]["queries_max"]:
+            queries = "queries %d -> %d" % (
+                before[key]["queries_max"],
+                after[key]["queries_max"],
+            )
+
+        print(
+            "%-70s %-10s %9.2fms -> %9.2fms %+7.1f%% %-6s %s"
+            % (
+                name,
+                database,
+                before_time * 1000,
+                after_time * 1000,
+                change,
+                status,
+                queries,
+            )
+        )
+
+    for key in sorted(set(before) ^ set(after)):
+        print(
+            "%-70s %-10s only in %s"
+            % (*key, args.before if key in before else args.after)
+        )
+
+
+if __name__ == "__main__":
+    main()
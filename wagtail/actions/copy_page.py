@@ -1,11 +1,17 @@
 import logging
 import uuid
+from collections import defaultdict
 
+from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied
-from modelcluster.models import get_all_child_relations
+from django.db import connections, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from modelcluster.models import get_all_child_m2m_relations, get_all_child_relations
 
 from wagtail.log_actions import log
-from wagtail.models.copying import _copy, _copy_m2m_relations
+from wagtail.log_actions import registry as log_registry
+from wagtail.models.copying import _copy, _copy_m2m_relations, _extract_field_data
 from wagtail.models.i18n import TranslatableMixin
 from wagtail.signals import page_published
 
@@ -28,11 +34,35 @@ class CopyPagePermissionError(PermissionDenied):
     pass
 
 
+class BulkCopyItem:
+    """
+    A page being copied in bulk, along with its copy and the objects copied with it
+    """
+
+    def __init__(self, page, revisions, exclude_fields, update_attrs):
+        self.page = page
+        self.revisions = revisions
+        self.exclude_fields = exclude_fields
+        self.update_attrs = update_attrs
+        self.copy = None
+        self.child_object_map = {}
+        self.latest_revision = None
+
+
 class CopyPageAction:
     """
     Copies pages and page trees.
+
+    With ``recursive=True`` and ``bulk=True``, the descendants of the page are copied in batches
+    with bulk inserts, which is much faster for large trees. The signals that saving each page
+    would send (``post_save``, and ``page_published`` for live copies) are sent once each batch
+    has been inserted, but not for the copied child objects of pages; copied revisions are
+    stored with their full content, even if revision delta storage is enabled.
     """
 
+    # Number of pages copied in each batch in bulk mode
+    bulk_batch_size = 500
+
     def __init__(
         self,
         page,
@@ -46,6 +76,7 @@ class CopyPageAction:
         process_child_object=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
     ):
         # Note: These four parameters don't apply to any copied children
         self.page = page
@@ -60,6 +91,7 @@ class CopyPageAction:
         self.process_child_object = process_child_object
         self.log_action = log_action
         self.reset_translation_key = reset_translation_key
+        self.bulk = bulk
         self._uuid_mapping = {}
 
     def generate_translation_key(self, old_uuid):
@@ -111,15 +143,14 @@ class CopyPageAction:
                         "You do not have permission to publish a page at the destination"
                     )
 
-    def _copy_page(
-        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
-    ):
-        specific_page = page.specific
-        exclude_fields = (
+    def _get_exclude_fields(self, specific_page, exclude_fields=None):
+        return (
             specific_page.default_exclude_fields_in_copy
             + specific_page.exclude_fields_in_copy
             + (exclude_fields or [])
         )
+
+    def _get_update_attrs(self, update_attrs=None):
         if self.keep_live:
             base_update_attrs = {
                 "alias_of": None,
@@ -144,23 +175,97 @@ class CopyPageAction:
         if update_attrs:
             base_update_attrs.update(update_attrs)
 
+        return base_update_attrs
+
+    def _prepare_child_object(
+        self, specific_page, page_copy, child_relation, child_object
+    ):
+        # Run process_child_object on a copied child object if we need to
+        if self.process_child_object:
+            self.process_child_object(
+                specific_page, page_copy, child_relation, child_object
+            )
+
+        if self.reset_translation_key and isinstance(child_object, TranslatableMixin):
+            child_object.translation_key = self.generate_translation_key(
+                child_object.translation_key
+            )
+
+    def _copy_revision(self, revision, page_copy, specific_page, child_object_map):
+        """
+        Turns ``revision`` (a revision of ``specific_page``) into an unsaved revision of
+        ``page_copy``
+        """
+        revision.pk = None
+        revision.submitted_for_moderation = False
+        revision.approved_go_live_at = None
+        revision.object_id = page_copy.id
+
+        # Update ID fields in content
+        revision_content = revision.get_content()
+        revision_content["pk"] = page_copy.pk
+
+        for child_relation in get_all_child_relations(specific_page):
+            accessor_name = child_relation.get_accessor_name()
+            try:
+                child_objects = revision_content[accessor_name]
+            except KeyError:
+                # KeyErrors are possible if the revision was created
+                # before this child relation was added to the database
+                continue
+
+            for child_object in child_objects:
+                child_object[child_relation.field.name] = page_copy.pk
+                # Remap primary key to copied versions
+                # If the primary key is not recognised (eg, the child object has been deleted from the database)
+                # set the primary key to None
+                copied_child_object = child_object_map.get(
+                    (child_relation, child_object["pk"])
+                )
+                child_object["pk"] = (
+                    copied_child_object.pk if copied_child_object else None
+                )
+                if self.reset_translation_key and "translation_key" in child_object:
+                    child_object["translation_key"] = self.generate_translation_key(
+                        child_object["translation_key"]
+                    )
+
+        # Copies are stored with their full content
+        revision.set_content(revision_content)
+
+    def _get_log_data(self, page, page_copy, source, destination):
+        return {
+            "page": {
+                "id": page_copy.id,
+                "title": page_copy.get_admin_display_title(),
+                "locale": {
+                    "id": page_copy.locale_id,
+                    "language_code": page_copy.locale.language_code,
+                },
+            },
+            "source": source,
+            "destination": destination,
+            "keep_live": page_copy.live and self.keep_live,
+            "source_locale": {
+                "id": page.locale_id,
+                "language_code": page.locale.language_code,
+            },
+        }
+
+    def _copy_page(
+        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
+    ):
+        specific_page = page.specific
+        exclude_fields = self._get_exclude_fields(specific_page, exclude_fields)
+        base_update_attrs = self._get_update_attrs(update_attrs)
+
         page_copy, child_object_map = _copy(
             specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
         )
-        # Save copied child objects and run process_child_object on them if we need to
         for (child_relation, old_pk), child_object in child_object_map.items():
-
-            if self.process_child_object:
-                self.process_child_object(
-                    specific_page, page_copy, child_relation, child_object
-                )
-
-            if self.reset_translation_key and isinstance(
-                child_object, TranslatableMixin
-            ):
-                child_object.translation_key = self.generate_translation_key(
-                    child_object.translation_key
-                )
+            self._prepare_child_object(
+                specific_page, page_copy, child_relation, child_object
+            )
 
         # Save the new page
         if _mpnode_attrs:
@@ -187,48 +292,9 @@ class CopyPageAction:
         # Copy revisions
         if self.copy_revisions:
             for revision in page.revisions.all():
-                revision.pk = None
-                revision.submitted_for_moderation = False
-                revision.approved_go_live_at = None
-                revision.object_id = page_copy.id
-
-                # Update ID fields in content
-                revision_content = revision.content
-                revision_content["pk"] = page_copy.pk
-
-                for child_relation in get_all_child_relations(specific_page):
-                    accessor_name = child_relation.get_accessor_name()
-                    try:
-                        child_objects = revision_content[accessor_name]
-                    except KeyError:
-                        # KeyErrors are possible if the revision was created
-                        # before this child relation was added to the database
-                        continue
-
-                    for child_object in child_objects:
-                        child_object[child_relation.field.name] = page_copy.pk
-                        # Remap primary key to copied versions
-                        # If the primary key is not recognised (eg, the child object has been deleted from the database)
-                        # set the primary key to None
-                        copied_child_object = child_object_map.get(
-                            (child_relation, child_object["pk"])
-                        )
-                        child_object["pk"] = (
-                            copied_child_object.pk if copied_child_object else None
-                        )
-                        if (
-                            self.reset_translation_key
-                            and "translation_key" in child_object
-                        ):
-                            child_object[
-                                "translation_key"
-                            ] = self.generate_translation_key(
-                                child_object["translation_key"]
-                            )
-
-                revision.content = revision_content
-
-                # Save
+                self._copy_revision(
+                    revision, page_copy, specific_page, child_object_map
+                )
                 revision.save()
 
         # Create a new revision
@@ -265,33 +331,22 @@ class CopyPageAction:
                 instance=page_copy,
                 action=self.log_action,
                 user=self.user,
-                data={
-                    "page": {
-                        "id": page_copy.id,
-                        "title": page_copy.get_admin_display_title(),
-                        "locale": {
-                            "id": page_copy.locale_id,
-                            "language_code": page_copy.locale.language_code,
-                        },
-                    },
-                    "source": {
+                data=self._get_log_data(
+                    page,
+                    page_copy,
+                    source={
                         "id": parent.id,
                         "title": parent.specific_deferred.get_admin_display_title(),
                     }
                     if parent
                     else None,
-                    "destination": {
+                    destination={
                         "id": to.id,
                         "title": to.specific_deferred.get_admin_display_title(),
                     }
                     if to
                     else None,
-                    "keep_live": page_copy.live and self.keep_live,
-                    "source_locale": {
-                        "id": page.locale_id,
-                        "language_code": page.locale.language_code,
-                    },
-                },
+                ),
             )
             if page_copy.live and self.keep_live:
                 # Log the publish if the use chose to keep the copied page live
@@ -308,7 +363,9 @@ class CopyPageAction:
         # Copy child pages
         from wagtail.models import Page
 
-        if self.recursive:
+        if self.recursive and self._can_copy_in_bulk():
+            self._copy_descendants_in_bulk(page, page_copy)
+        elif self.recursive:
             numchild = 0
 
             for child_page in page.get_children().specific():
@@ -328,9 +385,430 @@ class CopyPageAction:
 
         return page_copy
 
+    def _can_copy_in_bulk(self):
+        from wagtail.models import Page
+
+        # Rows are inserted with bulk_create, which needs the database to return their IDs
+        return (
+            self.bulk
+            and connections[Page.objects.db].features.can_return_rows_from_bulk_insert
+        )
+
+    def _copy_descendants_in_bulk(self, page, page_copy):
+        """
+        Copies all descendants of ``page`` below ``page_copy``, ``bulk_batch_size`` pages at a
+        time. The tree paths of the copies are worked out in advance (keeping the same relative
+        paths as the original pages), so that the pages, their child objects, revisions and log
+        entries can be inserted with a few queries per batch.
+        """
+        from wagtail.models import (
+            Locale,
+            Page,
+            descendant_counts_enabled,
+            get_ancestor_paths,
+            update_descendant_counts,
+        )
+
+        descendants = page.get_descendants().order_by("path")
+
+        # Count the children and descendants that each copy will have
+        numchild = defaultdict(int)
+        descendant_counts = defaultdict(lambda: [0, 0])
+        for path, live in descendants.values_list("path", "live"):
+            numchild[path[: -Page.steplen]] += 1
+            live = live and self.keep_live
+            for ancestor_path in get_ancestor_paths(path)[page.depth - 1 :]:
+                descendant_counts[ancestor_path][0] += 1
+                descendant_counts[ancestor_path][1] += live
+
+        if not numchild:
+            return
+
+        context = {
+            "page": page,
+            "page_copy": page_copy,
+            "numchild": numchild,
+            "descendant_counts": descendant_counts,
+            "locales": Locale.objects.in_bulk(),
+            # The URL path and log summary of the copy of each page, and the log summary of
+            # each original page, keyed by the path of the original page
+            "copies": {
+                page.path: {
+                    "url_path": page_copy.url_path,
+                    "log_summary": self._get_log_summary(page_copy),
+                }
+            },
+            "sources": {page.path: self._get_log_summary(page)},
+        }
+
+        last_path = page.path
+        while True:
+            pages = list(
+                descendants.filter(path__gt=last_path)[
+                    : self.bulk_batch_size
+                ].specific()
+            )
+            if not pages:
+                break
+            last_path = pages[-1].path
+            self._copy_batch(pages, context)
+
+        page_copy.numchild = numchild[page.path]
+        page_copy.save(clean=False, update_fields=["numchild"])
+
+        if descendant_counts_enabled():
+            update_descendant_counts(
+                Page.objects.filter(
+                    path__in=get_ancestor_paths(page_copy.path) + [page_copy.path]
+                ),
+                *descendant_counts[page.path],
+            )
+
+    def _get_log_summary(self, page):
+        return {
+            "id": page.id,
+            "title": page.specific_deferred.get_admin_display_title(),
+        }
+
+    def _copy_batch(self, pages, context):
+        from wagtail.models import Page, Revision, get_default_page_content_type
+
+        db = Page.objects.db
+        now = timezone.now()
+        page_copy = context["page_copy"]
+        source_path_length = len(context["page"].path)
+
+        revisions_by_page = defaultdict(list)
+        if self.copy_revisions:
+            for revision in (
+                Revision.page_revisions.filter(
+                    object_id__in=[str(page.id) for page in pages]
+                )
+                .select_related("delta_base")
+                .order_by("created_at", "id")
+            ):
+                revisions_by_page[revision.object_id].append(revision)
+
+        children_by_page = self._get_child_objects(pages)
+
+        if not self.user:
+            owners = get_user_model().objects.in_bulk(
+                {page.owner_id for page in pages if page.owner_id}
+            )
+
+        # Make unsaved copies of the pages and their child objects
+        items = []
+        url_paths = {}
+        for specific_page in pages:
+            item = BulkCopyItem(
+                page=specific_page,
+                revisions=revisions_by_page[str(specific_page.pk)],
+                exclude_fields=self._get_exclude_fields(specific_page),
+                update_attrs=self._get_update_attrs(),
+            )
+            data = _extract_field_data(
+                specific_page, exclude_fields=item.exclude_fields
+            )
+            copy = item.copy = specific_page.__class__(**data)
+            for field, value in item.update_attrs.items():
+                if field in data:
+                    setattr(copy, field, value)
+
+            for child_relation in get_all_child_relations(specific_page):
+                accessor_name = child_relation.get_accessor_name()
+                copy_manager = getattr(copy, accessor_name)
+                copy_manager.clear()
+                if accessor_name in item.exclude_fields:
+                    continue
+
+                for child_object in children_by_page[
+                    (child_relation, specific_page.pk)
+                ]:
+                    old_pk = child_object.pk
+                    child_object.pk = None
+                    copy_manager.add(child_object)
+                    item.child_object_map[(child_relation, old_pk)] = child_object
+                    self._prepare_child_object(
+                        specific_page, copy, child_relation, child_object
+                    )
+
+            relative_path = specific_page.path[source_path_length:]
+            copy.path = page_copy.path + relative_path
+            copy.depth = page_copy.depth + len(relative_path) // Page.steplen
+            copy.numchild = context["numchild"][specific_page.path]
+            (copy.descendant_count, copy.live_descendant_count,) = context[
+                "descendant_counts"
+            ][specific_page.path]
+
+            # The parent's copy is either in this batch or an earlier one
+            parent_path = specific_page.path[: -Page.steplen]
+            if parent_path in url_paths:
+                parent_url_path = url_paths[parent_path]
+            else:
+                parent_url_path = context["copies"][parent_path]["url_path"]
+            copy.url_path = url_paths[specific_page.path] = (
+                parent_url_path + copy.slug + "/"
+            )
+
+            copy.locale = context["locales"][copy.locale_id]
+            if not self.user and copy.owner_id:
+                copy.owner = owners.get(copy.owner_id)
+
+            # Like the latest revision, the draft title comes from the latest copied revision
+            # if the copy has unpublished changes
+            if item.revisions and copy.has_unpublished_changes:
+                copy.draft_title = item.revisions[-1].get_content()["title"]
+            else:
+                copy.draft_title = copy.title
+            copy.latest_revision_created_at = now
+            if self.keep_live:
+                copy.first_published_at = copy.last_published_at = now
+
+            items.append(item)
+
+        self._insert_pages([item.copy for item in items], db)
+
+        for item in items:
+            for (child_relation, old_pk), child_object in item.child_object_map.items():
+                setattr(child_object, child_relation.field.attname, item.copy.pk)
+
+            context["copies"][item.page.path] = {
+                "url_path": item.copy.url_path,
+                "log_summary": self._get_log_summary(item.copy),
+            }
+            context["sources"][item.page.path] = self._get_log_summary(item.page)
+
+        self._insert_child_objects(
+            [
+                child_object
+                for item in items
+                for child_object in item.child_object_map.values()
+            ]
+        )
+
+        for item in items:
+            for field in get_all_child_m2m_relations(item.copy):
+                if field.name not in item.exclude_fields:
+                    getattr(item.copy, field.name).commit()
+
+            _copy_m2m_relations(
+                item.page,
+                item.copy,
+                exclude_fields=item.exclude_fields,
+                update_attrs=item.update_attrs,
+            )
+
+        # Copy revisions, and create a new latest revision for each copy
+        copied_revisions = []
+        for item in items:
+            for revision in item.revisions:
+                self._copy_revision(
+                    revision, item.copy, item.page, item.child_object_map
+                )
+                copied_revisions.append(revision)
+
+            if item.revisions and item.copy.has_unpublished_changes:
+                latest = item.copy.with_content_json(item.revisions[-1].get_content())
+            else:
+                latest = item.copy
+            item.latest_revision = Revision(
+                content_type_id=item.copy.content_type_id,
+                base_content_type_id=get_default_page_content_type().id,
+                object_id=item.copy.id,
+                user=self.user,
+                created_at=now,
+                content=latest.serializable_data(),
+                expire_at=latest.expire_at,
+            )
+
+        Revision.objects.bulk_create(
+            copied_revisions + [item.latest_revision for item in items]
+        )
+
+        if self.keep_live:
+            for item in items:
+                item.copy.live_revision = item.latest_revision
+            Page.objects.bulk_update([item.copy for item in items], ["live_revision"])
+
+        self._log_copies(items, context)
+
+        # Send the signals that saving each page would have sent, now that the batch is in the
+        # database
+        for item in items:
+            post_save.send(
+                sender=type(item.copy),
+                instance=item.copy,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=db,
+            )
+            if item.copy.live:
+                page_published.send(
+                    sender=item.copy.specific_class,
+                    instance=item.copy,
+                    revision=item.latest_revision,
+                )
+
+            logger.info(
+                'Page copied: "%s" id=%d from=%d',
+                item.copy.title,
+                item.copy.id,
+                item.page.id,
+            )
+
+    def _get_child_objects(self, pages):
+        """
+        Fetches the child objects of all of the given pages, with one query per child relation,
+        as a dict mapping (child relation, page ID) to a list of child objects
+        """
+        children_by_page = defaultdict(list)
+        pages_by_model = defaultdict(list)
+        for page in pages:
+            pages_by_model[type(page)].append(page)
+
+        for model, model_pages in pages_by_model.items():
+            for child_relation in get_all_child_relations(model):
+                parental_key_name = child_relation.field.attname
+                for (
+                    child_object
+                ) in child_relation.related_model._default_manager.filter(
+                    **{parental_key_name + "__in": [page.pk for page in model_pages]}
+                ).order_by(
+                    "pk"
+                ):
+                    children_by_page[
+                        (child_relation, getattr(child_object, parental_key_name))
+                    ].append(child_object)
+
+        return children_by_page
+
+    def _insert_pages(self, copies, db):
+        """
+        Inserts the given unsaved specific pages, with one bulk insert for the page table and
+        one for each table of the page models
+        """
+        from wagtail.models import Page
+
+        base_fields = [
+            field for field in Page._meta.concrete_fields if not field.primary_key
+        ]
+        base_pages = Page.objects.bulk_create(
+            [
+                Page(
+                    **{
+                        field.attname: getattr(copy, field.attname)
+                        for field in base_fields
+                    }
+                )
+                for copy in copies
+            ]
+        )
+
+        copies_by_model = defaultdict(list)
+        for copy, base_page in zip(copies, base_pages):
+            # Set the primary key of each table, i.e. Page.id and the parent link fields
+            for model in [type(copy)] + copy._meta.get_parent_list():
+                setattr(copy, model._meta.pk.attname, base_page.pk)
+            copies_by_model[type(copy)].append(copy)
+
+        # bulk_create doesn't support multi-table inheritance, so the rows of each model below
+        # Page are inserted directly, in the same way as bulk_create does for a single table
+        connection = connections[db]
+        for model, model_copies in copies_by_model.items():
+            parent_models = [
+                parent
+                for parent in reversed(model._meta.get_parent_list())
+                if parent is not Page
+            ]
+            for table_model in parent_models + [model]:
+                fields = table_model._meta.local_concrete_fields
+                batch_size = connection.ops.bulk_batch_size(fields, model_copies)
+                for start in range(0, len(model_copies), batch_size):
+                    table_model._base_manager._insert(
+                        model_copies[start : start + batch_size],
+                        fields=fields,
+                        using=db,
+                    )
+
+            for copy in model_copies:
+                copy._state.adding = False
+                copy._state.db = db
+
+    def _insert_child_objects(self, child_objects):
+        child_objects_by_model = defaultdict(list)
+        for child_object in child_objects:
+            child_objects_by_model[type(child_object)].append(child_object)
+
+        for model, model_child_objects in child_objects_by_model.items():
+            if (
+                model._meta.get_parent_list()
+                or get_all_child_relations(model)
+                or get_all_child_m2m_relations(model)
+            ):
+                # Multi-table models and models with their own child relations are saved one
+                # at a time
+                for child_object in model_child_objects:
+                    child_object.save()
+            else:
+                model._default_manager.bulk_create(model_child_objects)
+
+    def _log_copies(self, items, context):
+        log_entries = []
+        for item in items:
+            log_entries.append(
+                log_registry.build_log_entry(
+                    item.copy,
+                    "wagtail.create",
+                    user=self.user or item.copy.owner,
+                    content_changed=True,
+                )
+            )
+
+            if self.log_action:
+                parent_path = item.page.path[: -item.page.steplen]
+                log_entries.append(
+                    log_registry.build_log_entry(
+                        item.copy,
+                        self.log_action,
+                        user=self.user,
+                        data=self._get_log_data(
+                            item.page,
+                            item.copy,
+                            source=context["sources"][parent_path],
+                            destination=context["copies"][parent_path]["log_summary"],
+                        ),
+                    )
+                )
+                if item.copy.live and self.keep_live:
+                    log_entries.append(
+                        log_registry.build_log_entry(
+                            item.copy,
+                            "wagtail.publish",
+                            user=self.user,
+                            revision=item.latest_revision,
+                        )
+                    )
+
+        log_entries_by_model = defaultdict(list)
+        for log_entry in log_entries:
+            if log_entry is not None:
+                log_entries_by_model[type(log_entry)].append(log_entry)
+        for model, model_log_entries in log_entries_by_model.items():
+            model.objects.bulk_create(model_log_entries)
+
     def execute(self, skip_permission_checks=False):
         self.check(skip_permission_checks=skip_permission_checks)
 
+        if self._can_copy_in_bulk() and self.recursive:
+            with transaction.atomic():
+                return self._copy_page(
+                    self.page,
+                    to=self.to,
+                    update_attrs=self.update_attrs,
+                    exclude_fields=self.exclude_fields,
+                )
+
         return self._copy_page(
             self.page,
             to=self.to,
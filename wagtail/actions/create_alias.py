@@ -117,6 +117,8 @@ class CreatePageAliasAction:
             "path",
             "depth",
             "numchild",
+            "descendant_count",
+            "live_descendant_count",
             "url_path",
             "path",
             "index_entries",
@@ -27,7 +27,12 @@ class DeletePageAction:
             )
 
     def _delete_page(self, page, *args, **kwargs):
-        from wagtail.models import Page
+        from wagtail.models import (
+            Page,
+            descendant_counts_enabled,
+            get_ancestor_paths,
+            update_descendant_counts,
+        )
 
         # Ensure that deletion always happens on an instance of Page, not a specific subclass. This
         # works around a bug in treebeard <= 3.0 where calling SpecificPage.delete() fails to delete
@@ -37,6 +42,21 @@ class DeletePageAction:
                 self.log_deletion(child)
             self.log_deletion(page.specific)
 
+            if descendant_counts_enabled():
+                # Use the stored values, as the counts on the instance may be out of date
+                path, descendant_count, live_descendant_count, live = (
+                    Page.objects.filter(id=page.id)
+                    .values_list(
+                        "path", "descendant_count", "live_descendant_count", "live"
+                    )
+                    .get()
+                )
+                update_descendant_counts(
+                    Page.objects.filter(path__in=get_ancestor_paths(path)),
+                    -(descendant_count + 1),
+                    -(live_descendant_count + int(live)),
+                )
+
             # this is a Page instance, so carry on as we were
             return super(Page, page).delete(*args, **kwargs)
         else:
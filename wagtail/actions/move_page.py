@@ -1,11 +1,20 @@
 import logging
+from collections import defaultdict
+from functools import reduce
+from operator import or_
 
-from django.core.exceptions import PermissionDenied
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Concat, Substr
+from django.utils.translation import gettext_lazy as _
+from treebeard.exceptions import InvalidMoveToDescendant, PathOverflow
 from treebeard.mp_tree import MP_MoveHandler
 
 from wagtail.log_actions import log
-from wagtail.signals import post_page_move, pre_page_move
+from wagtail.log_actions import registry as log_registry
+from wagtail.signals import post_bulk_page_move, post_page_move, pre_page_move
 
 logger = logging.getLogger("wagtail")
 
@@ -33,12 +42,20 @@ class MovePageAction:
                 )
 
     def _move_page(self, page, target, parent_after):
-        from wagtail.models import Page
+        from wagtail.models import (
+            Page,
+            descendant_counts_enabled,
+            get_ancestor_paths,
+            update_descendant_counts,
+        )
 
         # Determine old and new url_paths
         # Fetching new object to avoid affecting `page`
         parent_before = page.get_parent()
         old_page = Page.objects.get(id=page.id)
+        update_counts = (
+            descendant_counts_enabled() and parent_before.id != parent_after.id
+        )
         old_url_path = old_page.url_path
         new_url_path = old_page.set_url_path(parent=parent_after)
         url_path_changed = old_url_path != new_url_path
@@ -55,12 +72,41 @@ class MovePageAction:
 
         # Only commit when all descendants are properly updated
         with transaction.atomic():
+            if update_counts:
+                # Moving the page can shift the paths of other pages, so the ancestors are
+                # identified by id
+                old_ancestor_ids = set(
+                    Page.objects.filter(
+                        path__in=get_ancestor_paths(old_page.path)
+                    ).values_list("id", flat=True)
+                )
+
             # Allow treebeard to update `path` values
             MP_MoveHandler(page, target, self.pos).process()
 
             # Treebeard's move method doesn't actually update the in-memory instance,
             # so we need to work with a freshly loaded one now
             new_page = Page.objects.get(id=page.id)
+
+            if update_counts:
+                new_ancestor_ids = set(
+                    Page.objects.filter(
+                        path__in=get_ancestor_paths(new_page.path)
+                    ).values_list("id", flat=True)
+                )
+                count = old_page.descendant_count + 1
+                live_count = old_page.live_descendant_count + int(old_page.live)
+                update_descendant_counts(
+                    Page.objects.filter(id__in=old_ancestor_ids - new_ancestor_ids),
+                    -count,
+                    -live_count,
+                )
+                update_descendant_counts(
+                    Page.objects.filter(id__in=new_ancestor_ids - old_ancestor_ids),
+                    count,
+                    live_count,
+                )
+
             new_page.url_path = new_url_path
             new_page.save()
 
@@ -105,3 +151,304 @@ class MovePageAction:
         self.check(parent_after, skip_permission_checks=skip_permission_checks)
 
         return self._move_page(self.page, self.target, parent_after)
+
+
+class BulkMovePageAction:
+    """
+    Moves several pages to become the last children of ``target``, in the given order.
+
+    Rather than moving the pages one at a time, the ``path``, ``depth`` and ``url_path`` of
+    the moved pages and their descendants are rewritten together, in one ``UPDATE`` per
+    ``batch_size`` moved pages. ``pre_page_move`` and ``post_page_move`` are sent for each page,
+    followed by a single ``post_bulk_page_move`` signal, which the search index and front-end
+    cache use to update all of the moved pages at once.
+    """
+
+    batch_size = 100
+
+    def __init__(self, pages, target, user=None):
+        self.pages = list({page.id: page for page in pages}.values())
+        self.target = target
+        self.user = user
+
+    def check(self, skip_permission_checks=False):
+        from wagtail.models import Page
+
+        for page in self.pages:
+            if self.target.path.startswith(page.path):
+                raise InvalidMoveToDescendant(_("Can't move node to a descendant."))
+
+        if self.user and not skip_permission_checks:
+            for page in self.pages:
+                if not page.permissions_for_user(self.user).can_move_to(self.target):
+                    raise MovePagePermissionError(
+                        "You do not have permission to move the page to the target specified."
+                    )
+
+        # All of the pages become children of the target, so their slugs must not clash with
+        # each other or with the target's other children
+        slugs = [page.slug for page in self.pages]
+        if len(set(slugs)) < len(slugs) or (
+            Page.objects.child_of(self.target)
+            .exclude(id__in=[page.id for page in self.pages])
+            .filter(slug__in=slugs)
+            .exists()
+        ):
+            raise ValidationError({"slug": _("This slug is already in use")})
+
+    def _update_descendant_counts(self, moves, target):
+        from wagtail.models import Page, get_ancestor_paths, update_descendant_counts
+
+        ancestor_ids = dict(
+            Page.objects.filter(
+                path__in={
+                    ancestor_path
+                    for move in moves
+                    for ancestor_path in get_ancestor_paths(move["path"])
+                }
+            ).values_list("path", "id")
+        )
+        new_ancestor_ids = set(
+            Page.objects.ancestor_of(target, inclusive=True).values_list(
+                "id", flat=True
+            )
+        )
+        moved_ids = {move["id"]: move for move in moves}
+        deltas = defaultdict(lambda: [0, 0])
+
+        # Apply the moves as if they were made one at a time, deepest first, so that pages
+        # moved out of a section that is itself being moved are only counted once. (The
+        # target's ancestors can't be among the moved pages)
+        for move in sorted(moves, key=lambda move: -move["depth"]):
+            count = move["descendant_count"] + 1
+            live_count = move["live_descendant_count"] + int(move["live"])
+            old_ancestor_ids = {
+                ancestor_ids[path] for path in get_ancestor_paths(move["path"])
+            }
+            for page_id in old_ancestor_ids - new_ancestor_ids:
+                if page_id in moved_ids:
+                    moved_ids[page_id]["descendant_count"] -= count
+                    moved_ids[page_id]["live_descendant_count"] -= live_count
+                deltas[page_id][0] -= count
+                deltas[page_id][1] -= live_count
+            for page_id in new_ancestor_ids - old_ancestor_ids:
+                deltas[page_id][0] += count
+                deltas[page_id][1] += live_count
+
+        page_ids_by_delta = defaultdict(list)
+        for page_id, delta in deltas.items():
+            if delta != [0, 0]:
+                page_ids_by_delta[tuple(delta)].append(page_id)
+        for (count, live_count), page_ids in page_ids_by_delta.items():
+            update_descendant_counts(
+                Page.objects.filter(id__in=page_ids), count, live_count
+            )
+
+    def _clear_site_root_paths_cache(self, moves):
+        """
+        As Page.save() would, clears the cached site root paths if any site root page (or a
+        translation of one) was among the moved pages or their descendants
+        """
+        from wagtail.models import Page, Site
+
+        if (
+            Page.objects.filter(
+                reduce(or_, (Q(path__startswith=move["new_path"]) for move in moves))
+            )
+            .filter(
+                translation_key__in=Site.objects.values("root_page__translation_key")
+            )
+            .exists()
+        ):
+            cache.delete("wagtail_site_root_paths")
+
+    def _rewrite_paths(self, moves):
+        from wagtail.models import Page
+
+        # Deepest pages first, so that pages being moved out of a section that is itself being
+        # moved are rewritten by their own move rather than their ancestor's
+        moves = sorted(moves, key=lambda move: -move["depth"])
+        for i in range(0, len(moves), self.batch_size):
+            batch = moves[i : i + self.batch_size]
+            whens = {"path": [], "depth": [], "url_path": []}
+            for move in batch:
+                condition = Q(path__startswith=move["path"])
+                whens["path"].append(
+                    When(
+                        condition,
+                        then=Concat(
+                            Value(move["new_path"]),
+                            Substr("path", len(move["path"]) + 1),
+                        ),
+                    )
+                )
+                whens["depth"].append(
+                    When(
+                        condition, then=F("depth") + (move["new_depth"] - move["depth"])
+                    )
+                )
+                whens["url_path"].append(
+                    When(
+                        condition,
+                        then=Concat(
+                            Value(move["new_url_path"]),
+                            Substr("url_path", len(move["url_path"]) + 1),
+                        ),
+                    )
+                )
+
+            Page.objects.filter(
+                reduce(or_, (Q(path__startswith=move["path"]) for move in batch))
+            ).update(
+                **{
+                    field_name: Case(
+                        *field_whens,
+                        default=F(field_name),
+                        output_field=Page._meta.get_field(field_name),
+                    )
+                    for field_name, field_whens in whens.items()
+                }
+            )
+
+    def _move_pages(self):
+        from wagtail.models import Page, descendant_counts_enabled
+
+        page_ids = [page.id for page in self.pages]
+
+        with transaction.atomic():
+            # Work with fresh values, as the in-memory instances may be out of date
+            target = Page.objects.get(id=self.target.id)
+            moves = list(
+                Page.objects.filter(id__in=page_ids).values(
+                    "id",
+                    "path",
+                    "depth",
+                    "url_path",
+                    "slug",
+                    "live",
+                    "descendant_count",
+                    "live_descendant_count",
+                )
+            )
+            positions = {page_id: i for i, page_id in enumerate(page_ids)}
+            moves.sort(key=lambda move: positions[move["id"]])
+            parents_before = Page.objects.in_bulk(
+                [move["path"][: -Page.steplen] for move in moves], field_name="path"
+            )
+
+            last_child = target.get_last_child()
+            last_position = last_child._get_lastpos_in_path() if last_child else 0
+            if last_position + len(moves) >= len(Page.alphabet) ** Page.steplen:
+                raise PathOverflow(_("Path Overflow from: '%s'" % target.path))
+
+            for position, move in enumerate(moves, start=last_position + 1):
+                move["parent_before"] = parents_before[move["path"][: -Page.steplen]]
+                move["new_path"] = Page._get_path(
+                    target.path, target.depth + 1, position
+                )
+                move["new_depth"] = target.depth + 1
+                move["new_url_path"] = target.url_path + move["slug"] + "/"
+
+            # Emit pre_page_move signals
+            pages = {page.id: page for page in self.pages}
+            for move in moves:
+                page = pages[move["id"]]
+                pre_page_move.send(
+                    sender=page.specific_class or page.__class__,
+                    instance=page,
+                    parent_page_before=move["parent_before"],
+                    parent_page_after=target,
+                    url_path_before=move["url_path"],
+                    url_path_after=move["new_url_path"],
+                )
+
+            if descendant_counts_enabled():
+                self._update_descendant_counts(moves, target)
+
+            self._rewrite_paths(moves)
+
+            numchild_deltas = defaultdict(int)
+            for move in moves:
+                numchild_deltas[move["parent_before"].id] -= 1
+            numchild_deltas[target.id] += len(moves)
+            Page.objects.filter(id__in=numchild_deltas).update(
+                numchild=Case(
+                    *[
+                        When(id=page_id, then=F("numchild") + delta)
+                        for page_id, delta in numchild_deltas.items()
+                    ],
+                    default=F("numchild"),
+                )
+            )
+
+        self._clear_site_root_paths_cache(moves)
+
+        new_pages = {
+            page.id: page for page in Page.objects.filter(id__in=page_ids).specific()
+        }
+
+        # Emit post_page_move signals
+        for move in moves:
+            new_page = new_pages[move["id"]]
+            post_page_move.send(
+                sender=type(new_page),
+                instance=new_page,
+                parent_page_before=move["parent_before"],
+                parent_page_after=target,
+                url_path_before=move["url_path"],
+                url_path_after=move["new_url_path"],
+            )
+
+        post_bulk_page_move.send(
+            sender=Page,
+            instances=[new_pages[move["id"]] for move in moves],
+            parent_page_after=target,
+            url_paths_before={move["id"]: move["url_path"] for move in moves},
+        )
+
+        # Log
+        destination = {
+            "id": target.id,
+            "title": target.specific_deferred.get_admin_display_title(),
+        }
+        log_entries = []
+        for move in moves:
+            new_page = new_pages[move["id"]]
+            url_path_changed = move["url_path"] != move["new_url_path"]
+            log_entries.append(
+                log_registry.build_log_entry(
+                    new_page,
+                    "wagtail.move" if url_path_changed else "wagtail.reorder",
+                    user=self.user,
+                    data={
+                        "source": {
+                            "id": move["parent_before"].id,
+                            "title": move[
+                                "parent_before"
+                            ].specific_deferred.get_admin_display_title(),
+                        },
+                        "destination": destination,
+                    },
+                )
+            )
+            logger.info(
+                'Page moved: "%s" id=%d path=%s',
+                new_page.title,
+                new_page.id,
+                move["new_url_path"],
+            )
+
+        log_entries_by_model = defaultdict(list)
+        for log_entry in log_entries:
+            if log_entry is not None:
+                log_entries_by_model[type(log_entry)].append(log_entry)
+        for model, model_log_entries in log_entries_by_model.items():
+            model.objects.bulk_create(model_log_entries)
+
+    def execute(self, skip_permission_checks=False):
+        if not self.pages:
+            return
+
+        self.check(skip_permission_checks=skip_permission_checks)
+
+        return self._move_pages()
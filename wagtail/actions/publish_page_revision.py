@@ -150,7 +150,9 @@ class PublishPageRevisionAction:
             )
 
             # Update alias pages
-            page.update_aliases(revision=revision, user=user, _content=revision.content)
+            page.update_aliases(
+                revision=revision, user=user, _content=revision.get_content()
+            )
 
             if log_action:
                 data = None
@@ -1,6 +1,8 @@
 import difflib
+import re
 
 from bs4 import BeautifulSoup
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.utils.encoding import force_str
@@ -211,7 +213,32 @@ class StructBlockComparison(BlockComparison):
 
 
 class StreamBlockComparison(BlockComparison):
+    def get_unchanged_block_ids(self):
+        """
+        Returns the IDs of the blocks whose raw values are identical in both versions, so that
+        they can be skipped without converting and comparing their values
+        """
+        if not isinstance(self.val_a, blocks.StreamValue) or not isinstance(
+            self.val_b, blocks.StreamValue
+        ):
+            return set()
+
+        # Only use the raw data of blocks that have not been converted to native values yet (as
+        # is the case for values loaded from revisions), like StreamValue.__eq__ does
+        a_raw_values = {
+            item.get("id"): item for item in self.val_a._raw_data if item is not None
+        }
+        return {
+            item["id"]
+            for item in self.val_b._raw_data
+            if item is not None
+            and item.get("id")
+            and a_raw_values.get(item["id"]) == item
+        }
+
     def get_block_comparisons(self):
+        unchanged_ids = self.get_unchanged_block_ids()
+
         a_blocks = list(self.val_a) or []
         b_blocks = list(self.val_b) or []
 
@@ -224,7 +251,13 @@ class StreamBlockComparison(BlockComparison):
         for block in b_blocks:
             comparison_class = get_comparison_class_for_block(block.block)
 
-            if block.id in a_blocks_by_id:
+            if block.id in unchanged_ids:
+                # Unchanged block - compare the value with itself, so that has_changed is
+                # quick to return False
+                comparisons.append(
+                    comparison_class(block.block, True, True, block.value, block.value)
+                )
+            elif block.id in a_blocks_by_id:
                 # Changed/existing block
                 comparisons.append(
                     comparison_class(
@@ -702,80 +735,88 @@ class TextDiff:
         return mark_safe(self.separator.join(html))
 
 
+# Runs of letters and digits are grouped into a single token, so that words are not broken up in
+# the diff; punctuation, whitespace etc. become separate tokens
+TOKEN_RE = re.compile(r"[^\W_]+|.", re.DOTALL)
+
+
+def get_diff_max_tokens():
+    return getattr(settings, "WAGTAILADMIN_COMPARE_MAX_TOKENS", 10000)
+
+
+def tokenise(text):
+    return TOKEN_RE.findall(text or "")
+
+
+def is_junk_token(token):
+    # Short tokens are not used to find matching runs of text, to keep the diff readable
+    return len(token) <= 4
+
+
 def diff_text(a, b):
     """
     Performs a diffing algorithm on two pieces of text. Returns
     a string of HTML containing the content of both texts with
     <span> tags inserted indicating where the differences are.
-    """
 
-    def tokenise(text):
-        """
-        Tokenises a string by splitting it into individual characters
-        and grouping the alphanumeric ones together.
-
-        This means that punctuation, whitespace, CJK characters, etc
-        become separate tokens and words/numbers are merged together
-        to form bigger tokens.
+    Any text that the two have in common at the start and end is not diffed. If what remains of
+    both texts is longer than WAGTAILADMIN_COMPARE_MAX_TOKENS tokens, it is shown as a single
+    deletion and addition instead of being diffed. SequenceMatcher takes quadratic time in the
+    worst case, so this cut-off is what bounds the time taken to diff a large change.
+    """
+    a_tok = tokenise(a)
+    b_tok = tokenise(b)
 
-        This makes the output of the diff easier to read as words are
-        not broken up.
-        """
-        tokens = []
-        current_token = ""
+    # Trim the common prefix and suffix
+    prefix = 0
+    max_prefix = min(len(a_tok), len(b_tok))
+    while prefix < max_prefix and a_tok[prefix] == b_tok[prefix]:
+        prefix += 1
 
-        for c in text or "":
-            if c.isalnum():
-                current_token += c
-            else:
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
+    suffix = 0
+    max_suffix = max_prefix - prefix
+    while suffix < max_suffix and a_tok[-1 - suffix] == b_tok[-1 - suffix]:
+        suffix += 1
 
-                tokens.append(c)
+    # Like SequenceMatcher, only match text that includes at least one token that isn't junk
+    if all(is_junk_token(token) for token in a_tok[:prefix]):
+        prefix = 0
+    if all(is_junk_token(token) for token in a_tok[len(a_tok) - suffix :]):
+        suffix = 0
 
-        if current_token:
-            tokens.append(current_token)
+    a_mid = a_tok[prefix : len(a_tok) - suffix]
+    b_mid = b_tok[prefix : len(b_tok) - suffix]
 
-        return tokens
+    changes = []
+    if prefix:
+        changes.append(("equal", "".join(a_tok[:prefix])))
 
-    a_tok = tokenise(a)
-    b_tok = tokenise(b)
-    sm = difflib.SequenceMatcher(lambda t: len(t) <= 4, a_tok, b_tok)
+    if len(a_mid) + len(b_mid) > get_diff_max_tokens():
+        changes.append(("deletion", "".join(a_mid)))
+        changes.append(("addition", "".join(b_mid)))
+    else:
+        sm = difflib.SequenceMatcher(is_junk_token, a_mid, b_mid)
 
-    changes = []
+        for op, i1, i2, j1, j2 in sm.get_opcodes():
+            if op in ("replace", "delete"):
+                changes.append(("deletion", "".join(a_mid[i1:i2])))
+            if op in ("replace", "insert"):
+                changes.append(("addition", "".join(b_mid[j1:j2])))
+            if op == "equal":
+                changes.append(("equal", "".join(a_mid[i1:i2])))
 
-    for op, i1, i2, j1, j2 in sm.get_opcodes():
-        if op == "replace":
-            for token in a_tok[i1:i2]:
-                changes.append(("deletion", token))
-            for token in b_tok[j1:j2]:
-                changes.append(("addition", token))
-        elif op == "delete":
-            for token in a_tok[i1:i2]:
-                changes.append(("deletion", token))
-        elif op == "insert":
-            for token in b_tok[j1:j2]:
-                changes.append(("addition", token))
-        elif op == "equal":
-            for token in a_tok[i1:i2]:
-                changes.append(("equal", token))
+    if suffix:
+        changes.append(("equal", "".join(a_tok[len(a_tok) - suffix :])))
 
     # Merge adjacent changes which have the same type. This just cleans up the HTML a bit
     merged_changes = []
-    current_value = []
-    current_change_type = None
     for change_type, value in changes:
-        if change_type != current_change_type:
-            if current_change_type is not None:
-                merged_changes.append((current_change_type, "".join(current_value)))
-                current_value = []
-
-            current_change_type = change_type
+        if not value:
+            continue
 
-        current_value.append(value)
-
-    if current_value:
-        merged_changes.append((current_change_type, "".join(current_value)))
+        if merged_changes and merged_changes[-1][0] == change_type:
+            merged_changes[-1] = (change_type, merged_changes[-1][1] + value)
+        else:
+            merged_changes.append((change_type, value))
 
     return TextDiff(merged_changes)
@@ -0,0 +1,156 @@
+"""
+Counts of querysets for admin summaries and listings. Counts can be cached for a short time
+(``WAGTAILADMIN_CACHED_COUNTS``), and on PostgreSQL, counts of whole tables can be estimated from
+the table statistics when they are large (``WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD``), so that they
+don't need a full scan of the table on every request.
+"""
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.utils.functional import cached_property
+
+COUNTS_VERSION_KEY_PREFIX = "wagtail-counts-version-"
+
+
+def cached_counts_enabled():
+    return getattr(settings, "WAGTAILADMIN_CACHED_COUNTS", False)
+
+
+def get_counts_cache():
+    try:
+        return caches["counts"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_counts_cache_timeout():
+    return getattr(settings, "WAGTAILADMIN_CACHED_COUNTS_TIMEOUT", 60)
+
+
+def get_estimated_count_threshold():
+    return getattr(settings, "WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD", None)
+
+
+def get_counts_version(model):
+    cache = get_counts_cache()
+    key = COUNTS_VERSION_KEY_PREFIX + model._meta.label_lower
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, None):
+            # Created by another worker in the meantime
+            version = cache.get(key, version)
+    return version
+
+
+def get_count_cache_key(queryset):
+    sql, params = queryset.query.sql_with_params()
+    query_hash = hashlib.md5(repr((queryset.db, sql, params)).encode()).hexdigest()
+    return "wagtail-counts-{}-{}-{}".format(
+        queryset.model._meta.label_lower,
+        get_counts_version(queryset.model),
+        query_hash,
+    )
+
+
+def invalidate_counts(model):
+    """
+    Discards the cached counts of querysets of the given model (and of the models it inherits
+    from, such as Page for page types)
+    """
+    if cached_counts_enabled():
+        cache = get_counts_cache()
+        cache.delete_many(
+            [
+                COUNTS_VERSION_KEY_PREFIX + model._meta.label_lower
+                for model in [model] + model._meta.get_parent_list()
+            ]
+        )
+
+
+def is_whole_table_query(queryset):
+    """
+    Returns True if the queryset selects every row of its model's table
+    """
+    query = queryset.query
+    return (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.group_by is None
+        and query.low_mark == 0
+        and query.high_mark is None
+    )
+
+
+def get_estimated_count(queryset):
+    """
+    Returns the number of rows in the queryset's table according to the PostgreSQL table
+    statistics, or None if the table hasn't been analyzed yet
+    """
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def get_count(queryset):
+    """
+    Returns the number of items in the queryset, from the cache if WAGTAILADMIN_CACHED_COUNTS is
+    enabled. If WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD is set and the database is PostgreSQL, the
+    query planner's estimate is used instead of an exact count when it is above the threshold.
+    """
+    if cached_counts_enabled():
+        try:
+            cache_key = get_count_cache_key(queryset)
+        except EmptyResultSet:
+            # The queryset can't match any rows (e.g. .none()), so has no SQL to cache it by
+            return 0
+
+        cache = get_counts_cache()
+        count = cache.get(cache_key)
+        if count is None:
+            count = get_uncached_count(queryset)
+            cache.set(cache_key, count, get_counts_cache_timeout())
+        return count
+
+    return get_uncached_count(queryset)
+
+
+def get_uncached_count(queryset):
+    threshold = get_estimated_count_threshold()
+    if (
+        threshold is not None
+        and connections[queryset.db].vendor == "postgresql"
+        and is_whole_table_query(queryset)
+    ):
+        estimate = get_estimated_count(queryset)
+        if estimate is not None and estimate >= threshold:
+            return estimate
+
+    return queryset.count()
+
+
+class CachedCountPaginator(Paginator):
+    """
+    A Paginator that counts querysets with get_count, so that the count can be cached or
+    estimated
+    """
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, models.QuerySet):
+            return get_count(self.object_list)
+        return super().count
@@ -0,0 +1,81 @@
+"""
+Caching of the items listed by the dashboard panels. When ``WAGTAILADMIN_CACHED_DASHBOARD`` is
+enabled, the ids of the items that a panel lists for a user are cached for a short time
+(``WAGTAILADMIN_CACHED_DASHBOARD_TIMEOUT``), so that the queries that find them don't need to run
+on every visit to the dashboard.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+
+MODERATION_VERSION_KEY = "wagtail-dashboard-moderation-version"
+
+
+def cached_dashboard_enabled():
+    return getattr(settings, "WAGTAILADMIN_CACHED_DASHBOARD", False)
+
+
+def get_dashboard_cache():
+    try:
+        return caches["dashboard"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_dashboard_cache_timeout():
+    return getattr(settings, "WAGTAILADMIN_CACHED_DASHBOARD_TIMEOUT", 30)
+
+
+def get_recent_edits_limit():
+    return getattr(settings, "WAGTAILADMIN_RECENT_EDITS_LIMIT", 5)
+
+
+def get_moderation_version():
+    cache = get_dashboard_cache()
+    version = cache.get(MODERATION_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(MODERATION_VERSION_KEY, version, None):
+            # Created by another worker in the meantime
+            version = cache.get(MODERATION_VERSION_KEY, version)
+    return version
+
+
+def get_recent_edits_cache_key(user_pk):
+    return "wagtail-dashboard-recent-edits-{}-{}".format(
+        user_pk, get_recent_edits_limit()
+    )
+
+
+def get_moderation_cache_key(name, user_pk):
+    return "wagtail-dashboard-{}-{}-{}".format(name, user_pk, get_moderation_version())
+
+
+def get_cached_ids(cache_key, get_ids):
+    """
+    Returns the list of ids cached under cache_key, or if there isn't one, calls get_ids to find
+    them and caches the result
+    """
+    cache = get_dashboard_cache()
+    ids = cache.get(cache_key)
+    if ids is None:
+        ids = list(get_ids())
+        cache.set(cache_key, ids, get_dashboard_cache_timeout())
+    return ids
+
+
+def invalidate_recent_edits(user_pk):
+    """
+    Discards the cached list of the given user's recent edits
+    """
+    if cached_dashboard_enabled() and user_pk is not None:
+        get_dashboard_cache().delete(get_recent_edits_cache_key(user_pk))
+
+
+def invalidate_moderation():
+    """
+    Discards the cached lists of the items awaiting moderation, for all users
+    """
+    if cached_dashboard_enabled():
+        get_dashboard_cache().delete(MODERATION_VERSION_KEY)
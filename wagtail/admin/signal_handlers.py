@@ -1,11 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.admin.counts import invalidate_counts
+from wagtail.admin.dashboard import invalidate_moderation, invalidate_recent_edits
 from wagtail.admin.mail import (
     GroupApprovalTaskStateSubmissionEmailNotifier,
     WorkflowStateApprovalEmailNotifier,
     WorkflowStateRejectionEmailNotifier,
     WorkflowStateSubmissionEmailNotifier,
 )
-from wagtail.models import TaskState, WorkflowState
+from wagtail.models import Revision, TaskState, WorkflowState
 from wagtail.signals import (
+    post_page_move,
     task_submitted,
     workflow_approved,
     workflow_rejected,
@@ -18,7 +23,50 @@ workflow_approval_email_notifier = WorkflowStateApprovalEmailNotifier()
 workflow_rejection_email_notifier = WorkflowStateRejectionEmailNotifier()
 
 
+def invalidate_counts_signal_handler(sender, **kwargs):
+    invalidate_counts(sender)
+
+
+def invalidate_dashboard_revision_signal_handler(instance, **kwargs):
+    invalidate_recent_edits(instance.user_id)
+    invalidate_moderation()
+
+
+def invalidate_dashboard_moderation_signal_handler(**kwargs):
+    invalidate_moderation()
+
+
 def register_signal_handlers():
+    post_save.connect(
+        invalidate_counts_signal_handler, dispatch_uid="invalidate_admin_counts"
+    )
+    post_delete.connect(
+        invalidate_counts_signal_handler, dispatch_uid="invalidate_admin_counts"
+    )
+    # Moving a page changes the number of pages within each section
+    post_page_move.connect(
+        invalidate_counts_signal_handler, dispatch_uid="invalidate_admin_counts"
+    )
+
+    # Discard the dashboard's cached lists of recent edits and items awaiting moderation
+    for signal in [post_save, post_delete]:
+        signal.connect(
+            invalidate_dashboard_revision_signal_handler,
+            sender=Revision,
+            dispatch_uid="invalidate_dashboard_revision",
+        )
+        for model in [TaskState, WorkflowState]:
+            signal.connect(
+                invalidate_dashboard_moderation_signal_handler,
+                sender=model,
+                dispatch_uid="invalidate_dashboard_moderation",
+            )
+    # Moving a page can change who is able to moderate it
+    post_page_move.connect(
+        invalidate_dashboard_moderation_signal_handler,
+        dispatch_uid="invalidate_dashboard_moderation",
+    )
+
     task_submitted.connect(
         task_submission_email_notifier,
         sender=TaskState,
@@ -2,6 +2,7 @@ from django.forms import Media
 
 from wagtail import hooks
 from wagtail.admin.auth import user_has_any_page_permission
+from wagtail.admin.counts import get_count
 from wagtail.admin.navigation import get_site_for_user
 from wagtail.admin.ui.components import Component
 from wagtail.models import Page, Site
@@ -27,7 +28,12 @@ class PagesSummaryItem(SummaryItem):
         site_name = site_details["site_name"]
 
         if root_page:
-            page_count = Page.objects.descendant_of(root_page, inclusive=True).count()
+            if root_page.is_root():
+                # Count the whole table, which can be estimated on large sites
+                pages = Page.objects.all()
+            else:
+                pages = Page.objects.descendant_of(root_page, inclusive=True)
+            page_count = get_count(pages)
 
             if root_page.is_root():
                 # If the root page the user has access to is the Wagtail root,
@@ -1,9 +1,20 @@
+import datetime
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core import management
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 
-from wagtail.admin.views.home import RecentEditsPanel
-from wagtail.models import Page
+from wagtail.admin.counts import get_counts_version
+from wagtail.admin.dashboard import get_moderation_version
+from wagtail.admin.views.home import (
+    PagesForModerationPanel,
+    RecentEditsPanel,
+    WorkflowPagesToModeratePanel,
+)
+from wagtail.models import Page, Workflow
 from wagtail.test.testapp.models import SimplePage
 from wagtail.test.utils import WagtailTestUtils
 
@@ -128,3 +139,143 @@ class TestRecentEditsQueryCount(TestCase, WagtailTestUtils):
         # check that the panel is still actually returning results
         html = panel.render_html(parent_context)
         self.assertIn("Ameristralia Day", html)
+
+    @override_settings(WAGTAILADMIN_RECENT_EDITS_LIMIT=3)
+    def test_latest_revision_of_each_page(self):
+        pages = Page.objects.filter(id__in=[4, 5, 6, 9]).specific().order_by("id")
+        for page in pages:
+            page.save_revision(user=self.bob)
+        # Editing a page again moves it to the top, and it is only listed once
+        pages[0].save_revision(user=self.bob)
+        latest_revision = pages[0].save_revision(user=self.bob)
+
+        self.client.user = self.bob
+        last_edits = RecentEditsPanel().get_context_data({"request": self.client})[
+            "last_edits"
+        ]
+
+        self.assertEqual(
+            [page.id for revision, page in last_edits],
+            [pages[0].id, pages[3].id, pages[2].id],
+        )
+        self.assertEqual(last_edits[0][0], latest_revision)
+
+    @override_settings(WAGTAILADMIN_RECENT_EDITS_LIMIT=3)
+    def test_many_revisions_of_few_pages(self):
+        pages = Page.objects.filter(id__in=[4, 5, 6]).specific().order_by("id")
+        for page in pages:
+            page.save_revision(user=self.bob)
+        for i in range(5):
+            pages[1].save_revision(user=self.bob)
+        latest_revision = pages[2].save_revision(user=self.bob)
+
+        self.client.user = self.bob
+        panel = RecentEditsPanel()
+        panel.revisions_scanned_per_edit = 1
+        with self.assertNumQueries(3 + 2):
+            last_edits = panel.get_context_data({"request": self.client})["last_edits"]
+
+        # Only the first few revisions are read before the latest revision of
+        # each page is found by grouping
+        self.assertEqual(
+            [page.id for revision, page in last_edits],
+            [pages[2].id, pages[1].id, pages[0].id],
+        )
+        self.assertEqual(last_edits[0][0], latest_revision)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+    WAGTAILADMIN_CACHED_DASHBOARD=True,
+)
+class TestCachedDashboardPanels(TestCase, WagtailTestUtils):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.superuser = self.create_superuser(username="admin", password="password")
+        self.page = Page.objects.get(url_path="/home/events/christmas/").specific
+        self.client.user = self.superuser
+
+    def get_context_data(self, panel):
+        return panel.get_context_data({"request": self.client, "csrf_token": ""})
+
+    def test_recent_edits(self):
+        self.page.save_revision(user=self.superuser)
+        self.assertEqual(
+            len(self.get_context_data(RecentEditsPanel())["last_edits"]), 1
+        )
+
+        # Only the revisions and pages are fetched
+        with self.assertNumQueries(3):
+            self.get_context_data(RecentEditsPanel())
+
+        # Saving a revision discards the user's cached edits
+        other_page = Page.objects.get(url_path="/home/events/final-event/").specific
+        other_page.save_revision(user=self.superuser)
+        last_edits = self.get_context_data(RecentEditsPanel())["last_edits"]
+        self.assertEqual(
+            [page.id for revision, page in last_edits],
+            [other_page.id, self.page.id],
+        )
+
+    def test_pages_for_moderation(self):
+        self.assertFalse(
+            self.get_context_data(PagesForModerationPanel())[
+                "page_revisions_for_moderation"
+            ]
+        )
+
+        # Submitting a revision discards the cached lists
+        revision = self.page.save_revision(
+            user=self.superuser, submitted_for_moderation=True
+        )
+        revisions = self.get_context_data(PagesForModerationPanel())[
+            "page_revisions_for_moderation"
+        ]
+        self.assertEqual(list(revisions), [revision])
+
+        # Revisions that are no longer submitted are left out, even if still cached
+        Revision = type(revision)
+        Revision.objects.filter(pk=revision.pk).update(submitted_for_moderation=False)
+        revisions = self.get_context_data(PagesForModerationPanel())[
+            "page_revisions_for_moderation"
+        ]
+        self.assertEqual(list(revisions), [])
+
+    def test_workflow_pages_to_moderate(self):
+        self.assertEqual(
+            self.get_context_data(WorkflowPagesToModeratePanel())["states"], []
+        )
+
+        # Starting a workflow discards the cached lists
+        self.page.save_revision(user=self.superuser)
+        Workflow.objects.get(name="Moderators approval").start(
+            self.page, self.superuser
+        )
+        states = self.get_context_data(WorkflowPagesToModeratePanel())["states"]
+        self.assertEqual(len(states), 1)
+        self.assertEqual(states[0][0].page_revision.object_id, str(self.page.id))
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_expired_revisions_invalidate_cached_lists_and_counts(self):
+        revision = self.page.save_revision(
+            user=self.superuser, submitted_for_moderation=True
+        )
+        Revision = type(revision)
+        Revision.objects.filter(pk=revision.pk).update(
+            expire_at=timezone.now() - datetime.timedelta(days=1)
+        )
+        version = get_moderation_version()
+        counts_version = get_counts_version(Revision)
+
+        # Expired revisions are dropped from moderation with a bulk update
+        management.call_command("publish_scheduled_pages")
+
+        self.assertFalse(Revision.objects.get(pk=revision.pk).submitted_for_moderation)
+        self.assertNotEqual(get_moderation_version(), version)
+        self.assertNotEqual(get_counts_version(Revision), counts_version)
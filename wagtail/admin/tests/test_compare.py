@@ -1,6 +1,7 @@
 from functools import partial
+from unittest import mock
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils.safestring import SafeString
 
 from wagtail.admin import compare
@@ -783,6 +784,39 @@ class TestStreamFieldComparison(TestCase):
         self.assertIsInstance(result, SafeString)
         self.assertTrue(comparison.has_changed())
 
+    def test_unchanged_blocks_are_not_diffed(self):
+        field = StreamPage._meta.get_field("body")
+
+        def get_stream_value(texts):
+            # Lazy StreamValues hold the raw data, as when loaded from a revision
+            return StreamValue(
+                field.stream_block,
+                [
+                    {"type": "text", "value": text, "id": str(i)}
+                    for i, text in enumerate(texts)
+                ],
+                is_lazy=True,
+            )
+
+        comparison = self.comparison_class(
+            field,
+            StreamPage(body=get_stream_value(["Content", "Content Foo", "Bar"])),
+            StreamPage(body=get_stream_value(["Content", "Content Baz", "Bar"])),
+        )
+
+        with mock.patch.object(
+            compare.CharBlockComparison,
+            "htmldiff",
+            autospec=True,
+            side_effect=compare.CharBlockComparison.htmldiff,
+        ) as htmldiff:
+            self.assertEqual(
+                comparison.htmldiff(),
+                '<div class="comparison__child-object">Content</div>\n<div class="comparison__child-object">Content <span class="deletion">Foo</span><span class="addition">Baz</span></div>\n<div class="comparison__child-object">Bar</div>',
+            )
+
+        self.assertEqual(htmldiff.call_count, 1)
+
 
 class TestChoiceFieldComparison(TestCase):
     comparison_class = compare.ChoiceFieldComparison
@@ -1551,3 +1585,31 @@ class TestChildRelationComparisonUsingPK(TestCase):
         self.assertEqual(map_backwards, {})
         self.assertEqual(added, [0])  # Add new head count
         self.assertEqual(deleted, [0])  # Delete old head count
+
+
+class TestDiffText(TestCase):
+    def test_diff_text(self):
+        self.assertEqual(
+            compare.diff_text(
+                "I would like to go into the forrest.",
+                "I would like to go into the forest.",
+            ).to_html(),
+            'I would like to go into the <span class="deletion">forrest.</span><span class="addition">forest.</span>',
+        )
+
+    def test_unchanged(self):
+        self.assertEqual(
+            compare.diff_text("Hello <world>", "Hello <world>").to_html(),
+            "Hello &lt;world&gt;",
+        )
+
+    @override_settings(WAGTAILADMIN_COMPARE_MAX_TOKENS=6)
+    def test_max_tokens(self):
+        # The changed text in the middle is too long to diff, so is shown as one change
+        self.assertEqual(
+            compare.diff_text(
+                "Before the change: one two three four. After the change",
+                "Before the change: one three four five. After the change",
+            ).to_html(),
+            'Before the change: one <span class="deletion">two three four</span><span class="addition">three four five</span>. After the change',
+        )
@@ -0,0 +1,118 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from wagtail.admin.counts import CachedCountPaginator, get_count
+from wagtail.models import Page
+from wagtail.test.testapp.models import SimplePage
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class TestGetCount(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.home_page = Page.objects.get(url_path="/home/")
+        self.pages = Page.objects.descendant_of(self.home_page)
+        self.page_count = self.pages.count()
+
+    def add_page(self):
+        self.home_page.add_child(
+            instance=SimplePage(title="New page", slug="new-page", content="hello")
+        )
+
+    def test_count(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_count(self.pages), self.page_count)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_count(self.pages), self.page_count)
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_cached_count(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_count(self.pages), self.page_count)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_count(self.pages.all()), self.page_count)
+
+        # Other querysets are counted separately
+        self.assertEqual(get_count(self.pages.live()), self.pages.live().count())
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_cached_count_invalidated_on_save(self):
+        get_count(self.pages)
+        self.add_page()
+
+        self.assertEqual(get_count(self.pages), self.page_count + 1)
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_cached_count_invalidated_on_delete(self):
+        get_count(self.pages)
+        Page.objects.get(url_path="/home/events/christmas/").delete()
+
+        self.assertEqual(get_count(self.pages), self.page_count - 1)
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_estimated_count(self):
+        with mock.patch.object(connection, "vendor", "postgresql"), mock.patch(
+            "wagtail.admin.counts.get_estimated_count", return_value=5000
+        ):
+            self.assertEqual(get_count(Page.objects.all()), 5000)
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_exact_count_below_threshold(self):
+        with mock.patch.object(connection, "vendor", "postgresql"), mock.patch(
+            "wagtail.admin.counts.get_estimated_count", return_value=10
+        ):
+            self.assertEqual(get_count(Page.objects.all()), Page.objects.count())
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_exact_count_without_table_statistics(self):
+        with mock.patch.object(connection, "vendor", "postgresql"), mock.patch(
+            "wagtail.admin.counts.get_estimated_count", return_value=None
+        ):
+            self.assertEqual(get_count(Page.objects.all()), Page.objects.count())
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_no_estimate_for_filtered_querysets(self):
+        with mock.patch.object(connection, "vendor", "postgresql"), mock.patch(
+            "wagtail.admin.counts.get_estimated_count"
+        ) as get_estimated_count:
+            self.assertEqual(get_count(self.pages), self.page_count)
+            self.assertEqual(get_count(Page.objects.all()[:2]), 2)
+
+        get_estimated_count.assert_not_called()
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_no_estimate_on_other_databases(self):
+        with mock.patch.object(connection, "vendor", "sqlite"), mock.patch(
+            "wagtail.admin.counts.get_estimated_count"
+        ) as get_estimated_count:
+            self.assertEqual(get_count(Page.objects.all()), Page.objects.count())
+
+        get_estimated_count.assert_not_called()
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_paginator(self):
+        get_count(self.pages)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(self.pages, 2).count, self.page_count)
+
+        self.assertEqual(CachedCountPaginator([1, 2, 3], 2).count, 3)
+
+    @override_settings(WAGTAILADMIN_CACHED_COUNTS=True)
+    def test_paginator_with_empty_queryset(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(Page.objects.none(), 25).count, 0)
+            self.assertEqual(
+                CachedCountPaginator(Page.objects.filter(id__in=[]), 25).count, 0
+            )
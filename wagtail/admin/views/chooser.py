@@ -1,7 +1,6 @@
 import re
 
 from django.conf import settings
-from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.template.response import TemplateResponse
@@ -9,6 +8,7 @@ from django.urls.base import reverse
 from django.utils.http import urlencode
 
 from wagtail import hooks
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.forms.choosers import (
     AnchorLinkChooserForm,
     EmailLinkChooserForm,
@@ -221,7 +221,7 @@ def browse(request, parent_page_id=None):
     # Pagination
     # We apply pagination first so we don't need to walk the entire list
     # in the block below
-    paginator = Paginator(pages, per_page=25)
+    paginator = CachedCountPaginator(pages, per_page=25)
     pages = paginator.get_page(request.GET.get("p"))
 
     # Annotate each page with can_choose/can_decend flags
@@ -292,7 +292,7 @@ def search(request, parent_page_id=None):
     else:
         pages = pages.none()
 
-    paginator = Paginator(pages, per_page=25)
+    paginator = CachedCountPaginator(pages, per_page=25)
     pages = paginator.get_page(request.GET.get("p"))
 
     for page in pages:
@@ -13,6 +13,7 @@ from django.views.generic.edit import BaseUpdateView, DeletionMixin, FormMixin
 from django.views.generic.list import BaseListView
 
 from wagtail.admin import messages
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.forms.search import SearchForm
 from wagtail.admin.ui.tables import Table, TitleColumn
 from wagtail.log_actions import log
@@ -67,6 +68,7 @@ class IndexView(
     context_object_name = None
     any_permission_required = ["add", "change", "delete"]
     page_kwarg = "p"
+    paginator_class = CachedCountPaginator
     default_ordering = None
     is_searchable = None
     search_kwarg = "q"
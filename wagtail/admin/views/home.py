@@ -1,9 +1,7 @@
 import itertools
 
 from django.conf import settings
-from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import permission_required
-from django.db import connection
 from django.db.models import Max, Q
 from django.forms import Media
 from django.http import Http404, HttpResponse
@@ -11,6 +9,13 @@ from django.template.loader import render_to_string
 from django.template.response import TemplateResponse
 
 from wagtail import hooks
+from wagtail.admin.dashboard import (
+    cached_dashboard_enabled,
+    get_cached_ids,
+    get_moderation_cache_key,
+    get_recent_edits_cache_key,
+    get_recent_edits_limit,
+)
 from wagtail.admin.navigation import get_site_for_user
 from wagtail.admin.site_summary import SiteSummaryPanel
 from wagtail.admin.ui.components import Component
@@ -20,12 +25,8 @@ from wagtail.models import (
     TaskState,
     UserPagePermissionsProxy,
     WorkflowState,
-    get_default_page_content_type,
 )
 
-User = get_user_model()
-
-
 # Panels for the homepage
 
 
@@ -52,11 +53,16 @@ class PagesForModerationPanel(Component):
         request = parent_context["request"]
         context = super().get_context_data(parent_context)
         user_perms = UserPagePermissionsProxy(request.user)
-        context["page_revisions_for_moderation"] = (
-            user_perms.revisions_for_moderation()
-            .select_related("user")
-            .order_by("-created_at")
-        )
+        revisions = user_perms.revisions_for_moderation()
+        if cached_dashboard_enabled():
+            revision_ids = get_cached_ids(
+                get_moderation_cache_key(self.name, request.user.pk),
+                lambda: revisions.values_list("pk", flat=True),
+            )
+            revisions = Revision.page_revisions.submitted().filter(pk__in=revision_ids)
+        context["page_revisions_for_moderation"] = revisions.select_related(
+            "user"
+        ).order_by("-created_at")
         context["request"] = request
         context["csrf_token"] = parent_context["csrf_token"]
         return context
@@ -98,15 +104,18 @@ class WorkflowPagesToModeratePanel(Component):
         request = parent_context["request"]
         context = super().get_context_data(parent_context)
         if getattr(settings, "WAGTAIL_WORKFLOW_ENABLED", True):
-            states = (
-                TaskState.objects.reviewable_by(request.user)
-                .select_related(
-                    "page_revision",
-                    "task",
-                    "page_revision__user",
+            states = TaskState.objects.reviewable_by(request.user)
+            if cached_dashboard_enabled():
+                state_ids = get_cached_ids(
+                    get_moderation_cache_key(self.name, request.user.pk),
+                    lambda: states.values_list("pk", flat=True),
                 )
-                .order_by("-started_at")
-            )
+                states = TaskState.objects.filter(pk__in=state_ids)
+            states = states.select_related(
+                "page_revision",
+                "task",
+                "page_revision__user",
+            ).order_by("-started_at")
             context["states"] = [
                 (
                     state,
@@ -153,46 +162,82 @@ class RecentEditsPanel(Component):
     template_name = "wagtailadmin/home/recent_edits.html"
     order = 250
 
+    # The number of the user's most recent revisions to look through for each edit shown,
+    # before falling back to finding the latest revision of each page they edited
+    revisions_scanned_per_edit = 20
+
+    def get_last_edit_revisions(self, user):
+        """
+        Returns the user's latest revision of each of the pages they edited most recently,
+        newest first
+        """
+        if cached_dashboard_enabled():
+            revision_ids = get_cached_ids(
+                get_recent_edits_cache_key(user.pk),
+                lambda: [
+                    revision.pk for revision in self.find_last_edit_revisions(user)
+                ],
+            )
+            revisions = Revision.objects.defer("content").in_bulk(revision_ids)
+            return [revisions[pk] for pk in revision_ids if pk in revisions]
+
+        return self.find_last_edit_revisions(user)
+
+    def find_last_edit_revisions(self, user):
+        edit_count = get_recent_edits_limit()
+        if edit_count <= 0:
+            return []
+
+        # Read back through the user's most recent revisions, newest first, following the
+        # index on (user, base_content_type, created_at). This usually finds enough distinct
+        # pages without grouping all of the user's revisions by page.
+        revisions = Revision.page_revisions.filter(user=user).defer("content")
+        scan_size = edit_count * self.revisions_scanned_per_edit
+        recent_revisions = list(revisions.order_by("-created_at", "-pk")[:scan_size])
+
+        revisions_by_object_id = {}
+        for revision in recent_revisions:
+            revisions_by_object_id.setdefault(revision.object_id, revision)
+            if len(revisions_by_object_id) == edit_count:
+                return list(revisions_by_object_id.values())
+
+        if len(recent_revisions) < scan_size:
+            # These are all of the user's revisions
+            return list(revisions_by_object_id.values())
+
+        # The user has made many revisions to only a few pages, so find the latest revision
+        # date of each page they have edited instead
+        latest_dates = list(
+            revisions.values_list("object_id")
+            .annotate(latest_date=Max("created_at"))
+            .order_by("-latest_date")[:edit_count]
+        )
+        latest_revisions = {}
+        for revision in revisions.filter(
+            object_id__in=[object_id for object_id, latest_date in latest_dates],
+            created_at__in=[latest_date for object_id, latest_date in latest_dates],
+        ).order_by("-pk"):
+            latest_revisions.setdefault(
+                (revision.object_id, revision.created_at), revision
+            )
+        return [
+            latest_revisions[key] for key in latest_dates if key in latest_revisions
+        ]
+
     def get_context_data(self, parent_context):
         request = parent_context["request"]
         context = super().get_context_data(parent_context)
 
         # Last n edited pages
-        edit_count = getattr(settings, "WAGTAILADMIN_RECENT_EDITS_LIMIT", 5)
-        if connection.vendor == "mysql":
-            # MySQL can't handle the subselect created by the ORM version -
-            # it fails with "This version of MySQL doesn't yet support 'LIMIT & IN/ALL/ANY/SOME subquery'"
-            last_edits = Revision.objects.raw(
-                """
-                SELECT wr.* FROM
-                    wagtailcore_revision wr JOIN (
-                        SELECT max(created_at) AS max_created_at, object_id FROM
-                            wagtailcore_revision WHERE user_id = %s AND base_content_type_id = %s GROUP BY object_id ORDER BY max_created_at DESC LIMIT %s
-                    ) AS max_rev ON max_rev.max_created_at = wr.created_at ORDER BY wr.created_at DESC
-                 """,
-                [
-                    User._meta.pk.get_db_prep_value(request.user.pk, connection),
-                    get_default_page_content_type().id,
-                    edit_count,
-                ],
-            )
-        else:
-            last_edits_dates = (
-                Revision.page_revisions.filter(user=request.user)
-                .values("object_id")
-                .annotate(latest_date=Max("created_at"))
-                .order_by("-latest_date")
-                .values("latest_date")[:edit_count]
-            )
-            last_edits = Revision.page_revisions.filter(
-                created_at__in=last_edits_dates
-            ).order_by("-created_at")
+        last_edits = self.get_last_edit_revisions(request.user)
 
         # The revision's object_id is a string, so cast it to int first.
         page_keys = [int(pr.object_id) for pr in last_edits]
         pages = Page.objects.specific().in_bulk(page_keys)
         context["last_edits"] = [
-            [revision, pages.get(int(revision.object_id))] for revision in last_edits
+            [revision, pages[int(revision.object_id)]]
+            for revision in last_edits
+            if int(revision.object_id) in pages
         ]
         context["request"] = request
         return context
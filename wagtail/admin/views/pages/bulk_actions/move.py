@@ -3,6 +3,7 @@ from django.template.response import TemplateResponse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.admin import widgets
 from wagtail.admin.views.pages.bulk_actions.page_bulk_action import PageBulkAction
 from wagtail.models import Page
@@ -84,7 +85,7 @@ class MoveBulkAction(PageBulkAction):
 
     def object_context(self, obj):
         context = super().object_context(obj)
-        context["child_pages"] = context["item"].get_descendants().count()
+        context["child_pages"] = context["item"].get_descendant_count()
         return context
 
     def get_actionable_objects(self):
@@ -172,10 +173,7 @@ class MoveBulkAction(PageBulkAction):
 
     @classmethod
     def execute_action(cls, objects, destination=None, user=None, **kwargs):
-        num_parent_objects = 0
         if destination is None:
             return
-        for page in objects:
-            page.move(destination, pos="last-child", user=user)
-            num_parent_objects += 1
-        return num_parent_objects, 0
+        BulkMovePageAction(objects, destination, user=user).execute()
+        return len(objects), 0
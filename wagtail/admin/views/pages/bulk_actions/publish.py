@@ -2,6 +2,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext
 
 from wagtail.admin.views.pages.bulk_actions.page_bulk_action import PageBulkAction
+from wagtail.models import descendant_counts_enabled
 
 
 class PublishBulkAction(PageBulkAction):
@@ -16,9 +17,15 @@ class PublishBulkAction(PageBulkAction):
 
     def object_context(self, obj):
         context = super().object_context(obj)
-        context["draft_descendant_count"] = (
-            context["item"].get_descendants().not_live().count()
-        )
+        page = context["item"]
+        if descendant_counts_enabled():
+            context["draft_descendant_count"] = (
+                page.descendant_count - page.live_descendant_count
+            )
+        else:
+            context["draft_descendant_count"] = (
+                page.get_descendants().not_live().count()
+            )
         return context
 
     def get_context_data(self, **kwargs):
@@ -17,7 +17,7 @@ class UnpublishBulkAction(PageBulkAction):
     def object_context(self, page):
         return {
             **super().object_context(page),
-            "live_descendant_count": page.get_descendants().live().count(),
+            "live_descendant_count": page.get_live_descendant_count(),
         }
 
     def get_context_data(self, **kwargs):
@@ -1,5 +1,4 @@
 from django.conf import settings
-from django.core.paginator import Paginator
 from django.db.models import Count
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
@@ -7,6 +6,7 @@ from django.urls import reverse
 
 from wagtail import hooks
 from wagtail.admin.auth import user_has_any_page_permission, user_passes_test
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.navigation import get_explorable_root_page
 from wagtail.models import Page, UserPagePermissionsProxy
 
@@ -88,7 +88,7 @@ def index(request, parent_page_id=None):
 
     # Pagination
     if do_paginate:
-        paginator = Paginator(pages, per_page=50)
+        paginator = CachedCountPaginator(pages, per_page=50)
         pages = paginator.get_page(request.GET.get("p"))
 
     show_ordering_column = request.GET.get("ordering") == "ord"
@@ -71,7 +71,7 @@ def unpublish(request, page_id):
         {
             "page": page,
             "next": next_url,
-            "live_descendant_count": page.get_descendants().live().count(),
+            "live_descendant_count": page.get_live_descendant_count(),
             "translation_count": len(pages_to_unpublish[1:]),
             "translation_descendant_count": sum(
                 [
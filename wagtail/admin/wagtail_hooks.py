@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from django.conf import settings
 from django.contrib.auth.models import Permission
 from django.urls import reverse
@@ -13,6 +15,8 @@ from wagtail.admin.admin_url_finder import (
     register_admin_url_finder,
 )
 from wagtail.admin.auth import user_has_any_page_permission
+from wagtail.admin.counts import invalidate_counts
+from wagtail.admin.dashboard import invalidate_moderation
 from wagtail.admin.forms.collections import GroupCollectionManagementPermissionFormSet
 from wagtail.admin.menu import MenuItem, SubmenuMenuItem, reports_menu, settings_menu
 from wagtail.admin.navigation import get_explorable_root_page
@@ -45,7 +49,14 @@ from wagtail.admin.views.pages.bulk_actions import (
 )
 from wagtail.admin.viewsets import viewsets
 from wagtail.admin.widgets import Button, ButtonWithDropdownFromHook, PageListingButton
-from wagtail.models import Collection, Page, Task, UserPagePermissionsProxy, Workflow
+from wagtail.models import (
+    Collection,
+    Page,
+    Revision,
+    Task,
+    UserPagePermissionsProxy,
+    Workflow,
+)
 from wagtail.permissions import (
     collection_permission_policy,
     task_permission_policy,
@@ -1044,6 +1055,18 @@ def add_pages_summary_item(request, items):
     items.insert(0, PagesSummaryItem(request))
 
 
+@hooks.register("batch_page_changes")
+@contextmanager
+def invalidate_cached_revision_lists():
+    try:
+        yield
+    finally:
+        # Revisions may have been updated in bulk (such as when expired revisions are dropped
+        # from moderation by publish_scheduled_pages), which doesn't send post_save
+        invalidate_counts(Revision)
+        invalidate_moderation()
+
+
 class PageAdminURLFinder:
     def __init__(self, user):
         self.page_perms = user and UserPagePermissionsProxy(user)
@@ -15,6 +15,7 @@ from django.utils.safestring import mark_safe
 from django.utils.text import capfirst
 
 from wagtail.admin.staticfiles import versioned_static
+from wagtail.profiling import profile_phase, profiling_enabled
 from wagtail.telepath import JSContext
 
 __all__ = [
@@ -219,6 +220,13 @@ class Block(metaclass=BaseBlock):
         use a template (with the passed context, supplemented by the result of get_context) if a
         'template' property is specified on the block, and fall back on render_basic otherwise.
         """
+        if not profiling_enabled():
+            return self._render(value, context=context)
+
+        with profile_phase("block:" + type(self).__name__):
+            return self._render(value, context=context)
+
+    def _render(self, value, context=None):
         template = self.get_template(context=context)
         if not template:
             return self.render_basic(value, context=context)
@@ -1,7 +1,9 @@
+from copy import copy
+
 from django.apps import apps
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
-from wagtail.signals import page_published, page_unpublished
+from wagtail.contrib.frontend_cache.utils import PurgeBatch, purge_page_from_cache
+from wagtail.signals import page_published, page_unpublished, post_bulk_page_move
 
 
 def page_published_signal_handler(instance, **kwargs):
@@ -12,6 +14,23 @@ def page_unpublished_signal_handler(instance, **kwargs):
     purge_page_from_cache(instance)
 
 
+def post_bulk_page_move_signal_handler(instances, url_paths_before, **kwargs):
+    # Purge the old and new URLs of all the live pages that changed URL in one batch
+    batch = PurgeBatch()
+    for page in instances:
+        url_path_before = url_paths_before[page.id]
+        if not page.live or page.url_path == url_path_before:
+            continue
+
+        page_before = copy(page)
+        page_before.url_path = url_path_before
+        batch.add_page(page_before)
+        batch.add_page(page)
+
+    if batch.urls:
+        batch.purge()
+
+
 def register_signal_handlers():
     # Get list of models that are page types
     Page = apps.get_model("wagtailcore", "Page")
@@ -21,3 +40,5 @@ def register_signal_handlers():
     for model in indexed_models:
         page_published.connect(page_published_signal_handler, sender=model)
         page_unpublished.connect(page_unpublished_signal_handler, sender=model)
+
+    post_bulk_page_move.connect(post_bulk_page_move_signal_handler)
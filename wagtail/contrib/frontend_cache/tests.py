@@ -8,6 +8,7 @@ from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase
 from django.test.utils import override_settings
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.contrib.frontend_cache.backends import (
     AzureCdnBackend,
     AzureFrontDoorBackend,
@@ -22,6 +23,7 @@ from wagtail.test.testapp.models import EventIndex
 
 from .utils import (
     PurgeBatch,
+    batch_purges,
     purge_page_from_cache,
     purge_pages_from_cache,
     purge_url_from_cache,
@@ -517,6 +519,42 @@ class TestCachePurgingSignals(TestCase):
             PURGED_URLS, ["http://localhost/events/", "http://localhost/events/past/"]
         )
 
+    def test_batch_purges(self):
+        page = EventIndex.objects.get(url_path="/home/events/")
+        with batch_purges():
+            page.save_revision().publish()
+            page.save_revision().publish()
+            purge_url_from_cache("http://localhost/foo")
+            self.assertEqual(PURGED_URLS, [])
+
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/foo",
+            ],
+        )
+
+    def test_purge_on_bulk_move(self):
+        page = EventIndex.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        BulkMovePageAction([page], about_us).execute()
+        self.assertEqual(
+            PURGED_URLS,
+            [
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/about-us/events/",
+                "http://localhost/about-us/events/past/",
+            ],
+        )
+
+    def test_no_purge_on_bulk_reorder(self):
+        page = EventIndex.objects.get(url_path="/home/events/")
+        BulkMovePageAction([page], page.get_parent()).execute()
+        self.assertEqual(PURGED_URLS, [])
+
     def test_purge_with_unroutable_page(self):
         root = Page.objects.get(url_path="/")
         page = EventIndex(title="new top-level page")
@@ -1,5 +1,7 @@
 import logging
 import re
+import threading
+from contextlib import contextmanager
 from urllib.parse import urlparse, urlunparse
 
 from django.conf import settings
@@ -10,6 +12,8 @@ from wagtail.coreutils import get_content_languages
 
 logger = logging.getLogger("wagtail.frontendcache")
 
+_batch = threading.local()
+
 
 class InvalidFrontendCacheBackendError(ImproperlyConfigured):
     pass
@@ -62,7 +66,36 @@ def purge_url_from_cache(url, backend_settings=None, backends=None):
     purge_urls_from_cache([url], backend_settings=backend_settings, backends=backends)
 
 
+@contextmanager
+def batch_purges():
+    """
+    Collects the URLs purged with the configured backends within the block (such as by the
+    signal handlers when pages are published), and purges them together at the end of it, once
+    per URL.
+    """
+    if getattr(_batch, "urls", None) is not None:
+        # Already collecting URLs in an outer block
+        yield
+        return
+
+    _batch.urls = {}
+    try:
+        yield
+    finally:
+        urls, _batch.urls = _batch.urls, None
+        if urls:
+            purge_urls_from_cache(list(urls))
+
+
 def purge_urls_from_cache(urls, backend_settings=None, backends=None):
+    if (
+        getattr(_batch, "urls", None) is not None
+        and backend_settings is None
+        and backends is None
+    ):
+        _batch.urls.update(dict.fromkeys(urls))
+        return
+
     # Convert each url to urls one for each managed language (WAGTAILFRONTENDCACHE_LANGUAGES setting).
     # The managed languages are common to all the defined backends.
     # This depends on settings.USE_I18N
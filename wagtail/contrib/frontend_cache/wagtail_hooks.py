@@ -0,0 +1,7 @@
+from wagtail import hooks
+from wagtail.contrib.frontend_cache.utils import batch_purges
+
+
+@hooks.register("batch_page_changes")
+def batch_frontend_cache_purges():
+    return batch_purges()
@@ -5,3 +5,10 @@ class WagtailSettingsAppConfig(AppConfig):
     name = "wagtail.contrib.settings"
     label = "wagtailsettings"
     verbose_name = "Wagtail site settings"
+
+    def ready(self):
+        from .registry import registry
+        from .signal_handlers import register_related_object_signal_handlers
+
+        for model in registry:
+            register_related_object_signal_handlers(model)
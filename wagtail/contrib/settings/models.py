@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.db import models
 
 from wagtail.coreutils import InvokeViaAttributeShortcut
@@ -8,6 +11,17 @@ from .registry import register_setting
 __all__ = ["BaseSetting", "register_setting"]
 
 
+def settings_cache_enabled():
+    return getattr(settings, "WAGTAILSETTINGS_CACHE", False)
+
+
+def get_settings_cache():
+    try:
+        return caches["settings"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
 class BaseSetting(models.Model):
     """
     The abstract base model for settings. Subclasses must be registered using
@@ -48,11 +62,48 @@ class BaseSetting(models.Model):
     def for_site(cls, site):
         """
         Get or create an instance of this setting for the site.
+
+        If ``WAGTAILSETTINGS_CACHE`` is enabled, the instance (along with any
+        related objects fetched via ``select_related``) is cached, so that the
+        database is only queried when it is not in the cache.
         """
-        queryset = cls.base_queryset()
-        instance, created = queryset.get_or_create(site=site)
+        if site is None or not settings_cache_enabled():
+            queryset = cls.base_queryset()
+            instance, created = queryset.get_or_create(site=site)
+            return instance
+
+        cache = get_settings_cache()
+        cache_key = cls.get_settings_cache_key(site.pk)
+        instance = cache.get(cache_key)
+        if instance is None:
+            queryset = cls.base_queryset()
+            instance, created = queryset.get_or_create(site=site)
+            cache.set(
+                cache_key,
+                instance,
+                getattr(settings, "WAGTAILSETTINGS_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+            )
         return instance
 
+    @classmethod
+    def get_settings_cache_key(cls, site_id):
+        return "wagtail-settings-{}-{}".format(cls._meta.label_lower, site_id)
+
+    @classmethod
+    def clear_settings_cache(cls, site_id=None):
+        """
+        Removes the cached instance of this setting for the given site, or for
+        all sites if ``site_id`` is None.
+        """
+        if site_id is None:
+            site_ids = Site.objects.values_list("pk", flat=True)
+        else:
+            site_ids = [site_id]
+
+        get_settings_cache().delete_many(
+            [cls.get_settings_cache_key(site_id) for site_id in site_ids]
+        )
+
     @classmethod
     def for_request(cls, request):
         """
@@ -85,6 +136,20 @@ class BaseSetting(models.Model):
         # Per-instance page URL cache
         self._page_url_cache = {}
 
+    def __getstate__(self):
+        # Leave out per-instance caches and the request when pickling (such as
+        # when storing the instance in the settings cache)
+        state = super().__getstate__()
+        state.pop("page_url", None)
+        state.pop("_page_url_cache", None)
+        state.pop("_request", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.page_url = InvokeViaAttributeShortcut(self, "get_page_url")
+        self._page_url_cache = {}
+
     def get_page_url(self, attribute_name, request=None):
         """
         Returns the URL of a page referenced by a foreign key
@@ -88,6 +88,18 @@ class Registry(list):
         )
         register_admin_url_finder(model, finder_class)
 
+        # Keep cached instances of the setting up to date (imported here, as the
+        # signal handlers depend on models that import this module)
+        from .signal_handlers import (
+            register_related_object_signal_handlers,
+            register_signal_handlers,
+        )
+
+        register_signal_handlers(model)
+        if apps.models_ready:
+            # Otherwise, this is done once all models are loaded (in AppConfig.ready)
+            register_related_object_signal_handlers(model)
+
         return model
 
     def register_decorator(self, model=None, **kwargs):
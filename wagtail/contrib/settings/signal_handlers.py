@@ -0,0 +1,63 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.contrib.settings.models import settings_cache_enabled
+
+
+def get_select_related_models(model):
+    """
+    Returns the set of models fetched along with the setting model ``model``
+    through its ``select_related`` attribute
+    """
+    related_models = set()
+    for path in model.select_related or []:
+        related_model = model
+        for field_name in path.split("__"):
+            related_model = related_model._meta.get_field(field_name).related_model
+            related_models.add(related_model)
+    return related_models
+
+
+def register_signal_handlers(model):
+    """
+    Clears cached instances of the setting model ``model`` when they change
+    """
+
+    def clear_cached_setting(instance, **kwargs):
+        if settings_cache_enabled():
+            model.clear_settings_cache(instance.site_id)
+
+    post_save.connect(clear_cached_setting, sender=model, weak=False)
+    post_delete.connect(clear_cached_setting, sender=model, weak=False)
+
+
+def register_related_object_signal_handlers(model):
+    """
+    Clears cached instances of the setting model ``model`` when an object that they may
+    have fetched via ``select_related`` changes. This needs all models to be loaded, as
+    the related objects may be instances of subclasses (such as specific pages), each of
+    which sends its own signals.
+    """
+    related_models = tuple(get_select_related_models(model))
+    if not related_models:
+        return
+
+    def clear_cached_settings_for_related_object(**kwargs):
+        if settings_cache_enabled():
+            model.clear_settings_cache()
+
+    dispatch_uid = "clear_cached_settings_{}".format(model._meta.label_lower)
+    for sender in apps.get_models():
+        if issubclass(sender, related_models):
+            post_save.connect(
+                clear_cached_settings_for_related_object,
+                sender=sender,
+                weak=False,
+                dispatch_uid=dispatch_uid,
+            )
+            post_delete.connect(
+                clear_cached_settings_for_related_object,
+                sender=sender,
+                weak=False,
+                dispatch_uid=dispatch_uid,
+            )
@@ -1,6 +1,12 @@
+from unittest import mock
+
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 
-from wagtail.models import Site
+from wagtail.contrib.settings.signal_handlers import (
+    register_related_object_signal_handlers,
+)
+from wagtail.models import Collection, Site
 from wagtail.test.testapp.models import ImportantPages, TestSetting
 
 from .base import SettingsTestMixin
@@ -177,3 +183,129 @@ class SettingModelTestCase(SettingsTestMixin, TestCase):
                 self.assertEqual(settings.get_page_url("test_attribute"), "")
                 # when called indirectly via shortcut
                 self.assertEqual(settings.page_url.test_attribute, "")
+
+
+@override_settings(
+    ALLOWED_HOSTS=["localhost", "other"],
+    WAGTAILSETTINGS_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "settings-tests",
+        }
+    },
+)
+class SettingsCacheTestCase(SettingsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    def test_for_site_is_cached(self):
+        TestSetting.for_site(self.default_site)
+
+        with self.assertNumQueries(0):
+            for site, expected_site_settings in (
+                (self.default_site, self.default_site_settings),
+                (self.default_site, self.default_site_settings),
+            ):
+                self.assertEqual(TestSetting.for_site(site), expected_site_settings)
+
+        # Each site is cached separately
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                TestSetting.for_site(self.other_site), self.other_site_settings
+            )
+
+    def test_for_request_uses_cache(self):
+        TestSetting.for_site(self.default_site)
+        request = self.get_request()
+        Site.find_for_request(request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                TestSetting.for_request(request), self.default_site_settings
+            )
+
+    def test_cached_instance_is_created_if_missing(self):
+        self.default_site_settings.delete()
+
+        setting = TestSetting.for_site(self.default_site)
+        self.assertIsNotNone(setting.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(TestSetting.for_site(self.default_site), setting)
+
+    def test_cache_is_cleared_on_save_and_delete(self):
+        TestSetting.for_site(self.default_site)
+
+        self.default_site_settings.title = "Updated title"
+        self.default_site_settings.save()
+        self.assertEqual(TestSetting.for_site(self.default_site).title, "Updated title")
+
+        self.default_site_settings.delete()
+        # Recreated, with the default title
+        self.assertEqual(TestSetting.for_site(self.default_site).title, "")
+
+    def test_select_related_objects_are_cached(self):
+        ImportantPages.objects.create(
+            site=self.default_site,
+            sign_up_page=self.default_site.root_page,
+            general_terms_page=self.default_site.root_page,
+            privacy_policy_page=self.other_site.root_page,
+        )
+
+        try:
+            ImportantPages.select_related = ["sign_up_page", "privacy_policy_page"]
+            # select_related is normally read when the app is ready
+            register_related_object_signal_handlers(ImportantPages)
+            ImportantPages.for_site(self.default_site)
+
+            with self.assertNumQueries(0):
+                setting = ImportantPages.for_site(self.default_site)
+                self.assertEqual(
+                    setting.sign_up_page.title, self.default_site.root_page.title
+                )
+                self.assertEqual(setting.privacy_policy_page.title, "Other Root")
+
+            # Changing a related object clears the cache
+            other_root = self.other_site.root_page.specific
+            other_root.title = "Renamed Root"
+            other_root.save()
+            setting = ImportantPages.for_site(self.default_site)
+            self.assertEqual(setting.privacy_policy_page.title, "Renamed Root")
+        finally:
+            ImportantPages.select_related = None
+
+    def test_unrelated_object_changes_do_not_clear_cache(self):
+        try:
+            ImportantPages.select_related = ["sign_up_page"]
+            register_related_object_signal_handlers(ImportantPages)
+
+            with mock.patch.object(ImportantPages, "clear_settings_cache") as clear:
+                Collection.get_first_root_node().add_child(name="Unrelated")
+                clear.assert_not_called()
+
+                page = self.default_site.root_page.specific
+                page.save()
+                clear.assert_called_once_with()
+        finally:
+            ImportantPages.select_related = None
+
+    def test_get_page_url_on_cached_instance(self):
+        ImportantPages.objects.create(
+            site=self.default_site,
+            sign_up_page=self.default_site.root_page,
+            general_terms_page=self.default_site.root_page,
+            privacy_policy_page=self.other_site.root_page,
+        )
+        ImportantPages.for_site(self.default_site)
+
+        request = self.get_request()
+        setting = ImportantPages.for_request(request)
+        self.assertEqual(setting.page_url.privacy_policy_page, "http://other/")
+        self.assertEqual(setting.page_url.sign_up_page, "/")
+
+    @override_settings(WAGTAILSETTINGS_CACHE=False)
+    def test_cache_disabled(self):
+        TestSetting.for_site(self.default_site)
+        with self.assertNumQueries(1):
+            TestSetting.for_site(self.default_site)
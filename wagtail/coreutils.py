@@ -3,6 +3,7 @@ import inspect
 import logging
 import re
 import unicodedata
+from contextlib import ExitStack, contextmanager
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Union
 
 from anyascii import anyascii
@@ -411,6 +412,21 @@ def get_dummy_request(path: str = "/", site: "Site" = None) -> HttpRequest:
     return request
 
 
+@contextmanager
+def batch_page_changes():
+    """
+    Defers the work that follows changes to pages within the block, such as search index updates
+    and front-end cache purges, so that it is done together at the end of it. Apps take part by
+    registering a ``batch_page_changes`` hook that returns a context manager.
+    """
+    from wagtail import hooks
+
+    with ExitStack() as stack:
+        for fn in hooks.get_hooks("batch_page_changes"):
+            stack.enter_context(fn())
+        yield
+
+
 class BatchProcessor:
     """
     A class to help with processing of an unknown (and potentially very
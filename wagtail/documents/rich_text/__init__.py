@@ -21,3 +21,10 @@ class DocumentLinkHandler(LinkHandler):
             return '<a href="%s">' % escape(doc.url)
         except (ObjectDoesNotExist, KeyError):
             return "<a>"
+
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list):
+        return [
+            '<a href="%s">' % escape(doc.url) if doc is not None else "<a>"
+            for doc in cls.get_many(attrs_list)
+        ]
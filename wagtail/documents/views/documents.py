@@ -12,6 +12,7 @@ from django.views.generic import TemplateView
 
 from wagtail.admin import messages
 from wagtail.admin.auth import PermissionPolicyChecker
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.forms.search import SearchForm
 from wagtail.admin.models import popular_tags_for_model
 from wagtail.admin.views.pages.utils import get_valid_next_url_from_request
@@ -68,7 +69,7 @@ class BaseListingView(TemplateView):
             self.form = SearchForm(placeholder=_("Search documents"))
 
         # Pagination
-        paginator = Paginator(documents, per_page=20)
+        paginator = CachedCountPaginator(documents, per_page=20)
         documents = paginator.get_page(self.request.GET.get("p"))
 
         next_url = reverse("wagtaildocs:index")
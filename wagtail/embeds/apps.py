@@ -11,5 +11,9 @@ class WagtailEmbedsAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
 
     def ready(self):
+        from wagtail.embeds.signal_handlers import register_signal_handlers
+
+        register_signal_handlers()
+
         # Check configuration on startup
         get_finders()
@@ -1,39 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from hashlib import md5
 
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connections
 from django.utils.timezone import now
 
 from wagtail.coreutils import accepts_kwarg
 
-from .exceptions import EmbedUnsupportedProviderException
+from .exceptions import (
+    EmbedException,
+    EmbedNotFoundException,
+    EmbedUnsupportedProviderException,
+)
 from .finders import get_finders
 from .models import Embed
 
+# Failures that are cached (for WAGTAILEMBEDS_NOT_FOUND_CACHE_TIMEOUT seconds) when
+# WAGTAILEMBEDS_CACHE is enabled, rather than calling the finders again on every request
+CACHEABLE_EXCEPTIONS = (EmbedNotFoundException, EmbedUnsupportedProviderException)
+
 
 def get_embed(url, max_width=None, max_height=None, finder=None):
     embed_hash = get_embed_hash(url, max_width, max_height)
 
+    # Check cache
+    cached = get_cached_embeds([embed_hash]).get(embed_hash)
+    if isinstance(cached, Embed):
+        return cached
+    elif cached is not None:
+        raise cached
+
     # Check database
     try:
-        return Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
+        embed = Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
     except Embed.DoesNotExist:
         pass
+    else:
+        cache_embeds([embed])
+        return embed
 
     # Get/Call finder
-    if not finder:
+    try:
+        embed_dict = (finder or find_embed)(url, max_width, max_height)
+    except CACHEABLE_EXCEPTIONS as e:
+        cache_embed_not_found(embed_hash, type(e))
+        raise
+
+    embed = create_embed(url, max_width, embed_hash, embed_dict)
+    cache_embeds([embed])
+    return embed
+
+
+def get_embeds(urls, max_width=None, max_height=None, finder=None):
+    """
+    Returns a dict mapping each of the given URLs to its embed, omitting any that
+    could not be embedded.
+
+    Unlike calling ``get_embed`` for each URL, embeds that are already stored are
+    fetched with a single database query, and those that need to be fetched from
+    a finder are fetched concurrently (using up to ``WAGTAILEMBEDS_FINDER_WORKERS``
+    threads).
+    """
+    hashes = {url: get_embed_hash(url, max_width, max_height) for url in urls}
+    embeds = {}
+
+    # Check cache
+    cached = get_cached_embeds(hashes.values())
+    missing_urls = []
+    for url, embed_hash in hashes.items():
+        if isinstance(cached.get(embed_hash), Embed):
+            embeds[url] = cached[embed_hash]
+        elif embed_hash not in cached:
+            missing_urls.append(url)
+
+    # Check database
+    if missing_urls:
+        stored_embeds = {
+            embed.hash: embed
+            for embed in Embed.objects.exclude(cache_until__lte=now()).filter(
+                hash__in=[hashes[url] for url in missing_urls]
+            )
+        }
+        cache_embeds(stored_embeds.values())
 
-        def finder(url, max_width=None, max_height=None):
-            for finder in get_finders():
-                if finder.accept(url):
-                    kwargs = {}
-                    if accepts_kwarg(finder.find_embed, "max_height"):
-                        kwargs["max_height"] = max_height
-                    return finder.find_embed(url, max_width=max_width, **kwargs)
+        for url in missing_urls:
+            if hashes[url] in stored_embeds:
+                embeds[url] = stored_embeds[hashes[url]]
 
-            raise EmbedUnsupportedProviderException
+    # Get/Call finders
+    urls_to_find = [url for url in missing_urls if url not in embeds]
+    for url, embed_dict, exception in find_embeds(
+        urls_to_find, max_width, max_height, finder or find_embed
+    ):
+        if exception is None:
+            embeds[url] = create_embed(url, max_width, hashes[url], embed_dict)
+            cache_embeds([embeds[url]])
+        elif isinstance(exception, CACHEABLE_EXCEPTIONS):
+            cache_embed_not_found(hashes[url], type(exception))
 
-    embed_dict = finder(url, max_width, max_height)
+    return {url: embeds[url] for url in hashes if url in embeds}
 
+
+def find_embed(url, max_width=None, max_height=None):
+    """
+    Fetches the embed for the given URL from the first configured finder that
+    accepts it, returning a dict of the embed's fields
+    """
+    for finder in get_finders():
+        if finder.accept(url):
+            kwargs = {}
+            if accepts_kwarg(finder.find_embed, "max_height"):
+                kwargs["max_height"] = max_height
+            return finder.find_embed(url, max_width=max_width, **kwargs)
+
+    raise EmbedUnsupportedProviderException
+
+
+def find_embeds(urls, max_width, max_height, finder):
+    """
+    Calls the finder for each of the given URLs on a pool of threads, yielding
+    (url, embed_dict, exception) tuples in the same order
+    """
+
+    def find(url):
+        try:
+            return url, finder(url, max_width, max_height), None
+        except EmbedException as e:
+            return url, None, e
+        finally:
+            # Close any database connections opened by the finder in this thread
+            if len(urls) > 1:
+                connections.close_all()
+
+    if len(urls) <= 1:
+        yield from map(find, urls)
+        return
+
+    max_workers = getattr(settings, "WAGTAILEMBEDS_FINDER_WORKERS", 4)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        yield from executor.map(find, urls)
+
+
+def create_embed(url, max_width, embed_hash, embed_dict):
     # Make sure width and height are valid integers before inserting into database
     try:
         embed_dict["width"] = int(embed_dict["width"])
@@ -75,3 +186,71 @@ def get_embed_hash(url, max_width=None, max_height=None):
         h.update(b"\n")
         h.update(str(max_height).encode("utf-8"))
     return h.hexdigest()
+
+
+# Caching
+
+
+def embed_cache_enabled():
+    return getattr(settings, "WAGTAILEMBEDS_CACHE", False)
+
+
+def get_embed_cache():
+    try:
+        return caches["embeds"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_embed_cache_key(embed_hash):
+    return "wagtail-embed-" + embed_hash
+
+
+def get_cached_embeds(embed_hashes):
+    """
+    Returns a dict mapping embed hashes to the cached Embed, or to the exception
+    class that was raised when it was last looked up, for those that are cached
+    """
+    if not embed_cache_enabled():
+        return {}
+
+    keys = {get_embed_cache_key(embed_hash): embed_hash for embed_hash in embed_hashes}
+    return {keys[key]: value for key, value in get_embed_cache().get_many(keys).items()}
+
+
+def cache_embeds(embeds):
+    if not embed_cache_enabled():
+        return
+
+    cache = get_embed_cache()
+    timeout = getattr(settings, "WAGTAILEMBEDS_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = cache.default_timeout
+
+    for embed in embeds:
+        embed_timeout = timeout
+        if embed.cache_until is not None:
+            # Don't cache the embed for longer than the provider asked for
+            remaining = (embed.cache_until - now()).total_seconds()
+            if remaining <= 0:
+                continue
+            if embed_timeout is None or remaining < embed_timeout:
+                embed_timeout = remaining
+
+        cache.set(get_embed_cache_key(embed.hash), embed, embed_timeout)
+
+
+def cache_embed_not_found(embed_hash, exception_class):
+    if not embed_cache_enabled():
+        return
+
+    get_embed_cache().set(
+        get_embed_cache_key(embed_hash),
+        exception_class,
+        getattr(settings, "WAGTAILEMBEDS_NOT_FOUND_CACHE_TIMEOUT", 300),
+    )
+
+
+def clear_cached_embed(embed_hash):
+    if embed_cache_enabled():
+        get_embed_cache().delete(get_embed_cache_key(embed_hash))
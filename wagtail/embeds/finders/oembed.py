@@ -1,6 +1,7 @@
 import json
 import re
 from datetime import timedelta
+from functools import lru_cache
 from urllib import request as urllib_request
 from urllib.error import URLError
 from urllib.parse import urlencode
@@ -14,32 +15,225 @@ from wagtail.embeds.oembed_providers import all_providers
 from .base import EmbedFinder
 
 
-class OEmbedFinder(EmbedFinder):
-    options = {}
-    _endpoints = None
+class ProviderIndex:
+    """
+    Finds the oEmbed endpoint for a URL from a list of providers.
 
-    def __init__(self, providers=None, options=None):
-        self._endpoints = {}
+    Each URL pattern is filed under the literal host name (or domain suffix) that
+    it matches, as far as this can be worked out from the pattern, and the patterns
+    for each host are combined into a single regex. Looking up a URL then only
+    involves a dictionary lookup per label of its host name, and one regex match
+    per candidate host plus any patterns that could not be indexed. The result is
+    the same as trying every pattern in turn: the first matching pattern, in
+    provider order, wins.
+    """
 
-        for provider in providers or all_providers:
-            patterns = []
+    def __init__(self, providers):
+        self.endpoints = []
+        patterns_by_host = {}
+        unindexed_patterns = []
 
+        for provider in providers:
             endpoint = provider["endpoint"].replace("{format}", "json")
+            for url_pattern in provider["urls"]:
+                index = len(self.endpoints)
+                self.endpoints.append(endpoint)
+
+                host = get_pattern_host(url_pattern)
+                if host is None:
+                    unindexed_patterns.append((index, url_pattern))
+                else:
+                    patterns_by_host.setdefault(host, []).append((index, url_pattern))
+
+        self.regexes_by_host = {
+            host: self.compile_patterns(patterns)
+            for host, patterns in patterns_by_host.items()
+        }
+        self.unindexed_regexes = [
+            (re.compile(url_pattern), index)
+            for index, url_pattern in unindexed_patterns
+        ]
+
+    @staticmethod
+    def compile_patterns(patterns):
+        """
+        Returns a list of (regex, index) tuples for the given (index, pattern)
+        tuples. Where possible, the patterns are combined into one regex with a
+        named group for each, in which case the index is None and is given by the
+        name of the matching group instead.
+        """
+        try:
+            return [
+                (
+                    re.compile(
+                        "|".join(
+                            "(?P<_%d>%s)" % (index, url_pattern)
+                            for index, url_pattern in patterns
+                        )
+                    ),
+                    None,
+                )
+            ]
+        except re.error:
+            # e.g. the patterns reuse group names
+            return [(re.compile(url_pattern), index) for index, url_pattern in patterns]
+
+    def get_candidate_regexes(self, url):
+        _, separator, rest = url.partition("://")
+        if separator:
+            labels = re.split(r"[/?#]", rest, 1)[0].split(".")
+            for i in range(len(labels)):
+                yield from self.regexes_by_host.get(".".join(labels[i:]), [])
+
+        yield from self.unindexed_regexes
+
+    def get_endpoint(self, url):
+        best_index = None
+
+        for regex, index in self.get_candidate_regexes(url):
+            match = regex.match(url)
+            if match is None:
+                continue
+            if index is None:
+                index = int(match.lastgroup[1:])
+            if best_index is None or index < best_index:
+                best_index = index
+
+        if best_index is not None:
+            return self.endpoints[best_index]
+
+
+# The host part of a URL pattern, following the scheme
+PATTERN_HOST_RE = re.compile(r"^\^(?:https\?|https|http)://([^/]*)/")
+
+# A literal host name (such as "example\.com") at the end of the host part of a pattern
+PATTERN_LITERAL_HOST_RE = re.compile(r"((?:[-\w]+\\\.)*[-\w]+)$")
+
+
+def _split_alternatives(pattern):
+    """
+    Splits a regex on its top-level "|" characters. Returns None if it contains
+    unbalanced parentheses.
+    """
+    alternatives = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 1
+        elif char == "[":
+            # Skip over character classes, which may contain any of "()|"
+            i = pattern.find("]", i + 2)
+            if i == -1:
+                return None
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                return None
+        elif char == "|" and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+
+    if depth != 0:
+        return None
+    alternatives.append(pattern[start:])
+    return alternatives
 
-            for url in provider["urls"]:
-                patterns.append(re.compile(url))
 
-            self._endpoints[endpoint] = patterns
+def _ends_with_dot(pattern):
+    """
+    Returns True if every string matched by the given regex fragment ends with a
+    literal dot. Supports fragments ending in "\\.", and groups (optionally
+    followed by "?") whose alternatives all do so.
+    """
+    if pattern.endswith("\\."):
+        return not pattern.endswith("\\\\.")
+
+    if pattern.endswith(")?"):
+        pattern = pattern[:-1]
+    if not pattern.endswith(")"):
+        return False
+
+    # Find the start of the group
+    for start in range(len(pattern) - 1, -1, -1):
+        if pattern[start] != "(" or pattern[start - 1 : start] == "\\":
+            continue
+        alternatives = _split_alternatives(pattern[start + 1 : -1])
+        if alternatives is None:
+            continue
+        content = pattern[start + 1 : -1]
+        if content.startswith("?:"):
+            alternatives = _split_alternatives(content[2:])
+        elif content.startswith("?"):
+            return False
+        return all(
+            alternative and _ends_with_dot(alternative) for alternative in alternatives
+        )
+
+    return False
+
+
+def get_pattern_host(url_pattern):
+    """
+    Returns the host name, or domain suffix, that all URLs matched by the given
+    pattern end with, or None if this can't be determined
+    """
+    match = PATTERN_HOST_RE.match(url_pattern)
+    if match is None:
+        return None
+
+    host_pattern = match.group(1)
+    alternatives = _split_alternatives(host_pattern)
+    if alternatives is None or len(alternatives) > 1:
+        return None
+
+    match = PATTERN_LITERAL_HOST_RE.search(host_pattern)
+    if match is None:
+        return None
+
+    # The host name must be the whole of the host, or follow a dot
+    prefix = host_pattern[: match.start()]
+    if prefix and not _ends_with_dot(prefix):
+        return None
+
+    return match.group(1).replace("\\.", ".")
+
+
+@lru_cache(maxsize=None)
+def _get_provider_index(providers_key):
+    return ProviderIndex(
+        {"endpoint": endpoint, "urls": urls} for endpoint, urls in providers_key
+    )
+
+
+def get_provider_index(providers):
+    """
+    Returns a ProviderIndex for the given providers, built once per process for
+    each distinct list of providers
+    """
+    return _get_provider_index(
+        tuple((provider["endpoint"], tuple(provider["urls"])) for provider in providers)
+    )
+
+
+class OEmbedFinder(EmbedFinder):
+    options = {}
+    _provider_index = None
+
+    def __init__(self, providers=None, options=None):
+        self._provider_index = get_provider_index(providers or all_providers)
 
         if options:
             self.options = self.options.copy()
             self.options.update(options)
 
     def _get_endpoint(self, url):
-        for endpoint, patterns in self._endpoints.items():
-            for pattern in patterns:
-                if re.match(pattern, url):
-                    return endpoint
+        return self._provider_index.get_endpoint(url)
 
     def accept(self, url):
         return self._get_endpoint(url) is not None
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.embeds.embeds import clear_cached_embed
+from wagtail.embeds.models import Embed
+
+
+def clear_cached_embed_signal_handler(instance, **kwargs):
+    clear_cached_embed(instance.hash)
+
+
+def register_signal_handlers():
+    post_save.connect(clear_cached_embed_signal_handler, sender=Embed)
+    post_delete.connect(clear_cached_embed_signal_handler, sender=Embed)
@@ -1,11 +1,14 @@
 import datetime
 import json
+import re
+import threading
 import unittest
 import urllib.request
 from unittest.mock import patch
 from urllib.error import HTTPError, URLError
 
 from django import template
+from django.core.cache import caches
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings
 from django.urls import reverse
@@ -14,7 +17,7 @@ from django.utils.timezone import make_aware, now
 from wagtail import blocks
 from wagtail.embeds import oembed_providers
 from wagtail.embeds.blocks import EmbedBlock, EmbedValue
-from wagtail.embeds.embeds import get_embed, get_embed_hash
+from wagtail.embeds.embeds import get_embed, get_embed_hash, get_embeds
 from wagtail.embeds.exceptions import (
     EmbedNotFoundException,
     EmbedUnsupportedProviderException,
@@ -32,6 +35,7 @@ from wagtail.embeds.finders.instagram import (
     InstagramOEmbedFinder as InstagramOEmbedFinder,
 )
 from wagtail.embeds.finders.oembed import OEmbedFinder as OEmbedFinder
+from wagtail.embeds.finders.oembed import get_pattern_host, get_provider_index
 from wagtail.embeds.models import Embed
 from wagtail.embeds.templatetags.wagtailembeds_tags import embed_tag
 from wagtail.test.utils import WagtailTestUtils
@@ -264,6 +268,150 @@ class TestEmbeds(TestCase):
             get_embed("www.test.com/1234", max_width=400)
 
 
+@override_settings(
+    WAGTAILEMBEDS_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "embeds-tests",
+        }
+    },
+)
+class TestEmbedCache(TestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.found_urls = []
+
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        self.found_urls.append(url)
+        if "missing" in url:
+            raise EmbedNotFoundException
+
+        return {
+            "title": "Test: " + url,
+            "type": "video",
+            "width": 640,
+            "height": 480,
+            "html": "<p>Blah blah blah</p>",
+        }
+
+    def test_get_embed_uses_cache(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_embed("www.test.com/1234", finder=self.dummy_finder), embed
+            )
+        self.assertEqual(self.found_urls, ["www.test.com/1234"])
+
+    def test_cache_is_cleared_when_embed_changes(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        embed.title = "Updated"
+        embed.save()
+
+        with self.assertNumQueries(1):
+            embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        self.assertEqual(embed.title, "Updated")
+
+        embed.delete()
+        get_embed("www.test.com/1234", finder=self.dummy_finder)
+        self.assertEqual(self.found_urls, ["www.test.com/1234"] * 2)
+
+    def test_not_found_is_cached(self):
+        for i in range(2):
+            with self.assertRaises(EmbedNotFoundException):
+                get_embed("www.test.com/missing", finder=self.dummy_finder)
+
+        self.assertEqual(self.found_urls, ["www.test.com/missing"])
+
+    @override_settings(WAGTAILEMBEDS_NOT_FOUND_CACHE_TIMEOUT=0)
+    def test_not_found_cache_timeout(self):
+        for i in range(2):
+            with self.assertRaises(EmbedNotFoundException):
+                get_embed("www.test.com/missing", finder=self.dummy_finder)
+
+        self.assertEqual(self.found_urls, ["www.test.com/missing"] * 2)
+
+    @override_settings(WAGTAILEMBEDS_FINDERS=[])
+    def test_unsupported_provider_is_cached(self):
+        with self.assertRaises(EmbedUnsupportedProviderException):
+            get_embed("www.test.com/1234")
+
+        with self.assertNumQueries(0):
+            with self.assertRaises(EmbedUnsupportedProviderException):
+                get_embed("www.test.com/1234")
+
+    def test_expired_embeds_are_not_cached(self):
+        embed = get_embed("www.test.com/1234", finder=self.dummy_finder)
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+
+        get_embed("www.test.com/1234", finder=self.dummy_finder)
+        self.assertEqual(self.found_urls, ["www.test.com/1234"] * 2)
+
+    @override_settings(WAGTAILEMBEDS_CACHE=False)
+    def test_cache_disabled(self):
+        for i in range(2):
+            with self.assertRaises(EmbedNotFoundException):
+                get_embed("www.test.com/missing", finder=self.dummy_finder)
+
+        self.assertEqual(self.found_urls, ["www.test.com/missing"] * 2)
+
+
+class TestGetEmbeds(TestCase):
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        if "missing" in url:
+            raise EmbedNotFoundException
+
+        return {
+            "title": "Test: " + url,
+            "type": "video",
+            "width": max_width or 640,
+            "height": 480,
+            "html": "<p>Blah blah blah</p>",
+        }
+
+    def test_get_embeds(self):
+        stored = get_embed("www.test.com/1", max_width=400, finder=self.dummy_finder)
+
+        embeds = get_embeds(
+            ["www.test.com/2", "www.test.com/missing", "www.test.com/1"],
+            max_width=400,
+            finder=self.dummy_finder,
+        )
+
+        self.assertEqual(list(embeds), ["www.test.com/2", "www.test.com/1"])
+        self.assertEqual(embeds["www.test.com/1"], stored)
+        self.assertEqual(embeds["www.test.com/2"].title, "Test: www.test.com/2")
+        self.assertEqual(embeds["www.test.com/2"].width, 400)
+        self.assertTrue(
+            Embed.objects.filter(
+                hash=get_embed_hash("www.test.com/2", max_width=400)
+            ).exists()
+        )
+
+    def test_stored_embeds_are_fetched_in_one_query(self):
+        urls = ["www.test.com/%d" % i for i in range(5)]
+        for url in urls:
+            get_embed(url, finder=self.dummy_finder)
+
+        with self.assertNumQueries(1):
+            embeds = get_embeds(urls, finder=self.dummy_finder)
+        self.assertEqual(list(embeds), urls)
+
+    @override_settings(WAGTAILEMBEDS_FINDER_WORKERS=3)
+    def test_finders_are_called_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def finder(url, max_width=None, max_height=None):
+            # Only passes once all three URLs are being fetched at the same time
+            barrier.wait()
+            return self.dummy_finder(url, max_width, max_height)
+
+        urls = ["www.test.com/1", "www.test.com/2", "www.test.com/3"]
+        self.assertEqual(list(get_embeds(urls, finder=finder)), urls)
+
+
 class TestEmbedHash(TestCase):
     def test_get_embed_hash(self):
         url = "www.test.com/1234"
@@ -609,6 +757,83 @@ class TestOembed(TestCase):
         )
 
 
+class TestOEmbedProviderIndex(TestCase):
+    def get_endpoint_by_linear_scan(self, providers, url):
+        for provider in providers:
+            for pattern in provider["urls"]:
+                if re.match(pattern, url):
+                    return provider["endpoint"].replace("{format}", "json")
+
+    def test_matches_linear_scan(self):
+        index = get_provider_index(oembed_providers.all_providers)
+        for url in [
+            "http://www.youtube.com/watch/",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://vimeo.com/217403396",
+            "http://blip.tv/file/123",
+            "http://someone.blip.tv/file/123",
+            "https://twitter.com/wagtail/status/1234",
+            "https://www.pinterest.com/pin/1234/",
+            "https://uk.pinterest.co.uk/pin/1234/",
+            "https://fast.wistia.com/embed/medias/1234",
+            "https://www.flickr.com/photos/someone/1234/",
+            "https://soundcloud.com/someone/track",
+            "https://example.com/not-a-provider",
+            "https://youtube.com.example.com/watch?v=1",
+            "ftp://www.youtube.com/watch/",
+            "not a url",
+            "",
+        ]:
+            with self.subTest(url=url):
+                self.assertEqual(
+                    index.get_endpoint(url),
+                    self.get_endpoint_by_linear_scan(
+                        oembed_providers.all_providers, url
+                    ),
+                )
+
+    def test_first_matching_provider_wins(self):
+        wildcard = {"endpoint": "wildcard", "urls": [r"^https?://.+\.example\.com/.+$"]}
+        www = {"endpoint": "www", "urls": [r"^https?://www\.example\.com/.+$"]}
+        url = "https://www.example.com/embed"
+
+        self.assertEqual(
+            get_provider_index([wildcard, www]).get_endpoint(url), "wildcard"
+        )
+        self.assertEqual(get_provider_index([www, wildcard]).get_endpoint(url), "www")
+
+    def test_patterns_with_conflicting_groups(self):
+        providers = [
+            {"endpoint": "one", "urls": [r"^https?://example\.com/one/(?P<id>.+)$"]},
+            {"endpoint": "two", "urls": [r"^https?://example\.com/two/(?P<id>.+)$"]},
+        ]
+        index = get_provider_index(providers)
+        self.assertEqual(index.get_endpoint("https://example.com/one/1"), "one")
+        self.assertEqual(index.get_endpoint("https://example.com/two/1"), "two")
+
+    def test_get_pattern_host(self):
+        for pattern, host in [
+            (r"^https?://vimeo\.com/.+$", "vimeo.com"),
+            (r"^https?://(?:www\.)?circuitlab\.com/circuit/.+$", "circuitlab.com"),
+            (r"^https?://(?:www\.|m\.)?youtube\.com/watch.+$", "youtube.com"),
+            (r"^http://[-\w]+\.blip\.tv/.+$", "blip.tv"),
+            # Patterns where the host name can't be worked out are not indexed
+            (r"^https?://[-\w]+example\.com/.+$", None),
+            (r"^https?://(?:www|m\.)example\.com/.+$", None),
+            (r"^https?://example\.com|example\.org/.+$", None),
+            (r"^https?://example\.(?:com|org)/.+$", None),
+            (r"^https?://([^/]+\.)?(wistia.com|wi.st)/(medias|embed)/.+$", None),
+            (r"^.+$", None),
+        ]:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(get_pattern_host(pattern), host)
+
+    def test_index_is_shared_between_finders(self):
+        self.assertIs(OEmbedFinder()._provider_index, OEmbedFinder()._provider_index)
+
+
 class TestInstagramOEmbed(TestCase):
     def setUp(self):
         class DummyResponse:
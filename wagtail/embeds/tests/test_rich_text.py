@@ -121,25 +121,49 @@ class TestFrontendMediaEmbedHandler(TestCase):
         )
         self.assertEqual(result, "")
 
-    @patch("wagtail.embeds.embeds.get_embed")
-    def test_expand_html_escaping_end_to_end(self, get_embed):
-        get_embed.return_value = Embed(
-            url="http://www.youtube.com/watch/",
-            max_width=None,
-            type="video",
-            html="test html",
-            title="test title",
-            author_name="test author name",
-            provider_name="test provider name",
-            thumbnail_url="http://test/thumbnail.url",
-            width=1000,
-            height=1000,
-        )
+    @patch("wagtail.embeds.embeds.get_embeds")
+    def test_expand_html_escaping_end_to_end(self, get_embeds):
+        url = "https://www.youtube.com/watch?v=O7D-1RG-VRk&t=25"
+        get_embeds.return_value = {
+            url: Embed(
+                url=url,
+                max_width=None,
+                type="video",
+                html="test html",
+                title="test title",
+                author_name="test author name",
+                provider_name="test provider name",
+                thumbnail_url="http://test/thumbnail.url",
+                width=1000,
+                height=1000,
+            )
+        }
 
         result = expand_db_html(
             '<p>1 2 <embed embedtype="media" url="https://www.youtube.com/watch?v=O7D-1RG-VRk&amp;t=25" /> 3 4</p>'
         )
         self.assertIn("test html", result)
-        get_embed.assert_called_with(
-            "https://www.youtube.com/watch?v=O7D-1RG-VRk&t=25", None, None
+        get_embeds.assert_called_with([url], None, None)
+
+    @patch("wagtail.embeds.embeds.get_embeds")
+    def test_expand_db_attributes_many(self, get_embeds):
+        get_embeds.return_value = {
+            "http://www.youtube.com/watch/": Embed(
+                url="http://www.youtube.com/watch/", type="video", html="test html"
+            )
+        }
+
+        result = FrontendMediaEmbedHandler.expand_db_attributes_many(
+            [
+                {"url": "http://www.youtube.com/watch/"},
+                {"url": "http://www.example.com/not-found"},
+            ]
+        )
+        self.assertEqual(len(result), 2)
+        self.assertIn("test html", result[0])
+        self.assertEqual(result[1], "")
+        get_embeds.assert_called_once_with(
+            ["http://www.youtube.com/watch/", "http://www.example.com/not-found"],
+            None,
+            None,
         )
@@ -1,10 +1,20 @@
+import functools
+import inspect
+import threading
+import time
 from contextlib import ContextDecorator
 from operator import itemgetter
 
+from django.conf import settings
+
 from wagtail.utils.apps import get_app_submodules
 
 _hooks = {}
 
+# Sorted tuples of the functions registered for each hook, keyed by
+# (hook_name, instrumented). Entries are removed when a hook is registered.
+_compiled_hooks = {}
+
 
 def register(hook_name, fn=None, order=0):
     """
@@ -33,6 +43,7 @@ def register(hook_name, fn=None, order=0):
     if hook_name not in _hooks:
         _hooks[hook_name] = []
     _hooks[hook_name].append((fn, order))
+    _clear_compiled_hooks(hook_name)
 
 
 class TemporaryHook(ContextDecorator):
@@ -45,10 +56,12 @@ class TemporaryHook(ContextDecorator):
             if hook_name not in _hooks:
                 _hooks[hook_name] = []
             _hooks[hook_name].append((fn, self.order))
+            _clear_compiled_hooks(hook_name)
 
     def __exit__(self, exc_type, exc_value, traceback):
         for hook_name, fn in self.hooks:
             _hooks[hook_name].remove((fn, self.order))
+            _clear_compiled_hooks(hook_name)
 
 
 def register_temporarily(hook_name_or_hooks, fn=None, *, order=0):
@@ -110,6 +123,83 @@ def search_for_hooks():
 def get_hooks(hook_name):
     """Return the hooks function sorted by their order."""
     search_for_hooks()
-    hooks = _hooks.get(hook_name, [])
-    hooks = sorted(hooks, key=itemgetter(1))
-    return [hook[0] for hook in hooks]
+
+    key = (hook_name, hook_instrumentation_enabled())
+    try:
+        hooks = _compiled_hooks[key]
+    except KeyError:
+        hooks = _compiled_hooks[key] = _compile_hooks(*key)
+
+    # Return a copy, so that callers can't modify the compiled hooks
+    return list(hooks)
+
+
+def _compile_hooks(hook_name, instrumented):
+    hooks = sorted(_hooks.get(hook_name, []), key=itemgetter(1))
+    if instrumented:
+        return tuple(_instrument_hook(hook_name, hook[0]) for hook in hooks)
+    return tuple(hook[0] for hook in hooks)
+
+
+def _clear_compiled_hooks(hook_name):
+    _compiled_hooks.pop((hook_name, False), None)
+    _compiled_hooks.pop((hook_name, True), None)
+
+
+# Instrumentation
+
+_hook_stats = {}
+_hook_stats_lock = threading.Lock()
+
+
+def hook_instrumentation_enabled():
+    return getattr(settings, "WAGTAIL_HOOKS_INSTRUMENTATION", False)
+
+
+def _instrument_hook(hook_name, fn):
+    # Hooks may also register classes or other objects, which are returned as-is
+    if not inspect.isroutine(fn):
+        return fn
+
+    name = "{}.{}".format(fn.__module__, fn.__qualname__)
+
+    @functools.wraps(fn)
+    def instrumented_hook(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            with _hook_stats_lock:
+                calls, total_time = _hook_stats.get((hook_name, name), (0, 0.0))
+                _hook_stats[hook_name, name] = (calls + 1, total_time + duration)
+
+    return instrumented_hook
+
+
+def get_hook_stats():
+    """
+    Returns the number of calls to, and total time (in seconds) spent in, each
+    hook function since the stats were last reset, as a list of dicts with the
+    keys ``hook_name``, ``function``, ``calls`` and ``total_time``, slowest first.
+
+    Stats are only recorded when the ``WAGTAIL_HOOKS_INSTRUMENTATION`` setting
+    is ``True``.
+    """
+    with _hook_stats_lock:
+        stats = [
+            {
+                "hook_name": hook_name,
+                "function": function,
+                "calls": calls,
+                "total_time": total_time,
+            }
+            for (hook_name, function), (calls, total_time) in _hook_stats.items()
+        ]
+
+    return sorted(stats, key=itemgetter("total_time"), reverse=True)
+
+
+def reset_hook_stats():
+    with _hook_stats_lock:
+        _hook_stats.clear()
@@ -0,0 +1,133 @@
+"""
+Generation of image renditions outside of the request/response cycle.
+
+When ``WAGTAILIMAGES_BACKGROUND_RENDITIONS`` is enabled, the ``{% image %}`` tag
+does not wait for missing renditions to be generated. Instead, the rendition is
+queued for generation on a pool of worker threads, and a ``PlaceholderRendition``
+with the correct dimensions is output in its place. Subsequent page renders pick
+up the stored rendition once it exists.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.urls import NoReverseMatch
+
+from wagtail.images.models import AbstractRendition, get_filter
+
+logger = logging.getLogger("wagtail.images")
+
+# A transparent 1x1 GIF, stretched by the browser to the width and height
+# attributes when the dynamic serve view is not available
+PLACEHOLDER_IMAGE_URL = (
+    "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+_pending = set()
+
+
+def background_renditions_enabled():
+    return getattr(settings, "WAGTAILIMAGES_BACKGROUND_RENDITIONS", False)
+
+
+def get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(
+                    settings, "WAGTAILIMAGES_BACKGROUND_RENDITION_WORKERS", 2
+                ),
+                thread_name_prefix="wagtail-renditions",
+            )
+        return _executor
+
+
+def generate_rendition(image_model, image_id, filter_spec):
+    """
+    Generates and stores a rendition, logging any errors.
+    """
+    try:
+        image = image_model.objects.get(pk=image_id)
+        image.get_rendition(filter_spec)
+    except image_model.DoesNotExist:
+        pass
+    except Exception:
+        logger.exception(
+            "Failed to generate '%s' rendition for image %d in the background",
+            filter_spec,
+            image_id,
+        )
+    finally:
+        with _executor_lock:
+            _pending.discard((image_model, image_id, filter_spec))
+
+
+def _run_in_worker(image_model, image_id, filter_spec):
+    # Worker threads hold their own database connections, which need to be
+    # cleaned up in the same way as at the end of a request
+    close_old_connections()
+    try:
+        generate_rendition(image_model, image_id, filter_spec)
+    finally:
+        close_old_connections()
+
+
+def enqueue_rendition(image, filter):
+    """
+    Queues the given rendition for generation, unless it is already queued.
+    Returns True if the rendition was added to the queue.
+    """
+    key = (type(image), image.pk, filter.spec)
+
+    with _executor_lock:
+        if key in _pending:
+            return False
+        _pending.add(key)
+
+    get_executor().submit(_run_in_worker, *key)
+    return True
+
+
+class PlaceholderRendition:
+    """
+    Stands in for a rendition that has not yet been generated. Has the same
+    dimensions that the rendition will have, calculated from the stored
+    dimensions of the original image, and points to the dynamic serve view
+    (if configured) so that the browser still receives the final image.
+    """
+
+    is_placeholder = True
+    file = None
+
+    def __init__(self, image, filter):
+        self.image = image
+        self.filter_spec = filter.spec
+        self.focal_point_key = filter.get_cache_key(image)
+        self.width, self.height = filter.get_transform(image).size
+
+        from wagtail.images.views.serve import generate_image_url
+
+        try:
+            self.url = generate_image_url(image, filter.spec)
+        except NoReverseMatch:
+            self.url = PLACEHOLDER_IMAGE_URL
+
+    @property
+    def filter(self):
+        return get_filter(self.filter_spec)
+
+    alt = AbstractRendition.alt
+    attrs = AbstractRendition.attrs
+    attrs_dict = AbstractRendition.attrs_dict
+    full_url = AbstractRendition.full_url
+    focal_point = AbstractRendition.focal_point
+    background_position_style = AbstractRendition.background_position_style
+    img_tag = AbstractRendition.img_tag
+    __html__ = AbstractRendition.__html__
@@ -3,7 +3,7 @@ import re
 from django import template
 from jinja2.ext import Extension
 
-from .shortcuts import get_rendition_or_not_found
+from .shortcuts import get_rendition_or_placeholder
 from .templatetags.wagtailimages_tags import image_url
 
 allowed_filter_pattern = re.compile(r"^[A-Za-z0-9_\-\.\|]+$")
@@ -19,7 +19,7 @@ def image(image, filterspec, **attrs):
             "(given filter: {})".format(filterspec)
         )
 
-    rendition = get_rendition_or_not_found(image, filterspec)
+    rendition = get_rendition_or_placeholder(image, filterspec)
 
     if attrs:
         return rendition.img_tag(attrs)
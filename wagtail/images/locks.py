@@ -0,0 +1,156 @@
+"""
+Locks used to ensure that only one worker generates a given rendition at a time.
+
+When a new image is first requested at a popular URL, many requests can miss the
+rendition lookup at once. Without coordination, each of them decodes and encodes
+the same image only for all but one of the results to be discarded. The lock
+returned by ``rendition_lock`` lets one worker do the work while the others wait
+and then pick up the stored rendition.
+
+An in-process lock is always taken. For multi-process deployments, the
+``WAGTAILIMAGES_RENDITION_LOCK`` setting can additionally be set to ``"cache"``
+(using the ``renditions`` cache if configured, otherwise ``default``) or to
+``"database"`` (a PostgreSQL advisory lock; ignored on other databases).
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.db import connection
+
+_process_locks = {}
+_process_locks_guard = threading.Lock()
+
+
+def get_rendition_lock_key(image, filter_spec, focal_point_key):
+    return "wagtail-rendition-lock-{}-{}-{}-{}".format(
+        image._meta.label_lower, image.pk, focal_point_key, filter_spec
+    )
+
+
+def get_lock_timeout():
+    return getattr(settings, "WAGTAILIMAGES_RENDITION_LOCK_TIMEOUT", 30)
+
+
+@contextmanager
+def _process_lock(key):
+    with _process_locks_guard:
+        lock, waiters = _process_locks.get(key, (None, 0))
+        if lock is None:
+            lock = threading.Lock()
+        _process_locks[key] = (lock, waiters + 1)
+
+    try:
+        acquired = lock.acquire(blocking=False)
+        waited = not acquired
+        if waited:
+            # Proceed even if the timeout expires; callers must cope with
+            # generating the rendition themselves
+            acquired = lock.acquire(timeout=get_lock_timeout())
+
+        try:
+            yield waited
+        finally:
+            if acquired:
+                lock.release()
+    finally:
+        with _process_locks_guard:
+            lock, waiters = _process_locks[key]
+            if waiters == 1:
+                del _process_locks[key]
+            else:
+                _process_locks[key] = (lock, waiters - 1)
+
+
+def _get_lock_cache():
+    try:
+        return caches["renditions"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+@contextmanager
+def _cache_lock(key, poll_interval=0.05):
+    cache = _get_lock_cache()
+    timeout = get_lock_timeout()
+    token = uuid.uuid4().hex
+
+    acquired = cache.add(key, token, timeout)
+    waited = not acquired
+    deadline = time.monotonic() + timeout
+
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        acquired = cache.add(key, token, timeout)
+
+    try:
+        yield waited
+    finally:
+        # Only release a lock we still own (it may have expired and been
+        # taken by another worker in the meantime)
+        if acquired and cache.get(key) == token:
+            cache.delete(key)
+
+
+@contextmanager
+def _database_lock(key, poll_interval=0.05):
+    if connection.vendor != "postgresql":
+        yield False
+        return
+
+    # Advisory locks are identified by a signed 64-bit integer
+    lock_id = int.from_bytes(
+        hashlib.sha1(key.encode("utf-8")).digest()[:8], "big", signed=True
+    )
+
+    def try_lock():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+            return cursor.fetchone()[0]
+
+    acquired = try_lock()
+    waited = not acquired
+    deadline = time.monotonic() + get_lock_timeout()
+
+    # Proceed without the lock if the timeout expires, so that a stuck worker
+    # doesn't block requests for the rendition indefinitely
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        acquired = try_lock()
+
+    try:
+        yield waited
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+@contextmanager
+def rendition_lock(image, filter_spec, focal_point_key):
+    """
+    Context manager that serialises generation of a single rendition.
+
+    Yields ``True`` if another worker held the lock when it was requested, in
+    which case the caller should check whether that worker has already created
+    the rendition before generating it again.
+    """
+    key = get_rendition_lock_key(image, filter_spec, focal_point_key)
+    backend = getattr(settings, "WAGTAILIMAGES_RENDITION_LOCK", None)
+
+    with _process_lock(key) as waited:
+        if backend == "cache":
+            shared_lock = _cache_lock(key)
+        elif backend == "database":
+            shared_lock = _database_lock(key)
+        else:
+            yield waited
+            return
+
+        with shared_lock as shared_waited:
+            yield waited or shared_waited
@@ -0,0 +1,33 @@
+# Generated by Django 4.0.10 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailimages", "0024_index_image_file_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="color_mode",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="exif_orientation",
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="file_format",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="image",
+            name="is_animated",
+            field=models.BooleanField(editable=False, null=True),
+        ),
+    ]
@@ -4,6 +4,7 @@ import os.path
 import time
 from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
 from io import BytesIO
 from typing import Union
 
@@ -34,6 +35,7 @@ from wagtail.images.image_operations import (
     ImageTransform,
     TransformOperation,
 )
+from wagtail.images.locks import rendition_lock
 from wagtail.images.rect import Rect
 from wagtail.models import CollectionMember
 from wagtail.search import index
@@ -200,11 +202,71 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         max_length=40, blank=True, editable=False, db_index=True
     )
 
+    # Metadata read from the file at upload time, so that renditions can be
+    # planned without opening the original file
+    file_format = models.CharField(max_length=10, blank=True, editable=False)
+    exif_orientation = models.PositiveSmallIntegerField(null=True, editable=False)
+    color_mode = models.CharField(max_length=10, blank=True, editable=False)
+    is_animated = models.BooleanField(null=True, editable=False)
+
     objects = ImageQuerySet.as_manager()
 
     def _set_file_hash(self, file_contents):
         self.file_hash = hashlib.sha1(file_contents).hexdigest()
 
+    def _set_image_metadata(self, image_file):
+        image_file.seek(0)
+        self._set_image_metadata_from_willow(WillowImage.open(image_file))
+        image_file.seek(0)
+
+    def _set_image_metadata_from_willow(self, willow):
+        self.file_format = willow.format_name
+
+        pillow_image = willow.get_pillow_image()
+        self.color_mode = pillow_image.mode
+        self.is_animated = getattr(pillow_image, "is_animated", False)
+
+        try:
+            # 0x0112 = Orientation
+            orientation = pillow_image.getexif().get(0x0112, 1)
+        except Exception:
+            # Blanket cover all the ways reading EXIF data can fail
+            orientation = 1
+        self.exif_orientation = orientation if 1 <= orientation <= 8 else 1
+
+    def has_image_metadata(self):
+        return bool(self.file_format) and self.exif_orientation is not None
+
+    def get_oriented_size(self):
+        """
+        Returns the size of the image once its EXIF orientation has been
+        applied, as used when generating renditions
+        """
+        # Orientations 5-8 are rotated by 90 degrees
+        if self.exif_orientation is not None and self.exif_orientation >= 5:
+            return (self.height, self.width)
+        return (self.width, self.height)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if (
+            self.file
+            and not self.file._committed
+            and (update_fields is None or "file" in update_fields)
+        ):
+            # A new file has been assigned and is about to be stored, so record its
+            # metadata while it is at hand
+            self._set_image_metadata(self.file)
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {
+                    "file_format",
+                    "exif_orientation",
+                    "color_mode",
+                    "is_animated",
+                }
+
+        super().save(*args, **kwargs)
+
     def get_file_hash(self):
         if self.file_hash == "":
             with self.open_file() as f:
@@ -341,7 +403,7 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         model will be returned.
         """
         if isinstance(filter, str):
-            filter = Filter(spec=filter)
+            filter = get_filter(filter)
 
         Rendition = self.get_rendition_model()
 
@@ -421,13 +483,29 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         Note: If using custom image models, an instance of the custom rendition
         model will be returned.
         """
-        # Because of unique constraints applied to the model, we use
-        # get_or_create() to guard against race conditions
-        rendition, created = self.renditions.get_or_create(
-            filter_spec=filter.spec,
-            focal_point_key=filter.get_cache_key(self),
-            defaults={"file": self.generate_rendition_file(filter)},
-        )
+        Rendition = self.get_rendition_model()
+        cache_key = filter.get_cache_key(self)
+
+        # Only allow one worker to generate a given rendition at a time, so
+        # that concurrent requests for a new image don't all do the same work
+        with rendition_lock(self, filter.spec, cache_key) as waited:
+            if waited:
+                # Another worker held the lock, so has probably created the
+                # rendition already
+                try:
+                    return self.renditions.filter(
+                        filter_spec=filter.spec, focal_point_key=cache_key
+                    ).get()
+                except Rendition.DoesNotExist:
+                    pass
+
+            # Because of unique constraints applied to the model, we use
+            # get_or_create() to guard against race conditions
+            rendition, created = self.renditions.get_or_create(
+                filter_spec=filter.spec,
+                focal_point_key=cache_key,
+                defaults={"file": self.generate_rendition_file(filter)},
+            )
         return rendition
 
     def generate_rendition_file(self, filter: "Filter") -> File:
@@ -570,7 +648,7 @@ class Filter:
             operations.append(op_class(*op_spec_parts))
         return operations
 
-    @property
+    @cached_property
     def transform_operations(self):
         return [
             operation
@@ -578,7 +656,7 @@ class Filter:
             if isinstance(operation, TransformOperation)
         ]
 
-    @property
+    @cached_property
     def filter_operations(self):
         return [
             operation
@@ -586,6 +664,18 @@ class Filter:
             if isinstance(operation, FilterOperation)
         ]
 
+    @cached_property
+    def vary_fields(self):
+        """
+        The image fields that renditions made with this filter depend on, other
+        than the image file itself (such as the focal point)
+        """
+        return [
+            field
+            for operation in self.operations
+            for field in getattr(operation, "vary_fields", [])
+        ]
+
     def get_transform(self, image, size=None):
         """
         Returns an ImageTransform with all the transforms in this filter applied.
@@ -597,7 +687,7 @@ class Filter:
         """
 
         if not size:
-            size = (image.width, image.height)
+            size = image.get_oriented_size()
 
         transform = ImageTransform(size)
         for operation in self.transform_operations:
@@ -605,16 +695,26 @@ class Filter:
         return transform
 
     def run(self, image, output):
+        has_metadata = image.has_image_metadata()
+        if has_metadata:
+            # Plan the transform from stored metadata before opening the file
+            transform = self.get_transform(image)
+
         with image.get_willow_image() as willow:
             original_format = willow.format_name
 
+            if not has_metadata:
+                # Images stored before metadata was recorded on save
+                image._set_image_metadata_from_willow(willow)
+
             # Fix orientation of image
-            willow = willow.auto_orient()
+            if image.exif_orientation != 1:
+                willow = willow.auto_orient()
+
+            if not has_metadata:
+                # Transform the image
+                transform = self.get_transform(image, willow.get_size())
 
-            # Transform the image
-            transform = self.get_transform(
-                image, (willow.image.width, willow.image.height)
-            )
             willow = willow.crop(transform.get_rect().round())
             willow = willow.resize(transform.size)
 
@@ -685,14 +785,11 @@ class Filter:
             )
 
     def get_cache_key(self, image):
-        vary_parts = []
-
-        for operation in self.operations:
-            for field in getattr(operation, "vary_fields", []):
-                value = getattr(image, field, "")
-                vary_parts.append(str(value))
+        vary_fields = self.vary_fields
+        if not vary_fields:
+            return ""
 
-        vary_string = "-".join(vary_parts)
+        vary_string = "-".join(str(getattr(image, field, "")) for field in vary_fields)
 
         # Return blank string if there are no vary fields
         if not vary_string:
@@ -701,6 +798,19 @@ class Filter:
         return hashlib.sha1(vary_string.encode("utf-8")).hexdigest()[:8]
 
 
+@lru_cache(maxsize=1000)
+def get_filter(spec):
+    """
+    Returns a Filter for the given spec, shared with all other callers in this
+    process that use the same spec. Because Filter caches its parsed operations,
+    this avoids parsing the same spec every time it is used (for example, for
+    each image in a listing).
+
+    Filters returned by this function must not be modified.
+    """
+    return Filter(spec=spec)
+
+
 class AbstractRendition(ImageFileMixin, models.Model):
     filter_spec = models.CharField(max_length=255, db_index=True)
     file = models.ImageField(
@@ -754,7 +864,7 @@ class AbstractRendition(ImageFileMixin, models.Model):
 
     @property
     def filter(self):
-        return Filter(self.filter_spec)
+        return get_filter(self.filter_spec)
 
     @cached_property
     def focal_point(self):
@@ -1,7 +1,9 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch, prefetch_related_objects
 
 from wagtail.images import get_image_model
 from wagtail.images.formats import get_image_format
+from wagtail.images.models import get_filter
 from wagtail.rich_text import EmbedHandler
 
 # Front-end conversion
@@ -27,3 +29,44 @@ class ImageEmbedHandler(EmbedHandler):
 
         image_format = get_image_format(attrs["format"])
         return image_format.image_to_html(image, attrs.get("alt", ""))
+
+    @classmethod
+    def get_many(cls, attrs_list):
+        images = cls.get_model()._default_manager.in_bulk(cls.get_ids(attrs_list))
+
+        # Prefetch the renditions that the image formats use, so that existing ones can be
+        # found without a query per image
+        filters = {
+            get_filter(get_image_format(attrs["format"]).filter_spec)
+            for attrs in attrs_list
+            if "format" in attrs
+        }
+        if images and filters:
+            renditions = (
+                cls.get_model()
+                .get_rendition_model()
+                .objects.filter(
+                    filter_spec__in=[filter.spec for filter in filters],
+                    focal_point_key__in={
+                        filter.get_cache_key(image)
+                        for filter in filters
+                        for image in images.values()
+                    },
+                )
+            )
+            prefetch_related_objects(
+                list(images.values()), Prefetch("renditions", queryset=renditions)
+            )
+
+        return cls.map_instances(attrs_list, images)
+
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list):
+        html = []
+        for attrs, image in zip(attrs_list, cls.get_many(attrs_list)):
+            if image is None:
+                html.append('<img alt="">')
+            else:
+                image_format = get_image_format(attrs["format"])
+                html.append(image_format.image_to_html(image, attrs.get("alt", "")))
+        return html
@@ -1,4 +1,4 @@
-from wagtail.images.models import SourceImageIOError
+from wagtail.images.models import SourceImageIOError, get_filter
 
 
 def get_rendition_or_not_found(image, specs):
@@ -21,3 +21,33 @@ def get_rendition_or_not_found(image, specs):
         rendition = Rendition(image=image, width=0, height=0)
         rendition.file.name = "not-found"
         return rendition
+
+
+def get_rendition_or_placeholder(image, specs):
+    """
+    Like ``get_rendition_or_not_found``, but when background rendition generation
+    is enabled, a missing rendition is queued for generation and a placeholder
+    with the same dimensions is returned instead of generating it immediately.
+
+    :param image: AbstractImage
+    :param specs: str or Filter
+    :return: Rendition or PlaceholderRendition
+    """
+    from wagtail.images.background import (
+        PlaceholderRendition,
+        background_renditions_enabled,
+        enqueue_rendition,
+    )
+
+    if not background_renditions_enabled():
+        return get_rendition_or_not_found(image, specs)
+
+    if isinstance(specs, str):
+        specs = get_filter(specs)
+
+    Rendition = image.get_rendition_model()
+    try:
+        return image.find_existing_rendition(specs)
+    except Rendition.DoesNotExist:
+        enqueue_rendition(image, specs)
+        return PlaceholderRendition(image, specs)
@@ -5,9 +5,10 @@ from django.core.exceptions import ImproperlyConfigured
 from django.urls import NoReverseMatch
 from django.utils.functional import cached_property
 
-from wagtail.images.models import Filter
-from wagtail.images.shortcuts import get_rendition_or_not_found
+from wagtail.images.models import get_filter
+from wagtail.images.shortcuts import get_rendition_or_placeholder
 from wagtail.images.views.serve import generate_image_url
+from wagtail.profiling import profile_phase
 
 register = template.Library()
 allowed_filter_pattern = re.compile(r"^[A-Za-z0-9_\-\.]+$")
@@ -94,7 +95,7 @@ class ImageNode(template.Node):
 
     @cached_property
     def filter(self):
-        return Filter(spec=self.filter_spec)
+        return get_filter(self.filter_spec)
 
     def render(self, context):
         try:
@@ -110,7 +111,8 @@ class ImageNode(template.Node):
         if not hasattr(image, "get_rendition"):
             raise ValueError("image tag expected an Image object, got %r" % image)
 
-        rendition = get_rendition_or_not_found(image, self.filter)
+        with profile_phase("image"):
+            rendition = get_rendition_or_placeholder(image, self.filter)
 
         if self.output_var_name:
             # return the rendition object in the given variable
@@ -0,0 +1,247 @@
+"""
+Benchmarks for the rendition pipeline, run with ``runtests.py --bench``.
+
+These run ``Filter.run`` directly on a corpus of synthetic images held in
+memory, so they measure image processing alone, without the database or file
+storage. The corpus can be adjusted with the following environment variables:
+
+- ``WAGTAIL_BENCHMARK_IMAGE_FORMATS`` - comma-separated input formats
+  (default: all of jpeg, png, webp, gif and avif that Pillow can write)
+- ``WAGTAIL_BENCHMARK_IMAGE_SIZES`` - comma-separated sizes (default: 640x480,2400x1600)
+- ``WAGTAIL_BENCHMARK_RENDITION_WORKERS`` - comma-separated numbers of worker
+  threads to compare against serial generation (default: 1,2,4)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import PIL.Image
+import PIL.ImageDraw
+from django.core.files.images import ImageFile
+from django.test import SimpleTestCase
+
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+from wagtail.test.benchmark import write_result
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Filter specs covering each kind of operation and output encoder
+FILTER_SPECS = [
+    "original",
+    "max-800x600",
+    "width-400",
+    "fill-300x300",
+    "fill-300x300-c75",
+    "width-400|format-jpeg|jpegquality-60",
+    "width-400|format-png",
+    "width-400|format-webp",
+    "width-400|format-webp-lossless",
+]
+
+PILLOW_FORMATS = {
+    "jpeg": "JPEG",
+    "png": "PNG",
+    "webp": "WEBP",
+    "gif": "GIF",
+    "avif": "AVIF",
+}
+
+
+def get_corpus_formats():
+    PIL.Image.init()
+    formats = os.environ.get("WAGTAIL_BENCHMARK_IMAGE_FORMATS")
+    if formats:
+        return formats.split(",")
+    return [
+        name
+        for name, pillow_format in PILLOW_FORMATS.items()
+        if pillow_format in PIL.Image.SAVE
+    ]
+
+
+def get_corpus_sizes():
+    sizes = os.environ.get("WAGTAIL_BENCHMARK_IMAGE_SIZES", "640x480,2400x1600")
+    return [tuple(int(d) for d in size.split("x")) for size in sizes.split(",")]
+
+
+def get_worker_counts():
+    workers = os.environ.get("WAGTAIL_BENCHMARK_RENDITION_WORKERS", "1,2,4")
+    return [int(count) for count in workers.split(",")]
+
+
+def make_image_data(file_format, size):
+    """
+    Returns the bytes of a synthetic photo-like image, with a gradient and
+    noise so that the encoders have realistic amounts of detail to compress
+    """
+    width, height = size
+    image = PIL.Image.merge(
+        "RGB",
+        [
+            PIL.Image.linear_gradient("L").resize(size),
+            PIL.Image.effect_noise(size, 64),
+            PIL.Image.linear_gradient("L").rotate(90).resize(size),
+        ],
+    )
+    draw = PIL.ImageDraw.Draw(image)
+    draw.ellipse(
+        (width // 4, height // 4, width * 3 // 4, height * 3 // 4), fill="white"
+    )
+
+    if file_format == "png":
+        image = image.convert("RGBA")
+    elif file_format == "gif":
+        image = image.convert("P")
+
+    f = BytesIO()
+    image.save(f, PILLOW_FORMATS[file_format])
+    return f.getvalue()
+
+
+def make_image(file_format, size, data):
+    """
+    Returns an unsaved image instance for the given file data, with a focal
+    point in the top-left quarter so that focal point cropping has an effect
+    """
+    width, height = size
+    return get_image_model()(
+        title="Benchmark",
+        # Skip looking up the default collection, as the image is never saved
+        collection_id=None,
+        file=ImageFile(BytesIO(data), name="benchmark." + file_format),
+        width=width,
+        height=height,
+        focal_point_x=width // 4,
+        focal_point_y=height // 4,
+        focal_point_width=width // 8,
+        focal_point_height=height // 8,
+    )
+
+
+def get_peak_rss():
+    # In kilobytes on Linux, bytes on macOS
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class RenditionBenchmark:
+    repeat = 5
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.corpus = [
+            (file_format, size, make_image_data(file_format, size))
+            for file_format in get_corpus_formats()
+            for size in get_corpus_sizes()
+        ]
+
+    def report(self, name, renditions, duration, **extra):
+        print(  # NOQA
+            "%-70s %10.1f renditions/s %9.3fms each"
+            % (name, renditions / duration, duration * 1000 / renditions)
+        )
+        write_result(
+            dict(
+                name="{}.{}[{}]".format(
+                    type(self).__module__, type(self).__qualname__, name
+                ),
+                repeat=renditions,
+                time_median=duration / renditions,
+                renditions_per_second=renditions / duration,
+                peak_rss=get_peak_rss(),
+                queries_max=0,
+                **extra,
+            )
+        )
+
+
+class BenchFilterRun(RenditionBenchmark, SimpleTestCase):
+    """
+    Times Filter.run for each input format, size and filter spec, to give a
+    breakdown of the cost of each operation and output encoder
+    """
+
+    def test(self):
+        peak_rss_before = get_peak_rss()
+
+        for file_format, size, data in self.corpus:
+            for spec in FILTER_SPECS:
+                filter = Filter(spec)
+                duration = 0
+
+                for i in range(self.repeat):
+                    image = make_image(file_format, size, data)
+                    start_time = time.perf_counter()
+                    filter.run(image, BytesIO())
+                    duration += time.perf_counter() - start_time
+
+                self.report(
+                    "%s %dx%d %s" % (file_format, *size, spec), self.repeat, duration
+                )
+
+        if peak_rss_before is not None:
+            print("peak RSS:", peak_rss_before, "->", get_peak_rss())  # NOQA
+
+
+class BenchTransform(RenditionBenchmark, SimpleTestCase):
+    """
+    Times the ImageTransform / Rect calculations of each filter spec on their
+    own, without opening or encoding the image
+    """
+
+    repeat = 10000
+
+    def test(self):
+        file_format, size, data = self.corpus[0]
+        image = make_image(file_format, size, data)
+
+        for spec in FILTER_SPECS:
+            filter = Filter(spec)
+            start_time = time.perf_counter()
+
+            for i in range(self.repeat):
+                filter.get_transform(image, size).get_rect().round()
+
+            self.report(
+                "transform %s" % spec, self.repeat, time.perf_counter() - start_time
+            )
+
+
+class BenchPooledRenditions(RenditionBenchmark, SimpleTestCase):
+    """
+    Compares generating a batch of renditions serially with generating them on
+    pools of worker threads of different sizes, to help with sizing workers
+    (such as WAGTAILIMAGES_BACKGROUND_RENDITION_WORKERS)
+    """
+
+    def generate(self, task):
+        file_format, size, data, spec = task
+        Filter(spec).run(make_image(file_format, size, data), BytesIO())
+
+    def test(self):
+        tasks = [
+            (file_format, size, data, spec)
+            for file_format, size, data in self.corpus
+            for spec in FILTER_SPECS
+        ] * self.repeat
+
+        start_time = time.perf_counter()
+        for task in tasks:
+            self.generate(task)
+        self.report("serial", len(tasks), time.perf_counter() - start_time)
+
+        for workers in get_worker_counts():
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                start_time = time.perf_counter()
+                list(executor.map(self.generate, tasks))
+                duration = time.perf_counter() - start_time
+
+            self.report("%d workers" % workers, len(tasks), duration, workers=workers)
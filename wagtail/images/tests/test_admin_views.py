@@ -315,6 +315,12 @@ class TestImageAddView(TestCase, WagtailTestUtils):
         self.assertTrue(image.file_size)
         self.assertTrue(image.file_hash)
 
+        # Test that the image metadata was recorded
+        self.assertEqual(image.file_format, "png")
+        self.assertEqual(image.exif_orientation, 1)
+        self.assertEqual(image.color_mode, "RGBA")
+        self.assertFalse(image.is_animated)
+
         # Test that it was placed in the root collection
         root_collection = Collection.get_first_root_node()
         self.assertEqual(image.collection, root_collection)
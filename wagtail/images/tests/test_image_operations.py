@@ -10,7 +10,7 @@ from wagtail.images.exceptions import (
     UnknownOutputImageFormatError,
 )
 from wagtail.images.image_operations import TransformOperation
-from wagtail.images.models import Filter, Image
+from wagtail.images.models import Filter, Image, get_filter
 from wagtail.images.tests.utils import (
     get_test_image_file,
     get_test_image_file_jpeg,
@@ -571,6 +571,52 @@ class TestCacheKey(TestCase):
         self.assertEqual(cache_key, "0bbe3b2f")
 
 
+class TestGetFilter(TestCase):
+    def test_filters_are_shared(self):
+        fil = get_filter("fill-100x100|jpegquality-40")
+        self.assertIs(get_filter("fill-100x100|jpegquality-40"), fil)
+        self.assertIsNot(get_filter("fill-100x101|jpegquality-40"), fil)
+
+    def test_operations_are_parsed_once(self):
+        fil = get_filter("width-123|format-webp")
+        fil.operations
+
+        with patch("wagtail.images.models.hooks.get_hooks") as get_hooks:
+            operations = get_filter("width-123|format-webp").operations
+            self.assertEqual(len(operations), 2)
+            self.assertEqual(len(fil.transform_operations), 1)
+            self.assertEqual(len(fil.filter_operations), 1)
+        get_hooks.assert_not_called()
+
+    def test_vary_fields(self):
+        self.assertEqual(get_filter("max-100x100").vary_fields, [])
+        self.assertEqual(
+            get_filter("fill-100x100").vary_fields,
+            [
+                "focal_point_width",
+                "focal_point_height",
+                "focal_point_x",
+                "focal_point_y",
+            ],
+        )
+
+    def test_invalid_spec(self):
+        with self.assertRaises(InvalidFilterSpecError):
+            get_filter("notanoperation-100").operations
+
+        # Still raises when used again
+        with self.assertRaises(InvalidFilterSpecError):
+            get_filter("notanoperation-100").operations
+
+    def test_get_rendition_uses_shared_filter(self):
+        image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        rendition = image.get_rendition("width-123")
+        self.assertIs(rendition.filter, get_filter("width-123"))
+
+
 class DummyOperation(TransformOperation):
     def construct(self):
         pass
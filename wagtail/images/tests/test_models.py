@@ -1,4 +1,7 @@
+import threading
 import unittest
+from io import BytesIO
+from unittest import mock
 
 from django.contrib.auth.models import Group, Permission
 from django.core.cache import caches
@@ -11,7 +14,13 @@ from django.test.utils import override_settings
 from django.urls import reverse
 from willow.image import Image as WillowImage
 
-from wagtail.images.models import Rendition, SourceImageIOError, get_rendition_storage
+from wagtail.images.locks import get_rendition_lock_key, rendition_lock
+from wagtail.images.models import (
+    Filter,
+    Rendition,
+    SourceImageIOError,
+    get_rendition_storage,
+)
 from wagtail.images.rect import Rect
 from wagtail.models import Collection, GroupCollectionPermission, Page
 from wagtail.test.testapp.models import (
@@ -684,6 +693,106 @@ class TestIssue312(TestCase):
         )
 
 
+class TestRenditionLock(TestCase):
+    def setUp(self):
+        self.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+
+    def test_uncontended_lock_does_not_wait(self):
+        with rendition_lock(self.image, "width-400", "") as waited:
+            self.assertFalse(waited)
+
+    def test_contended_lock_waits_for_holder(self):
+        events = []
+        holder_ready = threading.Event()
+        release_holder = threading.Event()
+
+        def hold_lock():
+            with rendition_lock(self.image, "width-400", ""):
+                holder_ready.set()
+                release_holder.wait()
+                events.append("holder released")
+
+        def wait_for_lock():
+            with rendition_lock(self.image, "width-400", "") as waited:
+                events.append(("waiter acquired", waited))
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        holder_ready.wait()
+
+        waiter = threading.Thread(target=wait_for_lock)
+        waiter.start()
+        release_holder.set()
+        holder.join()
+        waiter.join()
+
+        self.assertEqual(events, ["holder released", ("waiter acquired", True)])
+
+    def test_different_renditions_do_not_contend(self):
+        with rendition_lock(self.image, "width-400", ""):
+            with rendition_lock(self.image, "width-200", "") as waited:
+                self.assertFalse(waited)
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_LOCK="cache",
+        WAGTAILIMAGES_RENDITION_LOCK_TIMEOUT=1,
+    )
+    def test_cache_lock(self):
+        cache = caches["default"]
+        key = get_rendition_lock_key(self.image, "width-400", "")
+
+        with rendition_lock(self.image, "width-400", "") as waited:
+            self.assertFalse(waited)
+            self.assertIsNotNone(cache.get(key))
+
+        # The lock is released on exit
+        self.assertIsNone(cache.get(key))
+
+        # A lock held by another process is waited on, until the timeout
+        cache.add(key, "another-process")
+        with rendition_lock(self.image, "width-400", "") as waited:
+            self.assertTrue(waited)
+
+        # ...and not released by a worker that doesn't own it
+        self.assertEqual(cache.get(key), "another-process")
+        cache.delete(key)
+
+    @override_settings(
+        WAGTAILIMAGES_RENDITION_LOCK="database",
+        WAGTAILIMAGES_RENDITION_LOCK_TIMEOUT=0.2,
+    )
+    def test_database_lock_times_out(self):
+        with mock.patch("wagtail.images.locks.connection") as mock_connection:
+            mock_connection.vendor = "postgresql"
+            cursor = mock_connection.cursor.return_value.__enter__.return_value
+            # The advisory lock is held by a stuck worker
+            cursor.fetchone.return_value = (False,)
+
+            with rendition_lock(self.image, "width-400", "") as waited:
+                self.assertTrue(waited)
+
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertGreater(len(executed), 1)
+        self.assertTrue(
+            all(sql == "SELECT pg_try_advisory_lock(%s)" for sql in executed)
+        )
+
+    def test_waiter_reuses_rendition_created_by_holder(self):
+        rendition = self.image.get_rendition("width-400")
+
+        with mock.patch("wagtail.images.models.rendition_lock") as mock_lock:
+            mock_lock.return_value.__enter__.return_value = True
+            with mock.patch.object(Image, "generate_rendition_file") as mock_generate:
+                self.assertEqual(
+                    self.image.create_rendition(Filter("width-400")), rendition
+                )
+
+        mock_generate.assert_not_called()
+
+
 class TestFilenameReduction(TestCase):
     """
     This tests for a bug which results in filenames without extensions
@@ -723,6 +832,87 @@ class TestFilenameReduction(TestCase):
         )
 
 
+class TestImageMetadata(TestCase):
+    def test_set_image_metadata(self):
+        image = Image(title="Test image", file=get_test_image_file())
+        self.assertFalse(image.has_image_metadata())
+
+        image._set_image_metadata(image.file)
+
+        self.assertTrue(image.has_image_metadata())
+        self.assertEqual(image.file_format, "png")
+        self.assertEqual(image.exif_orientation, 1)
+        self.assertEqual(image.color_mode, "RGBA")
+        self.assertFalse(image.is_animated)
+
+    def test_set_image_metadata_with_exif_orientation(self):
+        with open("wagtail/images/tests/image_files/landscape_6.jpg", "rb") as f:
+            image = Image(title="Test image", file=File(f))
+            image._set_image_metadata(image.file)
+
+        self.assertEqual(image.file_format, "jpeg")
+        self.assertEqual(image.exif_orientation, 6)
+        self.assertEqual(image.color_mode, "RGB")
+
+        # The rotation is reflected in the oriented size
+        self.assertEqual((image.width, image.height), (450, 600))
+        self.assertEqual(image.get_oriented_size(), (600, 450))
+
+    def test_get_oriented_size_without_metadata(self):
+        image = Image(title="Test image", width=450, height=600)
+        self.assertEqual(image.get_oriented_size(), (450, 600))
+
+    def test_rendition_planned_from_metadata(self):
+        with open("wagtail/images/tests/image_files/landscape_6.jpg", "rb") as f:
+            image = Image(title="Test image", file=File(f))
+            image._set_image_metadata(image.file)
+            image.save()
+
+        # The transform is calculated before the file is opened
+        with mock.patch.object(
+            Image, "get_willow_image", side_effect=SourceImageIOError
+        ):
+            with self.assertRaises(SourceImageIOError):
+                Filter("fill-100x100-c200").run(image, BytesIO())
+
+        rendition = image.get_rendition("width-300")
+        self.assertEqual((rendition.width, rendition.height), (300, 225))
+
+    def test_metadata_recorded_on_save(self):
+        image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+        image.refresh_from_db()
+        self.assertTrue(image.has_image_metadata())
+        self.assertEqual(image.file_format, "png")
+
+        # Replacing the file records the new file's metadata
+        with open("wagtail/images/tests/image_files/landscape_6.jpg", "rb") as f:
+            image.file = File(f)
+            image.save(update_fields=["file"])
+
+        image.refresh_from_db()
+        self.assertEqual(image.file_format, "jpeg")
+        self.assertEqual(image.exif_orientation, 6)
+
+    def test_rendition_without_metadata(self):
+        # Images stored before metadata was recorded on save
+        with open("wagtail/images/tests/image_files/landscape_6.jpg", "rb") as f:
+            image = Image.objects.create(title="Test image", file=File(f))
+        Image.objects.filter(pk=image.pk).update(
+            file_format="", exif_orientation=None, color_mode="", is_animated=None
+        )
+        image.refresh_from_db()
+
+        rendition = image.get_rendition("width-300")
+        self.assertEqual((rendition.width, rendition.height), (300, 225))
+
+        # Generating a rendition doesn't write to the image
+        image.refresh_from_db()
+        self.assertFalse(image.has_image_metadata())
+
+
 class TestRenditionOrientation(TestCase):
     """
     This tests for a bug where images with exif orientations which
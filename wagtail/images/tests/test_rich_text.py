@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
 from django.test import TestCase
 
+from wagtail.images.formats import get_image_format
 from wagtail.images.rich_text import ImageEmbedHandler as FrontendImageEmbedHandler
 from wagtail.images.rich_text.editor_html import (
     ImageEmbedHandler as EditorHtmlImageEmbedHandler,
@@ -129,3 +130,19 @@ class TestFrontendImageEmbedHandler(TestCase, WagtailTestUtils):
         self.assertTagInHTML(
             '<img class="richtext-image left" alt="" />', result, allow_extra_attrs=True
         )
+
+    def test_get_many_prefetches_format_renditions(self):
+        image = Image.objects.create(id=1, title="Test", file=get_test_image_file())
+        rendition = image.get_rendition("width-500")
+        image.get_rendition("width-800")
+        image.get_rendition("fill-100x100")
+
+        images = FrontendImageEmbedHandler.get_many(
+            [{"id": 1, "format": "left"}, {"id": 1, "format": "right"}]
+        )
+
+        # Only the renditions used by the requested formats are prefetched
+        self.assertEqual(list(images[0].renditions.all()), [rendition])
+        with self.assertNumQueries(0):
+            html = get_image_format("left").image_to_html(images[0], "")
+        self.assertIn(rendition.url, html)
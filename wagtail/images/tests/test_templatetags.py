@@ -1,9 +1,18 @@
+from unittest import mock
+
 from django.template import Variable
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
-from wagtail.images.models import Image, Rendition
+from wagtail.images.background import (
+    PlaceholderRendition,
+    _run_in_worker,
+    enqueue_rendition,
+    generate_rendition,
+)
+from wagtail.images.models import Filter, Image, Rendition
 from wagtail.images.templatetags.wagtailimages_tags import ImageNode
 from wagtail.images.tests.utils import get_test_image_file
+from wagtail.images.utils import generate_signature
 
 
 class ImageNodeTestCase(TestCase):
@@ -62,3 +71,79 @@ class ImageNodeTestCase(TestCase):
 
         self.assertEqual(rendered, "")
         self.assertIsNone(context["image_node"])
+
+
+@override_settings(WAGTAILIMAGES_BACKGROUND_RENDITIONS=True)
+class TestBackgroundRenditions(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(),
+        )
+
+    def test_missing_rendition_renders_placeholder(self):
+        context = {"image": self.image}
+        node = ImageNode(Variable("image"), "fill-200x100")
+
+        with mock.patch(
+            "wagtail.images.background.enqueue_rendition"
+        ) as mock_enqueue, mock.patch.object(
+            Image, "generate_rendition_file"
+        ) as mock_generate:
+            rendered = node.render(context)
+
+        mock_generate.assert_not_called()
+        mock_enqueue.assert_called_once()
+        self.assertFalse(self.image.renditions.exists())
+
+        # The placeholder points at the dynamic serve view, with the
+        # dimensions the rendition will have
+        signature = generate_signature(self.image.id, "fill-200x100")
+        self.assertIn(
+            'src="/images/%s/%d/fill-200x100/' % (signature, self.image.id),
+            rendered,
+        )
+        self.assertIn('width="200"', rendered)
+        self.assertIn('height="100"', rendered)
+
+    def test_placeholder_as_context_variable(self):
+        context = {"image": self.image}
+        node = ImageNode(Variable("image"), "max-100x100", "image_node")
+
+        with mock.patch("wagtail.images.background.enqueue_rendition"):
+            node.render(context)
+
+        placeholder = context["image_node"]
+        self.assertIsInstance(placeholder, PlaceholderRendition)
+        self.assertEqual((placeholder.width, placeholder.height), (100, 75))
+        self.assertEqual(placeholder.alt, "Test image")
+
+    def test_existing_rendition_is_used(self):
+        rendition = self.image.get_rendition("fill-200x100")
+        context = {"image": self.image}
+        node = ImageNode(Variable("image"), "fill-200x100", "image_node")
+
+        with mock.patch("wagtail.images.background.enqueue_rendition") as mock_enqueue:
+            node.render(context)
+
+        mock_enqueue.assert_not_called()
+        self.assertEqual(context["image_node"], rendition)
+
+    def test_generate_rendition(self):
+        generate_rendition(Image, self.image.id, "fill-200x100")
+
+        self.assertTrue(
+            self.image.renditions.filter(filter_spec="fill-200x100").exists()
+        )
+
+    def test_enqueue_rendition_skips_pending_renditions(self):
+        with mock.patch("wagtail.images.background.get_executor") as mock_executor:
+            self.assertTrue(enqueue_rendition(self.image, Filter("fill-200x100")))
+            self.assertFalse(enqueue_rendition(self.image, Filter("fill-200x100")))
+
+            mock_executor.return_value.submit.assert_called_once_with(
+                _run_in_worker, Image, self.image.id, "fill-200x100"
+            )
+            generate_rendition(Image, self.image.id, "fill-200x100")
+            self.assertTrue(enqueue_rendition(self.image, Filter("fill-200x100")))
@@ -1,9 +1,11 @@
 import os
 import unittest
+from unittest import mock
 
 from django import forms, template
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.fields.files import FieldFile
 from django.test import TestCase, override_settings
 from django.test.signals import setting_changed
 from django.urls import reverse
@@ -522,6 +524,84 @@ class TestFrontendServeView(TestCase):
         # Check response
         self.assertEqual(response.status_code, 410)
 
+    def get_serve_url(self, filter_spec="fill-800x600"):
+        signature = generate_signature(self.image.id, filter_spec)
+        return reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, filter_spec)
+        )
+
+    def test_get_sends_validators(self):
+        response = self.client.get(self.get_serve_url())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Cache-Control"], "max-age=3600")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_etag_changes_with_filter_spec(self):
+        response = self.client.get(self.get_serve_url("fill-800x600"))
+        other_response = self.client.get(self.get_serve_url("width-400"))
+
+        self.assertNotEqual(response["ETag"], other_response["ETag"])
+
+    def test_get_not_modified(self):
+        response = self.client.get(self.get_serve_url())
+        etag = response["ETag"]
+
+        with mock.patch.object(FieldFile, "open") as mock_open:
+            response = self.client.get(self.get_serve_url(), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        mock_open.assert_not_called()
+
+    def test_get_with_stale_etag(self):
+        response = self.client.get(self.get_serve_url(), HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+
+    def test_get_range(self):
+        full_content = b"".join(self.client.get(self.get_serve_url()).streaming_content)
+
+        response = self.client.get(self.get_serve_url(), HTTP_RANGE="bytes=10-19")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(
+            response["Content-Range"], "bytes 10-19/%d" % len(full_content)
+        )
+        self.assertEqual(b"".join(response.streaming_content), full_content[10:20])
+
+    def test_get_suffix_range(self):
+        full_content = b"".join(self.client.get(self.get_serve_url()).streaming_content)
+
+        response = self.client.get(self.get_serve_url(), HTTP_RANGE="bytes=-5")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), full_content[-5:])
+
+    def test_get_unsatisfiable_range(self):
+        response = self.client.get(self.get_serve_url(), HTTP_RANGE="bytes=100000000-")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertTrue(response["Content-Range"].startswith("bytes */"))
+
+    def test_get_range_with_stale_if_range(self):
+        response = self.client.get(
+            self.get_serve_url(), HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Range", response)
+
+    def test_get_content_type_from_rendition_filename(self):
+        response = self.client.get(self.get_serve_url("width-400|format-jpeg"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+
 
 class TestFrontendSendfileView(TestCase):
     def setUp(self):
@@ -15,13 +15,14 @@ from django.views.generic import TemplateView
 
 from wagtail.admin import messages
 from wagtail.admin.auth import PermissionPolicyChecker
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.forms.search import SearchForm
 from wagtail.admin.models import popular_tags_for_model
 from wagtail.admin.views.pages.utils import get_valid_next_url_from_request
 from wagtail.images import get_image_model
 from wagtail.images.exceptions import InvalidFilterSpecError
 from wagtail.images.forms import URLGeneratorForm, get_image_form
-from wagtail.images.models import Filter, SourceImageIOError
+from wagtail.images.models import SourceImageIOError, get_filter
 from wagtail.images.permissions import permission_policy
 from wagtail.images.utils import generate_signature
 from wagtail.models import Collection, Site
@@ -79,7 +80,7 @@ class BaseListingView(TemplateView):
             except (AttributeError):
                 self.current_tag = None
 
-        paginator = Paginator(images, per_page=INDEX_PAGE_SIZE)
+        paginator = CachedCountPaginator(images, per_page=INDEX_PAGE_SIZE)
         images = paginator.get_page(self.request.GET.get("p"))
 
         next_url = reverse("wagtailimages:index")
@@ -278,7 +279,7 @@ def generate_url(request, image_id, filter_spec):
 
     # Parse the filter spec to make sure its valid
     try:
-        Filter(spec=filter_spec).operations
+        get_filter(filter_spec).operations
     except InvalidFilterSpecError:
         return JsonResponse({"error": "Invalid filter spec."}, status=400)
 
@@ -305,7 +306,7 @@ def preview(request, image_id, filter_spec):
 
     try:
         response = HttpResponse()
-        image = Filter(spec=filter_spec).run(image, response)
+        image = get_filter(filter_spec).run(image, response)
         response["Content-Type"] = "image/" + image.format_name
         return response
     except InvalidFilterSpecError:
@@ -1,4 +1,7 @@
+import hashlib
 import imghdr
+import os.path
+import re
 from wsgiref.util import FileWrapper
 
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
@@ -9,15 +12,26 @@ from django.http import (
 )
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.decorators import classonlymethod
 from django.views.generic import View
 
 from wagtail.images import get_image_model
 from wagtail.images.exceptions import InvalidFilterSpecError
-from wagtail.images.models import SourceImageIOError
+from wagtail.images.models import IMAGE_FORMAT_EXTENSIONS, SourceImageIOError
 from wagtail.images.utils import generate_signature, verify_signature
 from wagtail.utils.sendfile import sendfile
 
+# Maps rendition file extensions back to the format that produced them, so that
+# the content type can be determined without reading the file
+IMAGE_FORMATS_BY_EXTENSION = {
+    extension: image_format
+    for image_format, extension in IMAGE_FORMAT_EXTENSIONS.items()
+}
+IMAGE_FORMATS_BY_EXTENSION[".jpeg"] = "jpeg"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
 
 def generate_image_url(image, filter_spec, viewname="wagtailimages_serve", key=None):
     signature = generate_signature(image.id, filter_spec, key)
@@ -30,6 +44,7 @@ class ServeView(View):
     model = get_image_model()
     action = "serve"
     key = None
+    cache_control = {"max_age": 3600}
 
     @classonlymethod
     def as_view(cls, **initkwargs):
@@ -65,19 +80,131 @@ class ServeView(View):
 
         return getattr(self, self.action)(rendition)
 
+    def get_content_type(self, rendition):
+        extension = os.path.splitext(rendition.file.name)[1].lower()
+        image_format = IMAGE_FORMATS_BY_EXTENSION.get(extension)
+
+        if image_format is None:
+            # Unrecognised extension (e.g. from a custom rendition model),
+            # fall back to sniffing the file header
+            with rendition.open_file() as image_file:
+                image_format = imghdr.what(image_file)
+
+        return "image/" + image_format
+
+    def get_etag(self, rendition):
+        # Renditions are never modified in place; a change to the source image or
+        # its focal point results in a new rendition record, so these values are
+        # enough to form a strong validator without touching the file
+        key = "{}-{}-{}-{}".format(
+            rendition.image_id,
+            rendition.pk,
+            rendition.focal_point_key,
+            rendition.filter_spec,
+        )
+        return '"{}"'.format(hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def add_cache_headers(self, response, etag):
+        response["ETag"] = etag
+        if self.cache_control:
+            patch_cache_control(response, **self.cache_control)
+        return response
+
+    def get_byte_range(self, rendition, etag):
+        """
+        Returns a (start, end) tuple of inclusive byte offsets if the request
+        asks for a single satisfiable range, None if the full file should be
+        served, or False if the requested range cannot be satisfied.
+        """
+        range_header = self.request.META.get("HTTP_RANGE")
+        if not range_header:
+            return None
+
+        # If-Range only applies the range when the client's copy is current
+        if_range = self.request.META.get("HTTP_IF_RANGE")
+        if if_range and if_range != etag:
+            return None
+
+        match = RANGE_RE.match(range_header.strip())
+        if match is None:
+            # Multiple or malformed ranges, serve the whole file instead
+            return None
+
+        start, end = match.groups()
+        size = rendition.file.size
+
+        if start:
+            start = int(start)
+            end = min(int(end), size - 1) if end else size - 1
+        elif end:
+            # Suffix range, e.g. "bytes=-500" for the last 500 bytes
+            start = max(size - int(end), 0)
+            end = size - 1
+        else:
+            return None
+
+        if start >= size or start > end:
+            return False
+
+        return start, end
+
     def serve(self, rendition):
-        # Open and serve the file
+        etag = self.get_etag(rendition)
+
+        # Answer conditional requests before opening the file
+        response = get_conditional_response(self.request, etag=etag)
+        if response is not None:
+            return self.add_cache_headers(response, etag)
+
+        content_type = self.get_content_type(rendition)
+        byte_range = self.get_byte_range(rendition, etag)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = "bytes */%d" % rendition.file.size
+            return self.add_cache_headers(response, etag)
+
         rendition.file.open("rb")
-        image_format = imghdr.what(rendition.file)
-        return StreamingHttpResponse(
-            FileWrapper(rendition.file), content_type="image/" + image_format
-        )
+
+        if byte_range is None:
+            response = StreamingHttpResponse(
+                FileWrapper(rendition.file), content_type=content_type
+            )
+        else:
+            start, end = byte_range
+            rendition.file.seek(start)
+            response = StreamingHttpResponse(
+                _read_range(rendition.file, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = "bytes %d-%d/%d" % (
+                start,
+                end,
+                rendition.file.size,
+            )
+            response["Content-Length"] = str(end - start + 1)
+
+        response["Accept-Ranges"] = "bytes"
+        return self.add_cache_headers(response, etag)
 
     def redirect(self, rendition):
         # Redirect to the file's public location
         return HttpResponsePermanentRedirect(rendition.url)
 
 
+def _read_range(f, length, block_size=8192):
+    try:
+        while length > 0:
+            data = f.read(min(block_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+    finally:
+        f.close()
+
+
 serve = ServeView.as_view()
 
 
@@ -167,6 +167,23 @@ class LogActionRegistry:
             instance, action, user=user, uuid=uuid, **kwargs
         )
 
+    def build_log_entry(self, instance, action, user=None, uuid=None, **kwargs):
+        """
+        Returns an unsaved log entry for the given action, or None if the object type has no
+        log entry model. The entries can then be saved together with ``bulk_create``.
+        """
+        self.scan_for_actions()
+
+        log_entry_model = self.get_log_model_for_instance(instance)
+        if log_entry_model is None:
+            return
+
+        user = user or get_active_log_context().user
+        uuid = uuid or get_active_log_context().uuid
+        return log_entry_model.objects.build_log_entry(
+            instance, action, user=user, uuid=uuid, **kwargs
+        )
+
     def get_logs_for_instance(self, instance):
         log_entry_model = self.get_log_model_for_instance(instance)
         if log_entry_model is None:
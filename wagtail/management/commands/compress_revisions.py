@@ -0,0 +1,89 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from wagtail.models import (
+    Revision,
+    expand_revision_deltas,
+    get_revision_snapshot_interval,
+)
+
+
+class Command(BaseCommand):
+    help = "Store existing revisions as deltas against periodic full snapshots, or expand them back to full content"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            help="Number of revisions of each object between full snapshots (default: WAGTAIL_REVISION_SNAPSHOT_INTERVAL)",
+        )
+        parser.add_argument(
+            "--expand",
+            action="store_true",
+            help="Store the full content of every revision, such as before disabling WAGTAIL_REVISION_DELTA_STORAGE",
+        )
+
+    def handle(self, *args, **options):
+        if options["expand"]:
+            count = expand_revisions()
+            self.stdout.write("Expanded %d revisions" % count)
+            return
+
+        interval = options["interval"] or get_revision_snapshot_interval()
+        count = 0
+        for object_key in (
+            Revision.objects.order_by()
+            .values_list("base_content_type_id", "object_id")
+            .distinct()
+            .iterator()
+        ):
+            count += compress_object_revisions(*object_key, interval=interval)
+            if options["verbosity"] >= 2:
+                self.stdout.write("Compressed revisions of %s %s" % object_key)
+
+        self.stdout.write("Stored %d revisions as deltas" % count)
+
+
+def expand_revisions():
+    revision_ids = list(
+        Revision.objects.filter(delta_base__isnull=False).values_list("id", flat=True)
+    )
+    for revision_id in revision_ids:
+        expand_revision_deltas(Revision.objects.filter(id=revision_id))
+    return len(revision_ids)
+
+
+@transaction.atomic
+def compress_object_revisions(base_content_type_id, object_id, interval):
+    """
+    Stores every revision of the given object, apart from every ``interval``-th one, as a delta
+    against the snapshot before it. Returns the number of revisions stored as deltas.
+    """
+    revision_ids = list(
+        Revision.objects.filter(
+            base_content_type_id=base_content_type_id, object_id=object_id
+        )
+        .order_by("created_at", "id")
+        .values_list("id", flat=True)
+    )
+
+    # Revisions are fetched one at a time, as rewriting one revision can change how the ones
+    # after it are expanded
+    snapshot = None
+    count = 0
+    for index, revision_id in enumerate(revision_ids):
+        revision = Revision.objects.get(id=revision_id)
+
+        if index % interval == 0:
+            if revision.delta_base_id is not None:
+                revision.set_content(revision.get_content())
+                revision.save(update_fields=["content", "delta_base"])
+            snapshot = revision
+        elif revision.delta_base_id != snapshot.id:
+            revision.set_content(revision.get_content(), snapshot)
+            revision.save(update_fields=["content", "delta_base"])
+
+        if revision.delta_base_id is not None:
+            count += 1
+
+    return count
@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from wagtail.models import Page
+
+
+class Command(BaseCommand):
+    help = "Checks the maintained descendant counts of pages against the page tree, and fixes them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report incorrect counts without fixing them",
+        )
+
+    def numberlist_to_string(self, numberlist):
+        return "[" + ", ".join(map(str, numberlist)) + "]"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Checking page descendant counts...")
+        with transaction.atomic():
+            bad_pages = find_incorrect_descendant_counts()
+
+            if not bad_pages:
+                self.stdout.write("No problems found.")
+                return
+
+            self.stdout.write(
+                "Incorrect descendant counts found for pages: %s"
+                % self.numberlist_to_string([page.id for page in bad_pages])
+            )
+
+            if options["dry_run"]:
+                return
+
+            Page.objects.bulk_update(
+                bad_pages,
+                ["descendant_count", "live_descendant_count"],
+                batch_size=1000,
+            )
+
+        self.stdout.write("Fixed descendant counts of %d pages." % len(bad_pages))
+
+
+def find_incorrect_descendant_counts():
+    """
+    Counts the descendants of every page in a single pass over the tree, and returns the pages
+    whose stored ``descendant_count`` or ``live_descendant_count`` is wrong, with the correct
+    counts set on them
+    """
+    bad_pages = []
+
+    def finish(stack):
+        # Checks the page at the top of the stack and adds its counts to its parent's
+        page_id, path, live, stored_counts, counts = stack.pop()
+        if counts != stored_counts:
+            bad_pages.append(
+                Page(
+                    id=page_id,
+                    descendant_count=counts[0],
+                    live_descendant_count=counts[1],
+                )
+            )
+        if stack:
+            parent_counts = stack[-1][4]
+            parent_counts[0] += counts[0] + 1
+            parent_counts[1] += counts[1] + int(live)
+
+    # Pages are visited in path order, so the stack holds the ancestors of the current page
+    stack = []
+    for page_id, path, live, descendant_count, live_descendant_count in (
+        Page.objects.order_by("path")
+        .values_list("id", "path", "live", "descendant_count", "live_descendant_count")
+        .iterator()
+    ):
+        while stack and not path.startswith(stack[-1][1]):
+            finish(stack)
+        stack.append(
+            (page_id, path, live, [descendant_count, live_descendant_count], [0, 0])
+        )
+
+    while stack:
+        finish(stack)
+
+    return bad_pages
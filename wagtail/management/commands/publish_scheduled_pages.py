@@ -1,20 +1,11 @@
 from django.core.management.base import BaseCommand
-from django.utils import dateparse, timezone
+from django.db import connections, transaction
+from django.utils import timezone
 
+from wagtail.coreutils import batch_page_changes
 from wagtail.models import Page, Revision
 
 
-def revision_date_expired(r):
-    expiry_str = r.content.get("expire_at")
-    if not expiry_str:
-        return False
-    expire_at = dateparse.parse_datetime(expiry_str)
-    if expire_at < timezone.now():
-        return True
-    else:
-        return False
-
-
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
@@ -24,6 +15,60 @@ class Command(BaseCommand):
             default=False,
             help="Dry run -- don't change anything.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of pages to publish or unpublish in each transaction.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="The maximum number of pages to publish and unpublish in this run. "
+            "Any remaining pages are left for the next run.",
+        )
+
+    def process_in_batches(self, queryset, process_batch):
+        """
+        Passes the objects in the queryset to process_batch in batches, each in its own
+        transaction. Where the database supports it, the rows of each batch are locked, and rows
+        locked by another run of this command are skipped, so that overlapping runs share the
+        work rather than repeating it.
+        """
+        queryset = queryset.order_by("pk")
+        if connections[queryset.db].features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+
+        last_pk = None
+        while self.remaining is None or self.remaining > 0:
+            batch_size = self.batch_size
+            if self.remaining is not None:
+                batch_size = min(batch_size, self.remaining)
+
+            with transaction.atomic(using=queryset.db):
+                batch_queryset = queryset
+                if last_pk is not None:
+                    batch_queryset = batch_queryset.filter(pk__gt=last_pk)
+                batch = list(batch_queryset[:batch_size])
+                if not batch:
+                    return
+
+                process_batch(batch)
+
+            last_pk = batch[-1].pk
+            if self.remaining is not None:
+                self.remaining -= len(batch)
+
+    def unpublish_expired_pages(self, pages):
+        for page in pages:
+            page.unpublish(set_expired=True, log_action="wagtail.unpublish.scheduled")
+
+    def publish_scheduled_revisions(self, revisions):
+        for revision in revisions:
+            # just run publish for the revision -- since the approved go
+            # live datetime is before now it will make the page live
+            revision.publish(user=revision.user, log_action="wagtail.publish.scheduled")
 
     def handle(self, *args, **options):
         dryrun = False
@@ -31,8 +76,12 @@ class Command(BaseCommand):
             self.stdout.write("Will do a dry run.")
             dryrun = True
 
+        self.batch_size = options["batch_size"]
+        self.remaining = options["limit"]
+        now = timezone.now()
+
         # 1. get all expired pages with live = True
-        expired_pages = Page.objects.filter(live=True, expire_at__lt=timezone.now())
+        expired_pages = Page.objects.filter(live=True, expire_at__lt=now)
         if dryrun:
             if expired_pages:
                 self.stdout.write("Expired pages to be deactivated:")
@@ -46,21 +95,11 @@ class Command(BaseCommand):
                     )
             else:
                 self.stdout.write("No expired pages to be deactivated found.")
-        else:
-            # Unpublish the expired pages
-            # Cast to list to make sure the query is fully evaluated
-            # before unpublishing anything
-            for page in list(expired_pages):
-                page.unpublish(
-                    set_expired=True, log_action="wagtail.unpublish.scheduled"
-                )
 
         # 2. get all page revisions for moderation that have been expired
-        expired_revs = [
-            r
-            for r in Revision.page_revisions.filter(submitted_for_moderation=True)
-            if revision_date_expired(r)
-        ]
+        expired_revs = Revision.page_revisions.filter(
+            submitted_for_moderation=True, expire_at__lt=now
+        )
         if dryrun:
             self.stdout.write("---------------------------------")
             if expired_revs:
@@ -69,27 +108,21 @@ class Command(BaseCommand):
                 )
                 self.stdout.write("Expiry datetime\t\tSlug\t\tName")
                 self.stdout.write("---------------\t\t----\t\t----")
-                for er in expired_revs:
-                    rev_data = er.content
+                for er in expired_revs.select_related("delta_base"):
+                    rev_data = er.get_content()
                     self.stdout.write(
                         "{0}\t{1}\t{2}".format(
-                            dateparse.parse_datetime(
-                                rev_data.get("expire_at")
-                            ).strftime("%Y-%m-%d %H:%M"),
+                            er.expire_at.strftime("%Y-%m-%d %H:%M"),
                             rev_data.get("slug"),
                             rev_data.get("title"),
                         )
                     )
             else:
                 self.stdout.write("No expired revision to be dropped from moderation.")
-        else:
-            for er in expired_revs:
-                er.submitted_for_moderation = False
-                er.save()
 
         # 3. get all revisions that need to be published
         revs_for_publishing = Revision.page_revisions.filter(
-            approved_go_live_at__lt=timezone.now()
+            approved_go_live_at__lt=now
         )
         if dryrun:
             self.stdout.write("---------------------------------")
@@ -97,8 +130,8 @@ class Command(BaseCommand):
                 self.stdout.write("Revisions to be published:")
                 self.stdout.write("Go live datetime\t\tSlug\t\tName")
                 self.stdout.write("---------------\t\t\t----\t\t----")
-                for rp in revs_for_publishing:
-                    rev_data = rp.content
+                for rp in revs_for_publishing.select_related("delta_base"):
+                    rev_data = rp.get_content()
                     self.stdout.write(
                         "{0}\t\t{1}\t{2}".format(
                             rp.approved_go_live_at.strftime("%Y-%m-%d %H:%M"),
@@ -108,8 +141,17 @@ class Command(BaseCommand):
                     )
             else:
                 self.stdout.write("No pages to go live.")
-        else:
-            for rp in revs_for_publishing:
-                # just run publish for the revision -- since the approved go
-                # live datetime is before now it will make the page live
-                rp.publish(user=rp.user, log_action="wagtail.publish.scheduled")
+            return
+
+        # Search index updates and front-end cache purges are done together at the end of the run
+        with batch_page_changes():
+            # Unpublish the expired pages
+            self.process_in_batches(expired_pages, self.unpublish_expired_pages)
+
+            # Drop the expired revisions from the moderation queue
+            expired_revs.update(submitted_for_moderation=False)
+
+            # Publish the scheduled revisions
+            self.process_in_batches(
+                revs_for_publishing, self.publish_scheduled_revisions
+            )
@@ -1,8 +1,11 @@
+import time
+
 from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
-from wagtail.models import Revision
+from wagtail.models import Comment, Revision
 
 try:
     from wagtail.models import WorkflowState
@@ -21,11 +24,52 @@ class Command(BaseCommand):
             type=int,
             help="Only delete revisions older than this number of days",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of revisions to delete in each batch (default: 1000)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Number of seconds to wait between batches, to reduce the load on the database",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            help="Only delete revisions with an ID greater than this, to resume an interrupted run",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the revisions that would be deleted, without deleting them",
+        )
 
     def handle(self, *args, **options):
         days = options.get("days")
 
-        revisions_deleted = purge_revisions(days=days)
+        if options["dry_run"]:
+            count = get_purgeable_revisions(
+                days=days, start_after=options["start_after"]
+            ).count()
+            self.stdout.write("%d revisions would be deleted" % count)
+            return
+
+        revisions_deleted = 0
+        for batch_count, last_id in purge_revision_batches(
+            days=days,
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            start_after=options["start_after"],
+        ):
+            revisions_deleted += batch_count
+            if options["verbosity"] >= 2:
+                self.stdout.write(
+                    "Deleted %d revisions, up to ID %d (resume with --start-after=%d)"
+                    % (revisions_deleted, last_id, last_id)
+                )
 
         if revisions_deleted:
             self.stdout.write(
@@ -37,7 +81,7 @@ class Command(BaseCommand):
             self.stdout.write("No revisions deleted")
 
 
-def purge_revisions(days=None):
+def get_purgeable_revisions(days=None, start_after=None):
     # exclude revisions which have been submitted for moderation in the old system
     purgeable_revisions = Revision.page_revisions.exclude(
         submitted_for_moderation=True
@@ -58,12 +102,113 @@ def purge_revisions(days=None):
         # only include revisions which were created before the cut off date
         purgeable_revisions = purgeable_revisions.filter(created_at__lt=purgeable_until)
 
-    deleted_revisions_count = 0
+    if start_after is not None:
+        purgeable_revisions = purgeable_revisions.filter(id__gt=start_after)
+
+    # don't delete the latest revision for any page (the one that no other
+    # revision comes after, in the same order as Revision.is_latest_revision)
+    return purgeable_revisions.filter(
+        Exists(
+            Revision.objects.filter(
+                base_content_type_id=OuterRef("base_content_type_id"),
+                object_id=OuterRef("object_id"),
+            ).filter(
+                Q(created_at__gt=OuterRef("created_at"))
+                | Q(created_at=OuterRef("created_at"), id__gt=OuterRef("id"))
+            )
+        )
+    )
 
-    for revision in purgeable_revisions:
-        # don't delete the latest revision for any page
-        if not revision.is_latest_revision():
-            revision.delete()
-            deleted_revisions_count += 1
 
-    return deleted_revisions_count
+def move_comments_from_revisions(revisions):
+    """
+    Moves the comments created on any of the given revisions (which are about
+    to be deleted) to the next revision of the same object that is not one of
+    them, in the same way as Revision.delete
+    """
+    revision_ids = {revision.id for revision in revisions}
+    comments = list(
+        Comment.objects.filter(revision_created_id__in=revision_ids).only(
+            "id", "revision_created_id"
+        )
+    )
+    if not comments:
+        return
+
+    commented_revision_ids = {comment.revision_created_id for comment in comments}
+    commented_revisions = [
+        revision for revision in revisions if revision.id in commented_revision_ids
+    ]
+
+    # Fetch the remaining revisions of all the affected objects at once, in order
+    remaining_revisions = {}
+    for revision in (
+        Revision.objects.filter(
+            base_content_type_id__in={
+                revision.base_content_type_id for revision in commented_revisions
+            },
+            object_id__in={str(revision.object_id) for revision in commented_revisions},
+        )
+        .exclude(id__in=revision_ids)
+        .order_by("created_at", "id")
+        .only("id", "base_content_type_id", "object_id", "created_at")
+    ):
+        remaining_revisions.setdefault(
+            (revision.base_content_type_id, revision.object_id), []
+        ).append(revision)
+
+    next_revision_ids = {}
+    for revision in commented_revisions:
+        next_revision_ids[revision.id] = next(
+            (
+                later_revision.id
+                for later_revision in remaining_revisions.get(
+                    (revision.base_content_type_id, str(revision.object_id)), []
+                )
+                if (later_revision.created_at, later_revision.id)
+                > (revision.created_at, revision.id)
+            ),
+            None,
+        )
+
+    for comment in comments:
+        comment.revision_created_id = next_revision_ids[comment.revision_created_id]
+    Comment.objects.bulk_update(comments, ["revision_created_id"], batch_size=1000)
+
+
+def purge_revision_batches(days=None, batch_size=1000, sleep=0, start_after=None):
+    """
+    Deletes purgeable revisions in batches of up to ``batch_size``, in order of
+    ID, yielding the number of revisions deleted and the last ID in each batch
+    """
+    while True:
+        with transaction.atomic():
+            revisions = list(
+                get_purgeable_revisions(days=days, start_after=start_after)
+                .order_by("id")
+                .only("id", "base_content_type_id", "object_id", "created_at")[
+                    :batch_size
+                ]
+            )
+            if not revisions:
+                return
+
+            move_comments_from_revisions(revisions)
+            Revision.objects.filter(
+                id__in=[revision.id for revision in revisions]
+            ).delete()
+
+        start_after = revisions[-1].id
+        yield len(revisions), start_after
+
+        if sleep:
+            time.sleep(sleep)
+
+
+def purge_revisions(days=None, batch_size=1000, sleep=0, start_after=None):
+    return sum(
+        batch_count
+        for batch_count, last_id in purge_revision_batches(
+            days=days, batch_size=batch_size, sleep=sleep, start_after=start_after
+        )
+    )
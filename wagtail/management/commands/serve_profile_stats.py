@@ -0,0 +1,66 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from wagtail.profiling import get_profile_stats, reset_profile_stats
+
+
+class Command(BaseCommand):
+    help = "Report the time and queries spent serving each page type, as recorded by ServeProfilingMiddleware"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Output the stats as JSON",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Clear the recorded stats after reporting them",
+        )
+
+    def handle(self, *args, **options):
+        stats = get_profile_stats()
+
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2, sort_keys=True))
+        elif not stats:
+            self.stdout.write("No page requests have been profiled")
+        else:
+            self.write_report(stats)
+
+        if options["reset"]:
+            reset_profile_stats()
+
+    def write_report(self, stats):
+        # Page types that take the most time overall come first
+        for page_type, page_stats in sorted(
+            stats.items(), key=lambda item: item[1]["time"], reverse=True
+        ):
+            requests = page_stats["requests"]
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    "%s: %d requests, %.1fms and %.1f queries per request, %d over budget"
+                    % (
+                        page_type,
+                        requests,
+                        page_stats["time"] * 1000 / requests,
+                        page_stats["queries"] / requests,
+                        page_stats["over_budget"],
+                    )
+                )
+            )
+
+            for name, (calls, phase_time, queries) in sorted(
+                page_stats["phases"].items(), key=lambda item: item[1][1], reverse=True
+            ):
+                self.stdout.write(
+                    "  %-40s %8.1f calls %10.2fms %8.1f queries"
+                    % (
+                        name,
+                        calls / requests,
+                        phase_time * 1000 / requests,
+                        queries / requests,
+                    )
+                )
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+import wagtail.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0072_alter_revision_content_type_notnull"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revision",
+            name="delta_base",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=wagtail.models.expand_dependent_revisions,
+                related_name="+",
+                to="wagtailcore.revision",
+                verbose_name="delta base",
+            ),
+        ),
+    ]
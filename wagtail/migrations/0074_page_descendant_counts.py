@@ -0,0 +1,25 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:11
+
+from django.db import migrations
+
+import wagtail.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0073_revision_delta_base"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="descendant_count",
+            field=wagtail.models.DescendantCountField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="page",
+            name="live_descendant_count",
+            field=wagtail.models.DescendantCountField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,46 @@
+from django.db import migrations, models
+from django.utils import dateparse
+
+from wagtail.utils.json_delta import apply_delta
+
+
+def populate_revision_expire_at(apps, schema_editor):
+    # Only revisions that are submitted for moderation are checked for expiry
+    Revision = apps.get_model("wagtailcore.Revision")
+    revisions = []
+    for revision in (
+        Revision.objects.filter(submitted_for_moderation=True)
+        .select_related("delta_base")
+        .iterator()
+    ):
+        content = revision.content
+        if revision.delta_base_id is not None:
+            content = apply_delta(revision.delta_base.content, content)
+
+        expire_at = content.get("expire_at")
+        if expire_at:
+            revision.expire_at = dateparse.parse_datetime(expire_at)
+            revisions.append(revision)
+
+    Revision.objects.bulk_update(revisions, ["expire_at"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0074_page_descendant_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="revision",
+            name="expire_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="expiry date/time",
+            ),
+        ),
+        migrations.RunPython(populate_revision_expire_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.0.10 on 2026-10-19 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0075_revision_expire_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="revision",
+            index=models.Index(
+                fields=["user", "base_content_type", "created_at"],
+                name="user_base_content_created_idx",
+            ),
+        ),
+    ]
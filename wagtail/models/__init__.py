@@ -10,7 +10,9 @@ as Page.
 """
 
 import functools
+import json
 import logging
+import posixpath
 import uuid
 import warnings
 from io import StringIO
@@ -21,7 +23,8 @@ from django.conf import settings
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core import checks
-from django.core.cache import cache
+from django.core.cache import InvalidCacheBackendError, cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.handlers.base import BaseHandler
 from django.core.handlers.wsgi import WSGIRequest
@@ -34,7 +37,7 @@ from django.dispatch import receiver
 from django.http import Http404
 from django.template.response import TemplateResponse
 from django.urls import NoReverseMatch, reverse
-from django.utils import timezone
+from django.utils import dateparse, timezone
 from django.utils import translation as translation
 from django.utils.cache import patch_cache_control
 from django.utils.encoding import force_str
@@ -62,6 +65,7 @@ from wagtail.coreutils import (
 from wagtail.fields import StreamField
 from wagtail.forms import TaskStateCommentForm
 from wagtail.log_actions import log
+from wagtail.profiling import profile_phase
 from wagtail.query import PageQuerySet
 from wagtail.search import index
 from wagtail.signals import (
@@ -80,6 +84,7 @@ from wagtail.signals import (
 from wagtail.treebeard import TreebeardPathFixMixin
 from wagtail.url_routing import RouteResult
 from wagtail.utils.deprecation import RemovedInWagtail50Warning
+from wagtail.utils.json_delta import apply_delta, make_delta
 
 from .audit_log import (  # noqa
     BaseLogEntry,
@@ -164,6 +169,43 @@ def get_streamfield_names(model_class):
     )
 
 
+def descendant_counts_enabled():
+    return getattr(settings, "WAGTAIL_PAGE_DESCENDANT_COUNTS", False)
+
+
+def get_ancestor_paths(path):
+    """
+    Returns the paths of all ancestors of the tree node with the given path
+    """
+    steplen = Page.steplen
+    return [path[:length] for length in range(steplen, len(path), steplen)]
+
+
+def update_descendant_counts(pages, count, live_count):
+    """
+    Adds ``count`` and ``live_count`` (which may be negative) to the maintained descendant
+    counts of the pages in the given queryset
+    """
+    if count or live_count:
+        pages.update(
+            descendant_count=models.F("descendant_count") + count,
+            live_descendant_count=models.F("live_descendant_count") + live_count,
+        )
+
+
+class DescendantCountField(models.IntegerField):
+    """
+    A count of pages in a subtree, which is only ever changed in the database with relative
+    updates. Saving an existing page leaves the stored value as it is, so that a page instance
+    that was loaded before one of its descendants was added can't overwrite the count.
+    """
+
+    def pre_save(self, model_instance, add):
+        if add:
+            return super().pre_save(model_instance, add)
+        return models.F(self.attname)
+
+
 class BasePageManager(models.Manager):
     def get_queryset(self):
         return self._queryset_class(self.model).order_by("path")
@@ -338,6 +380,11 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         related_name="aliases",
     )
 
+    # The number of pages (and live pages) below this one in the tree, maintained when
+    # WAGTAIL_PAGE_DESCENDANT_COUNTS is enabled
+    descendant_count = DescendantCountField(default=0, editable=False)
+    live_descendant_count = DescendantCountField(default=0, editable=False)
+
     search_fields = [
         index.SearchField("title", partial_match=True, boost=2),
         index.AutocompleteField("title"),
@@ -373,6 +420,8 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         "path",
         "depth",
         "numchild",
+        "descendant_count",
+        "live_descendant_count",
         "url_path",
         "path",
         "postgres_index_entries",
@@ -536,7 +585,9 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             self.full_clean()
 
         slug_changed = False
+        live_changed = False
         is_new = self.id is None
+        old_record = None
 
         if is_new:
             # we are creating a record. If we're doing things properly, this should happen
@@ -559,8 +610,28 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                     old_url_path = old_record.url_path
                     new_url_path = self.url_path
 
+            if descendant_counts_enabled() and not (
+                "update_fields" in kwargs and "live" not in kwargs["update_fields"]
+            ):
+                if old_record is None:
+                    old_live = (
+                        Page.objects.filter(id=self.id)
+                        .values_list("live", flat=True)
+                        .get()
+                    )
+                else:
+                    old_live = old_record.live
+                live_changed = old_live != self.live
+
         result = super().save(**kwargs)
 
+        if descendant_counts_enabled():
+            ancestors = Page.objects.filter(path__in=get_ancestor_paths(self.path))
+            if is_new:
+                update_descendant_counts(ancestors, 1, int(self.live))
+            elif live_changed:
+                update_descendant_counts(ancestors, 0, 1 if self.live else -1)
+
         if slug_changed:
             self._update_descendant_url_paths(old_url_path, new_url_path)
             # Emit page_slug_changed signal on successful db commit
@@ -1047,6 +1118,8 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                 "path",
                 "depth",
                 "numchild",
+                "descendant_count",
+                "live_descendant_count",
                 "url_path",
                 "path",
                 "index_entries",
@@ -1178,10 +1251,13 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
     def serve(self, request, *args, **kwargs):
         request.is_preview = getattr(request, "is_preview", False)
 
+        with profile_phase("get_context"):
+            context = self.get_context(request, *args, **kwargs)
+
         return TemplateResponse(
             request,
             self.get_template(request, *args, **kwargs),
-            self.get_context(request, *args, **kwargs),
+            context,
         )
 
     def is_navigable(self):
@@ -1599,11 +1675,14 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         exclude_fields=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
     ):
         """
         Copies a given page
         :param log_action flag for logging the action. Pass None to skip logging.
             Can be passed an action string. Defaults to 'wagtail.copy'
+        :param bulk flag for copying the descendants of the page (if ``recursive`` is set) in
+            batches with bulk inserts. See ``CopyPageAction``.
         """
         return CopyPageAction(
             self,
@@ -1617,6 +1696,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             process_child_object=process_child_object,
             log_action=log_action,
             reset_translation_key=reset_translation_key,
+            bulk=bulk,
         ).execute(skip_permission_checks=True)
 
     copy.alters_data = True
@@ -1917,6 +1997,24 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         """
         return Page.objects.descendant_of(self, inclusive)
 
+    def get_descendant_count(self):
+        """
+        Returns the number of pages underneath the current page, from the maintained
+        ``descendant_count`` if ``WAGTAIL_PAGE_DESCENDANT_COUNTS`` is enabled.
+        """
+        if descendant_counts_enabled():
+            return self.descendant_count
+        return self.get_descendants().count()
+
+    def get_live_descendant_count(self):
+        """
+        Returns the number of live pages underneath the current page, from the maintained
+        ``live_descendant_count`` if ``WAGTAIL_PAGE_DESCENDANT_COUNTS`` is enabled.
+        """
+        if descendant_counts_enabled():
+            return self.live_descendant_count
+        return self.get_descendants().live().count()
+
     def get_siblings(self, inclusive=True):
         """
         Returns a queryset of all other pages with the same parent as the current page.
@@ -2027,6 +2125,8 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         obj.path = self.path
         obj.depth = self.depth
         obj.numchild = self.numchild
+        obj.descendant_count = self.descendant_count
+        obj.live_descendant_count = self.live_descendant_count
 
         # Update url_path to reflect potential slug changes, but maintining the page's
         # existing tree position
@@ -2212,6 +2312,55 @@ class SubmittedRevisionsManager(models.Manager):
         return self.get_queryset().for_instance(instance)
 
 
+def revision_delta_storage_enabled():
+    return getattr(settings, "WAGTAIL_REVISION_DELTA_STORAGE", False)
+
+
+def get_revision_snapshot_interval():
+    return getattr(settings, "WAGTAIL_REVISION_SNAPSHOT_INTERVAL", 20)
+
+
+def normalise_revision_content(content):
+    # Round-trip the content through JSON, so that it can be compared with content loaded from
+    # the database (where dates, decimals etc. have already been converted to strings)
+    return json.loads(json.dumps(content, cls=DjangoJSONEncoder))
+
+
+def expand_revision_deltas(revisions):
+    """
+    Replaces the stored deltas of the given revisions with their full content
+    """
+    for revision in revisions:
+        Revision.objects.using(revision._state.db).filter(pk=revision.pk).update(
+            content=revision.get_content(), delta_base=None
+        )
+
+
+def expand_dependent_revisions(collector, field, sub_objs, using):
+    """
+    on_delete handler for Revision.delta_base, which expands any revisions that were stored as
+    deltas against a revision being deleted (unless they are being deleted too)
+    """
+    deleted_ids = {revision.pk for revision in collector.data.get(field.model, [])}
+    dependent_ids = [
+        revision.pk for revision in sub_objs if revision.pk not in deleted_ids
+    ]
+    if dependent_ids:
+        expand_revision_deltas(
+            Revision.objects.using(using).filter(pk__in=dependent_ids)
+        )
+
+
+def get_revision_content_expire_at(content):
+    """
+    Returns the expire_at value from the (full) content of a revision as a datetime, if set
+    """
+    expire_at = content.get("expire_at")
+    if isinstance(expire_at, str):
+        expire_at = dateparse.parse_datetime(expire_at)
+    return expire_at
+
+
 class Revision(models.Model):
     content_type = models.ForeignKey(
         ContentType, on_delete=models.CASCADE, related_name="+"
@@ -2240,6 +2389,21 @@ class Revision(models.Model):
     approved_go_live_at = models.DateTimeField(
         verbose_name=_("approved go live at"), null=True, blank=True, db_index=True
     )
+    # If set, content holds a delta (see wagtail.utils.json_delta) against the content of this
+    # revision rather than the full content. The base is always a full snapshot.
+    delta_base = models.ForeignKey(
+        "self",
+        verbose_name=_("delta base"),
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=expand_dependent_revisions,
+        related_name="+",
+    )
+    # A copy of the expire_at value in content, so that expired revisions can be found in SQL
+    expire_at = models.DateTimeField(
+        verbose_name=_("expiry date/time"), null=True, blank=True, editable=False
+    )
 
     objects = models.Manager()
     page_revisions = PageRevisionsManager()
@@ -2276,6 +2440,80 @@ class Revision(models.Model):
         )
         return int(self.object_id)
 
+    def get_content(self):
+        """
+        Returns the full content of the revision. If the revision is stored as a delta, this
+        applies the stored delta (held in ``content``) to the content of ``delta_base``.
+        """
+        if self.delta_base_id is None:
+            return self.content
+
+        expanded = self.__dict__.get("_expanded_content")
+        if expanded is None or expanded[0] is not self.content:
+            expanded = (
+                self.content,
+                apply_delta(self.delta_base.content, self.content),
+            )
+            self._expanded_content = expanded
+        return expanded[1]
+
+    def get_delta_base(self):
+        """
+        Returns the revision that a new revision of this object should be stored as a delta
+        against, or None if it should be stored as a full snapshot
+        """
+        latest_revision = (
+            Revision.objects.filter(
+                base_content_type_id=self.base_content_type_id,
+                object_id=self.object_id,
+            )
+            .order_by("-created_at", "-id")
+            .only("id", "delta_base_id")
+            .first()
+        )
+        if latest_revision is None:
+            return None
+
+        snapshot_id = latest_revision.delta_base_id or latest_revision.id
+        if (
+            Revision.objects.filter(delta_base_id=snapshot_id).count() + 1
+            >= get_revision_snapshot_interval()
+        ):
+            return None
+
+        return Revision.objects.get(id=snapshot_id)
+
+    def set_content(self, content, delta_base=None):
+        """
+        Sets the full content of the revision, to be stored as a delta against ``delta_base`` if
+        one is given (as long as the delta is smaller than the full content)
+        """
+        self.delta_base = delta_base
+        self.content = content
+        if delta_base is None:
+            return
+
+        content = normalise_revision_content(content)
+        delta = make_delta(delta_base.content, content)
+        if len(json.dumps(delta)) >= len(json.dumps(content)):
+            self.delta_base = None
+            return
+
+        self.content = delta
+        self._expanded_content = (delta, content)
+
+    def _stored_content_changed(self):
+        """
+        Returns whether saving this (existing) revision would change its stored content or
+        delta_base, compared to the database
+        """
+        stored = (
+            Revision.objects.filter(pk=self.pk)
+            .values_list("content", "delta_base_id")
+            .first()
+        )
+        return stored != (normalise_revision_content(self.content), self.delta_base_id)
+
     def save(self, user=None, *args, **kwargs):
         # Set default value for created_at to now
         # We cannot use auto_now_add as that will override
@@ -2289,7 +2527,26 @@ class Revision(models.Model):
         if self.base_content_type_id is None:
             self.base_content_type_id = self.content_type_id
 
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            # This may be a copy of a stored revision, so expand its content before choosing
+            # the snapshot to store it against
+            content = self.get_content()
+            if self.pk is None:
+                self.set_content(
+                    content,
+                    self.get_delta_base() if revision_delta_storage_enabled() else None,
+                )
+            elif self._stored_content_changed():
+                # Other revisions may be stored as deltas against the current content
+                expand_revision_deltas(Revision.objects.filter(delta_base_id=self.pk))
+
+            self.expire_at = get_revision_content_expire_at(content)
+            if update_fields is not None:
+                kwargs["update_fields"] = list(set(update_fields) | {"expire_at"})
+
         super().save(*args, **kwargs)
+
         if self.submitted_for_moderation:
             # ensure that all other revisions of this object have the 'submitted for moderation' flag unset
             Revision.objects.filter(
@@ -2322,7 +2579,7 @@ class Revision(models.Model):
             )
 
     def as_object(self):
-        return self.specific_content_object.with_content_json(self.content)
+        return self.specific_content_object.with_content_json(self.get_content())
 
     def as_page_object(self):
         warnings.warn(
@@ -2431,6 +2688,11 @@ class Revision(models.Model):
                 fields=["base_content_type", "object_id"],
                 name="base_content_object_idx",
             ),
+            # Used to find a user's most recent edits for the dashboard
+            models.Index(
+                fields=["user", "base_content_type", "created_at"],
+                name="user_base_content_created_idx",
+            ),
         ]
 
 
@@ -2483,6 +2745,150 @@ class GroupPagePermission(models.Model):
         )
 
 
+def page_permissions_cache_enabled():
+    return getattr(settings, "WAGTAIL_PAGE_PERMISSIONS_CACHE", False)
+
+
+def get_page_permissions_cache():
+    try:
+        return caches["permissions"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+PAGE_PERMISSIONS_VERSION_KEY = "wagtail-page-permissions-version"
+
+
+def get_page_permissions_cache_key(user):
+    cache = get_page_permissions_cache()
+    version = cache.get(PAGE_PERMISSIONS_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(PAGE_PERMISSIONS_VERSION_KEY, version, None):
+            # Created by another worker in the meantime
+            version = cache.get(PAGE_PERMISSIONS_VERSION_KEY, version)
+    return "wagtail-page-permissions-{}-{}".format(user.pk, version)
+
+
+def invalidate_page_permissions_cache():
+    """
+    Discards the page permissions cached for all users
+    """
+    if page_permissions_cache_enabled():
+        get_page_permissions_cache().delete(PAGE_PERMISSIONS_VERSION_KEY)
+
+
+class PagePermissionMatcher:
+    """
+    The page permissions of a user, compiled from their (permission type, page
+    path) grants into a trie of page path steps, so that the permissions on any
+    page can be found without querying the database, and into the minimal set of
+    subtrees for each permission type, for filtering querysets.
+    """
+
+    def __init__(self, grants):
+        self.grants = sorted(set(grants))
+
+        # Each node is a (permission types, children) pair, with children keyed
+        # by the next step of the page path
+        self.trie = (set(), {})
+        for permission_type, path in self.grants:
+            node = self.trie
+            for step in self._get_steps(path):
+                node = node[1].setdefault(step, (set(), {}))
+            node[0].add(permission_type)
+
+    def __getstate__(self):
+        # Only the grants are cached, as the trie is cheap to rebuild
+        return {"grants": self.grants}
+
+    def __setstate__(self, state):
+        self.__init__(state["grants"])
+
+    @classmethod
+    def for_user(cls, user):
+        return cls(
+            GroupPagePermission.objects.filter(group__user=user).values_list(
+                "permission_type", "page__path"
+            )
+        )
+
+    @staticmethod
+    def _get_steps(path):
+        return [
+            path[index : index + Page.steplen]
+            for index in range(0, len(path), Page.steplen)
+        ]
+
+    @cached_property
+    def permission_types(self):
+        return {permission_type for permission_type, path in self.grants}
+
+    def get_permissions(self, path):
+        """
+        Returns the set of permission types that apply to the page with the given path
+        """
+        permissions = set()
+        node = self.trie
+        for step in self._get_steps(path):
+            node = node[1].get(step)
+            if node is None:
+                break
+            permissions |= node[0]
+        return permissions
+
+    def get_root_paths(self, *permission_types):
+        """
+        Returns the paths of the pages at the top of the subtrees that any of the
+        given permission types apply to, excluding those within another subtree
+        """
+        root_paths = []
+        for permission_type, path in sorted(
+            self.grants, key=lambda grant: (grant[1], grant[0])
+        ):
+            if permission_type not in permission_types:
+                continue
+            # Sorting by path places subtrees directly after their root
+            if root_paths and path.startswith(root_paths[-1]):
+                continue
+            root_paths.append(path)
+        return root_paths
+
+    def get_path_filter(self, *permission_types):
+        """
+        Returns a Q object matching the pages that any of the given permission
+        types apply to, or None if there are none
+        """
+        path_filter = None
+        for path in self.get_root_paths(*permission_types):
+            if path_filter is None:
+                path_filter = Q(path__startswith=path)
+            else:
+                path_filter |= Q(path__startswith=path)
+        return path_filter
+
+    def get_ancestor_paths(self):
+        """
+        Returns the paths of all ancestors of the pages that permissions are granted on
+        """
+        return {
+            path[:index]
+            for permission_type, path in self.grants
+            for index in range(Page.steplen, len(path), Page.steplen)
+        }
+
+    def get_common_ancestor_path(self):
+        """
+        Returns the path of the first common ancestor of the pages that
+        permissions are granted on, matching PageQuerySet.first_common_ancestor,
+        or an empty string if there is none (such as when a permission is granted
+        on the root page)
+        """
+        parent_paths = {path[: -Page.steplen] for permission_type, path in self.grants}
+        common_path = posixpath.commonprefix(list(parent_paths))
+        return common_path[: len(common_path) - len(common_path) % Page.steplen]
+
+
 class UserPagePermissionsProxy:
     """Helper object that encapsulates all the page permission rules that this user has
     across the page hierarchy."""
@@ -2495,6 +2901,29 @@ class UserPagePermissionsProxy:
                 group__user=self.user
             ).select_related("page")
 
+    @cached_property
+    def matcher(self):
+        """
+        The user's page permissions as a PagePermissionMatcher. Cached across
+        requests if the WAGTAIL_PAGE_PERMISSIONS_CACHE setting is True
+        """
+        if not page_permissions_cache_enabled():
+            return PagePermissionMatcher.for_user(self.user)
+
+        cache = get_page_permissions_cache()
+        cache_key = get_page_permissions_cache_key(self.user)
+        matcher = cache.get(cache_key)
+        if matcher is None:
+            matcher = PagePermissionMatcher.for_user(self.user)
+            cache.set(
+                cache_key,
+                matcher,
+                getattr(
+                    settings, "WAGTAIL_PAGE_PERMISSIONS_CACHE_TIMEOUT", DEFAULT_TIMEOUT
+                ),
+            )
+        return matcher
+
     def revisions_for_moderation(self):
         """Return a queryset of page revisions awaiting moderation that this user has publish permission on"""
 
@@ -2504,21 +2933,11 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Revision.page_revisions.submitted()
 
-        # get the list of pages for which they have direct publish permission
-        # (i.e. they can publish any page within this subtree)
-        publishable_pages_paths = (
-            self.permissions.filter(permission_type="publish")
-            .values_list("page__path", flat=True)
-            .distinct()
-        )
-        if not publishable_pages_paths:
-            return Revision.objects.none()
-
         # compile a filter expression to apply to the Revision.page_revisions.submitted() queryset:
         # return only those pages whose paths start with one of the publishable_pages paths
-        only_my_sections = Q(path__startswith=publishable_pages_paths[0])
-        for page_path in publishable_pages_paths[1:]:
-            only_my_sections = only_my_sections | Q(path__startswith=page_path)
+        only_my_sections = self.matcher.get_path_filter("publish")
+        if only_my_sections is None:
+            return Revision.objects.none()
 
         # return the filtered queryset
         return Revision.page_revisions.submitted().filter(
@@ -2543,32 +2962,29 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        explorable_pages = Page.objects.none()
+        if not self.matcher.grants:
+            return Page.objects.none()
 
-        # Creates a union queryset of all objects the user has access to add,
-        # edit and publish
-        for perm in self.permissions.filter(
-            Q(permission_type="add")
-            | Q(permission_type="edit")
-            | Q(permission_type="publish")
-            | Q(permission_type="lock")
-        ):
-            explorable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # All pages the user has access to add, edit, publish or lock
+        explorable_pages = self.matcher.get_path_filter(
+            "add", "edit", "publish", "lock"
+        )
 
         # For all pages with specific permissions, add their ancestors as
         # explorable. This will allow deeply nested pages to be accessed in the
         # explorer. For example, in the hierarchy A>B>C>D where the user has
         # 'edit' access on D, they will be able to navigate to D without having
         # explicit access to A, B or C.
-        page_permissions = Page.objects.filter(group_permissions__in=self.permissions)
-        for page in page_permissions:
-            explorable_pages |= page.get_ancestors()
+        ancestors = Q(path__in=self.matcher.get_ancestor_paths())
+        if explorable_pages is None:
+            explorable_pages = ancestors
+        else:
+            explorable_pages |= ancestors
 
         # Remove unnecessary top-level ancestors that the user has no access to
-        fca_page = page_permissions.first_common_ancestor()
-        explorable_pages = explorable_pages.filter(path__startswith=fca_page.path)
-
-        return explorable_pages
+        return Page.objects.filter(explorable_pages).filter(
+            path__startswith=self.matcher.get_common_ancestor_path()
+        )
 
     def editable_pages(self):
         """Return a queryset of the pages that this user has permission to edit"""
@@ -2578,21 +2994,23 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        editable_pages = Page.objects.none()
-
-        for perm in self.permissions.filter(permission_type="add"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) that is owned by them
-            editable_pages |= Page.objects.descendant_of(
-                perm.page, inclusive=True
-            ).filter(owner=self.user)
-
-        for perm in self.permissions.filter(permission_type="edit"):
-            # user has edit permission on any subpage of perm.page
-            # (including perm.page itself) regardless of owner
-            editable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
+        # user has edit permission on any subpage of a page with 'edit' permission
+        # (including that page itself) regardless of owner
+        editable_pages = self.matcher.get_path_filter("edit")
+
+        # user has edit permission on any subpage of a page with 'add' permission
+        # (including that page itself) that is owned by them
+        owned_pages = self.matcher.get_path_filter("add")
+        if owned_pages is not None:
+            owned_pages &= Q(owner=self.user)
+            if editable_pages is None:
+                editable_pages = owned_pages
+            else:
+                editable_pages |= owned_pages
 
-        return editable_pages
+        if editable_pages is None:
+            return Page.objects.none()
+        return Page.objects.filter(editable_pages)
 
     def can_edit_pages(self):
         """Return True if the user has permission to edit any pages"""
@@ -2606,14 +3024,12 @@ class UserPagePermissionsProxy:
         if self.user.is_superuser:
             return Page.objects.all()
 
-        publishable_pages = Page.objects.none()
-
-        for perm in self.permissions.filter(permission_type="publish"):
-            # user has publish permission on any subpage of perm.page
-            # (including perm.page itself)
-            publishable_pages |= Page.objects.descendant_of(perm.page, inclusive=True)
-
-        return publishable_pages
+        # user has publish permission on any subpage of a page with 'publish'
+        # permission (including that page itself)
+        publishable_pages = self.matcher.get_path_filter("publish")
+        if publishable_pages is None:
+            return Page.objects.none()
+        return Page.objects.filter(publishable_pages)
 
     def can_publish_pages(self):
         """Return True if the user has permission to publish any pages"""
@@ -2626,7 +3042,7 @@ class UserPagePermissionsProxy:
         if not self.user.is_active:
             return False
         else:
-            return self.permissions.filter(permission_type="unlock").exists()
+            return "unlock" in self.matcher.permission_types
 
 
 class PagePermissionTester:
@@ -2637,11 +3053,7 @@ class PagePermissionTester:
         self.page_is_root = page.depth == 1  # Equivalent to page.is_root()
 
         if self.user.is_active and not self.user.is_superuser:
-            self.permissions = {
-                perm.permission_type
-                for perm in user_perms.permissions
-                if self.page.path.startswith(perm.page.path)
-            }
+            self.permissions = user_perms.matcher.get_permissions(self.page.path)
 
     def user_has_lock(self):
         return self.page.locked_by_id == self.user.pk
@@ -3990,9 +4402,9 @@ class PageLogEntryManager(BaseLogEntryManager):
     def get_instance_title(self, instance):
         return instance.specific_deferred.get_admin_display_title()
 
-    def log_action(self, instance, action, **kwargs):
+    def build_log_entry(self, instance, action, **kwargs):
         kwargs.update(page=instance)
-        return super().log_action(instance, action, **kwargs)
+        return super().build_log_entry(instance, action, **kwargs)
 
     def viewable_by_user(self, user):
         q = Q(
@@ -93,6 +93,15 @@ class BaseLogEntryManager(models.Manager):
             - content_changed, deleted - Boolean flags
         :return: The new log entry
         """
+        log_entry = self.build_log_entry(instance, action, **kwargs)
+        log_entry.save(force_insert=True, using=self.db)
+        return log_entry
+
+    def build_log_entry(self, instance, action, **kwargs):
+        """
+        Returns an unsaved log entry, with the same arguments as ``log_action``. This allows
+        log entries for many objects to be created at once with ``bulk_create``.
+        """
         if instance.pk is None:
             raise ValueError(
                 "Attempted to log an action for object %r with empty primary key"
@@ -105,7 +114,7 @@ class BaseLogEntryManager(models.Manager):
             title = self.get_instance_title(instance)
 
         timestamp = kwargs.pop("timestamp", timezone.now())
-        return self.model.objects.create(
+        return self.model(
             content_type=ContentType.objects.get_for_model(
                 instance, for_concrete_model=False
             ),
@@ -254,9 +263,9 @@ class BaseLogEntry(models.Model):
 
 
 class ModelLogEntryManager(BaseLogEntryManager):
-    def log_action(self, instance, action, **kwargs):
+    def build_log_entry(self, instance, action, **kwargs):
         kwargs.update(object_id=str(instance.pk))
-        return super().log_action(instance, action, **kwargs)
+        return super().build_log_entry(instance, action, **kwargs)
 
     def for_instance(self, instance):
         return self.filter(
@@ -0,0 +1,247 @@
+"""
+Instrumentation of front-end page serving.
+
+When ``wagtail.profiling.ServeProfilingMiddleware`` is installed, each request
+served by ``wagtail.views.serve`` is profiled: the time taken and the number of
+SQL queries run are recorded against each phase of serving the page (routing,
+``before_serve_page`` hooks, ``get_context``, template rendering) and against
+the StreamField blocks, images and rich text rendered along the way.
+
+Once the page has been served, the ``page_served`` signal is sent with the
+resulting ``ServeProfile``, the number of queries is checked against the
+``WAGTAIL_SERVE_QUERY_BUDGET`` setting, and the figures are added to totals per
+page type that are stored in the ``profiling`` cache (if configured, otherwise
+``default``) and reported by the ``serve_profile_stats`` management command.
+"""
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+
+from wagtail.signals import page_served
+
+logger = logging.getLogger("wagtail")
+
+STATS_CACHE_KEY = "wagtail-serve-profile-stats"
+
+_current_profile = ContextVar("wagtail_serve_profile", default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised when serving a page runs more SQL queries than allowed by the
+    ``WAGTAIL_SERVE_QUERY_BUDGET`` setting, and
+    ``WAGTAIL_SERVE_QUERY_BUDGET_ACTION`` is ``"raise"``
+    """
+
+    pass
+
+
+class ServeProfile:
+    """
+    The time and queries spent serving a single request. ``phases`` maps each
+    phase name to a ``[calls, time, queries]`` list; times are in seconds and
+    include the time spent in any phases nested within them.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.page = None
+        self.queries = 0
+        self.phases = {}
+        self.time = None
+        self._start = time.perf_counter()
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def phase(self, name):
+        start_time = time.perf_counter()
+        start_queries = self.queries
+        try:
+            yield
+        finally:
+            totals = self.phases.setdefault(name, [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += time.perf_counter() - start_time
+            totals[2] += self.queries - start_queries
+
+    def finish(self):
+        self.time = time.perf_counter() - self._start
+
+    @property
+    def page_type(self):
+        return self.page._meta.label if self.page is not None else None
+
+
+@lru_cache(maxsize=None)
+def profiling_enabled():
+    """
+    Returns whether ``ServeProfilingMiddleware`` is installed. This is only checked once, so
+    that hot paths such as block rendering can skip profiling altogether when it isn't.
+    """
+    return "wagtail.profiling.ServeProfilingMiddleware" in settings.MIDDLEWARE
+
+
+@receiver(setting_changed)
+def reset_profiling_enabled(**kwargs):
+    if kwargs["setting"] == "MIDDLEWARE":
+        profiling_enabled.cache_clear()
+
+
+def get_current_profile():
+    """
+    Returns the ``ServeProfile`` of the request being served, if it is being profiled
+    """
+    return _current_profile.get()
+
+
+def profile_phase(name):
+    """
+    Returns a context manager that records the time and queries of the enclosed
+    code against the given phase of the request being profiled, if any
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return nullcontext()
+    return profile.phase(name)
+
+
+def profile_template_response(response):
+    """
+    Records the deferred rendering of a TemplateResponse as the ``render`` phase
+    """
+    profile = _current_profile.get()
+    if profile is None or response.is_rendered:
+        return
+
+    render = response.render
+
+    def profiled_render():
+        with profile.phase("render"):
+            return render()
+
+    response.render = profiled_render
+
+
+def get_query_budget():
+    return getattr(settings, "WAGTAIL_SERVE_QUERY_BUDGET", None)
+
+
+def check_query_budget(profile):
+    budget = get_query_budget()
+    if budget is None or profile.queries <= budget:
+        return
+
+    message = "Serving %s (%s) ran %d queries, exceeding the budget of %d" % (
+        profile.request.path,
+        profile.page_type,
+        profile.queries,
+        budget,
+    )
+
+    if getattr(settings, "WAGTAIL_SERVE_QUERY_BUDGET_ACTION", "warn") == "raise":
+        raise QueryBudgetExceeded(message)
+
+    logger.warning(message)
+
+
+# Aggregated stats
+
+
+def get_profiling_cache():
+    try:
+        return caches["profiling"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def record_profile(profile):
+    """
+    Adds the given profile to the totals for its page type. The totals are
+    updated without locking, so may undercount when serving concurrent requests
+    """
+    cache = get_profiling_cache()
+    stats = cache.get(STATS_CACHE_KEY) or {}
+
+    page_stats = stats.setdefault(
+        profile.page_type,
+        {"requests": 0, "time": 0.0, "queries": 0, "over_budget": 0, "phases": {}},
+    )
+    page_stats["requests"] += 1
+    page_stats["time"] += profile.time
+    page_stats["queries"] += profile.queries
+
+    budget = get_query_budget()
+    if budget is not None and profile.queries > budget:
+        page_stats["over_budget"] += 1
+
+    for name, (calls, phase_time, queries) in profile.phases.items():
+        totals = page_stats["phases"].setdefault(name, [0, 0.0, 0])
+        totals[0] += calls
+        totals[1] += phase_time
+        totals[2] += queries
+
+    cache.set(STATS_CACHE_KEY, stats, None)
+
+
+def get_profile_stats():
+    """
+    Returns the aggregated stats recorded since they were last reset, as a dict
+    mapping page type labels to their totals
+    """
+    return get_profiling_cache().get(STATS_CACHE_KEY) or {}
+
+
+def reset_profile_stats():
+    get_profiling_cache().delete(STATS_CACHE_KEY)
+
+
+class ServeProfilingMiddleware:
+    """
+    Profiles requests that are served by ``wagtail.views.serve``
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = ServeProfile(request)
+        token = _current_profile.set(profile)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(profile._count_query)
+                    )
+                response = self.get_response(request)
+        finally:
+            _current_profile.reset(token)
+
+        # Only pages served by wagtail.views.serve are reported
+        if profile.page is None:
+            return response
+
+        profile.finish()
+        page_served.send(
+            sender=type(profile.page),
+            request=request,
+            page=profile.page,
+            profile=profile,
+        )
+
+        if getattr(settings, "WAGTAIL_SERVE_PROFILE_STATS", True):
+            record_profile(profile)
+
+        check_query_budget(profile)
+        return response
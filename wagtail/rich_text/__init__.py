@@ -1,11 +1,15 @@
 import re
 from html import unescape
+from typing import List, Optional
 
+from django.core.exceptions import ValidationError
 from django.db.models import Model
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.utils.safestring import mark_safe
 
+from wagtail.profiling import profile_phase
+from wagtail.rich_text import cache as rich_text_cache
 from wagtail.rich_text.feature_registry import FeatureRegistry
 from wagtail.rich_text.rewriters import EmbedRewriter, LinkRewriter, MultiRuleRewriter
 
@@ -23,6 +27,14 @@ def expand_db_html(html):
     """
     Expand database-representation HTML into proper HTML usable on front-end templates
     """
+    with profile_phase("richtext"):
+        if rich_text_cache.rich_text_cache_enabled():
+            return rich_text_cache.get_cached_html(html, get_frontend_rewriter())
+
+        return get_frontend_rewriter()(html)
+
+
+def get_frontend_rewriter():
     global FRONTEND_REWRITER
 
     if FRONTEND_REWRITER is None:
@@ -31,21 +43,21 @@ def expand_db_html(html):
         FRONTEND_REWRITER = MultiRuleRewriter(
             [
                 LinkRewriter(
-                    {
-                        linktype: handler.expand_db_attributes
+                    bulk_rules={
+                        linktype: handler.expand_db_attributes_many
                         for linktype, handler in link_rules.items()
                     }
                 ),
                 EmbedRewriter(
-                    {
-                        embedtype: handler.expand_db_attributes
+                    bulk_rules={
+                        embedtype: handler.expand_db_attributes_many
                         for embedtype, handler in embed_rules.items()
                     }
                 ),
             ]
         )
 
-    return FRONTEND_REWRITER(html)
+    return FRONTEND_REWRITER
 
 
 def get_text_for_indexing(richtext):
@@ -111,6 +123,37 @@ class EntityHandler:
         model = cls.get_model()
         return model._default_manager.get(id=attrs["id"])
 
+    @classmethod
+    def get_many(cls, attrs_list: List[dict]) -> List[Optional[Model]]:
+        """
+        Returns the instances referenced by each of the given attribute dicts, in
+        the same order, fetched with a single query. Where an instance does not
+        exist (or the id is missing or invalid), None is returned in its place.
+        """
+        model = cls.get_model()
+        return cls.map_instances(
+            attrs_list, model._default_manager.in_bulk(cls.get_ids(attrs_list))
+        )
+
+    @classmethod
+    def get_ids(cls, attrs_list: List[dict]) -> list:
+        """
+        Returns the distinct, valid ids referenced by the given attribute dicts
+        """
+        pk_field = cls.get_model()._meta.pk
+        ids = set()
+        for attrs in attrs_list:
+            try:
+                ids.add(pk_field.to_python(attrs["id"]))
+            except (KeyError, ValidationError):
+                pass
+        return list(ids)
+
+    @staticmethod
+    def map_instances(attrs_list: List[dict], instances_by_id: dict) -> list:
+        instances_by_str_id = {str(pk): obj for pk, obj in instances_by_id.items()}
+        return [instances_by_str_id.get(str(attrs.get("id"))) for attrs in attrs_list]
+
     @staticmethod
     def expand_db_attributes(attrs: dict) -> str:
         """
@@ -119,6 +162,15 @@ class EntityHandler:
         """
         raise NotImplementedError
 
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list: List[dict]) -> List[str]:
+        """
+        Given a list of attribute dicts from entity tags of this type, returns the
+        real HTML representation of each. Handlers that fetch objects from the
+        database can override this to fetch them all at once (see ``get_many``).
+        """
+        return [cls.expand_db_attributes(attrs) for attrs in attrs_list]
+
 
 class LinkHandler(EntityHandler):
     pass
@@ -0,0 +1,188 @@
+"""
+Caching of the front-end HTML produced by ``expand_db_html``.
+
+When ``WAGTAIL_RICH_TEXT_CACHE`` is enabled, the expanded HTML of each rich text
+value is stored in the ``richtext`` cache (if configured, otherwise ``default``),
+keyed by a hash of the source HTML and the active language.
+
+Each entry records the objects that it references (pages, documents, images and
+any other model handled by a registered link or embed handler), along with a
+version token for each of them. Invalidating an object replaces its token, which
+makes every entry that references it stale without needing to track the entries
+themselves. A token for each referenced model is also recorded, so that changes
+affecting many objects of a model at once (such as moving a section of the page
+tree) can be handled by replacing a single token. A global token, covering sites
+and locales, is recorded on every entry.
+"""
+
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.translation import get_language
+
+from wagtail.rich_text.rewriters import FIND_A_TAG, FIND_EMBED_TAG, extract_attrs
+
+GLOBAL_DEPENDENCY_KEY = "wagtail-richtext-dep-global"
+
+# Lists of (regex, type attribute, {tag type: model}) built up on first use from the
+# link and embed handlers registered with the feature registry
+REFERENCE_PATTERNS = None
+
+
+def rich_text_cache_enabled():
+    return getattr(settings, "WAGTAIL_RICH_TEXT_CACHE", False)
+
+
+def get_rich_text_cache():
+    try:
+        return caches["richtext"]
+    except InvalidCacheBackendError:
+        return caches["default"]
+
+
+def get_cache_key(html):
+    return "wagtail-richtext-{}-{}".format(
+        hashlib.sha1(html.encode("utf-8")).hexdigest(), get_language() or ""
+    )
+
+
+def get_dependency_key(model, pk):
+    return "wagtail-richtext-dep-{}-{}".format(model._meta.label_lower, pk)
+
+
+def get_model_dependency_key(model):
+    return "wagtail-richtext-dep-{}".format(model._meta.label_lower)
+
+
+def _get_handler_models(handlers):
+    models = {}
+    for tag_type, handler in handlers.items():
+        try:
+            models[tag_type] = handler.get_model()
+        except NotImplementedError:
+            pass
+    return models
+
+
+def get_reference_patterns():
+    global REFERENCE_PATTERNS
+
+    if REFERENCE_PATTERNS is None:
+        from wagtail.rich_text import features
+
+        REFERENCE_PATTERNS = [
+            (
+                FIND_A_TAG,
+                "linktype",
+                _get_handler_models(features.get_link_types()),
+            ),
+            (
+                FIND_EMBED_TAG,
+                "embedtype",
+                _get_handler_models(features.get_embed_types()),
+            ),
+        ]
+
+    return REFERENCE_PATTERNS
+
+
+def get_dependency_keys(html):
+    """
+    Returns the set of dependency keys for the objects referenced by the given
+    database-representation HTML
+    """
+    keys = {GLOBAL_DEPENDENCY_KEY}
+    for regex, type_attribute, models in get_reference_patterns():
+        for match in regex.finditer(html):
+            attrs = extract_attrs(match.group(1))
+            model = models.get(attrs.get(type_attribute))
+            if model is not None and "id" in attrs:
+                keys.add(get_model_dependency_key(model))
+                keys.add(get_dependency_key(model, attrs["id"]))
+    return keys
+
+
+def get_instance_dependency_keys(instance):
+    """
+    Returns the dependency keys that should be invalidated when the given model
+    instance changes
+    """
+    return {
+        get_dependency_key(model, instance.pk)
+        for regex, type_attribute, models in get_reference_patterns()
+        for model in models.values()
+        if isinstance(instance, model)
+    }
+
+
+def _get_versions(cache, keys):
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            version = uuid.uuid4().hex
+            if not cache.add(key, version, None):
+                # Created by another worker in the meantime
+                version = cache.get(key)
+            versions[key] = version
+    return versions
+
+
+def get_cached_html(html, expand):
+    """
+    Returns the expanded form of ``html`` from the cache, calling ``expand`` to
+    generate (and store) it if there is no up-to-date entry
+    """
+    cache = get_rich_text_cache()
+    cache_key = get_cache_key(html)
+
+    entry = cache.get(cache_key)
+    if entry is not None:
+        expanded, versions = entry
+        if cache.get_many(versions.keys()) == versions:
+            return expanded
+
+    # Versions are recorded before expanding, so that an object changing while the
+    # HTML is being generated leaves the new entry stale rather than out of date
+    versions = _get_versions(cache, get_dependency_keys(html))
+    expanded = expand(html)
+
+    if None not in versions.values():
+        cache.set(
+            cache_key,
+            (expanded, versions),
+            getattr(settings, "WAGTAIL_RICH_TEXT_CACHE_TIMEOUT", DEFAULT_TIMEOUT),
+        )
+
+    return expanded
+
+
+def invalidate_dependency_keys(keys):
+    if keys:
+        get_rich_text_cache().delete_many(list(keys))
+
+
+def invalidate_instances(instances):
+    """
+    Marks all cached rich text referencing any of the given instances as stale
+    """
+    keys = set()
+    for instance in instances:
+        keys.update(get_instance_dependency_keys(instance))
+    invalidate_dependency_keys(keys)
+
+
+def invalidate_model(model):
+    """
+    Marks all cached rich text referencing any instance of the given model as stale
+    """
+    invalidate_dependency_keys([get_model_dependency_key(model)])
+
+
+def invalidate_all():
+    """
+    Marks all cached rich text as stale
+    """
+    invalidate_dependency_keys([GLOBAL_DEPENDENCY_KEY])
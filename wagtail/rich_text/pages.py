@@ -1,6 +1,8 @@
+from typing import List
+
 from django.utils.html import escape
 
-from wagtail.models import Page
+from wagtail.models import Locale, Page, Site
 from wagtail.rich_text import LinkHandler
 
 
@@ -22,3 +24,61 @@ class PageLinkHandler(LinkHandler):
             return '<a href="%s">' % escape(page.localized.specific.url)
         except Page.DoesNotExist:
             return "<a>"
+
+    @classmethod
+    def get_many(cls, attrs_list):
+        # Fetch the specific pages in bulk, using the minimum number of queries
+        pages = (
+            Page.objects.filter(id__in=cls.get_ids(attrs_list))
+            .defer_streamfields()
+            .specific()
+        )
+        return cls.map_instances(attrs_list, {page.id: page for page in pages})
+
+    @classmethod
+    def localize_many(cls, pages):
+        """
+        Bulk equivalent of ``Page.localized``: returns the live translation of
+        each page in the active locale where one exists, or the page itself
+        """
+        try:
+            locale = Locale.get_active()
+        except (LookupError, Locale.DoesNotExist):
+            return pages
+
+        translation_keys = {
+            page.translation_key
+            for page in pages
+            if page is not None and page.locale_id != locale.id
+        }
+        if not translation_keys:
+            return pages
+
+        translations = {
+            page.translation_key: page
+            for page in Page.objects.filter(
+                translation_key__in=translation_keys, locale=locale, live=True
+            )
+            .defer_streamfields()
+            .specific()
+        }
+        return [
+            translations.get(page.translation_key, page) if page is not None else None
+            for page in pages
+        ]
+
+    @classmethod
+    def expand_db_attributes_many(cls, attrs_list: List[dict]) -> List[str]:
+        pages = cls.localize_many(cls.get_many(attrs_list))
+
+        # Share one lookup of the site root paths between all pages, using the
+        # per-instance cache that Page.get_url_parts() checks
+        site_root_paths = Site.get_site_root_paths()
+        for page in pages:
+            if page is not None:
+                page._wagtail_cached_site_root_paths = site_root_paths
+
+        return [
+            '<a href="%s">' % escape(page.url) if page is not None else "<a>"
+            for page in pages
+        ]
@@ -25,75 +25,159 @@ def extract_attrs(attr_string):
     return attributes
 
 
-class EmbedRewriter:
+class TagRewriter:
     """
-    Rewrites <embed embedtype="foo" /> tags within rich text into the HTML fragment given by the
-    embed rule for 'foo'. Each embed rule is a function that takes a dict of attributes and
-    returns the HTML fragment.
+    Base class for rewriters that replace tags of a particular kind within rich text,
+    according to a 'type' attribute on the tag.
+
+    Rewriting happens in two passes: all matching tags are first extracted from the
+    HTML and grouped by type, so that the replacements for each type can be obtained
+    with a single call to a bulk rule (allowing any database lookups to be batched),
+    and then the replacements are substituted back into the HTML.
+
+    ``rules`` is a dict mapping tag types to functions that take a dict of attributes
+    and return the replacement HTML. ``bulk_rules`` is a dict mapping tag types to
+    functions that take a list of attribute dicts and return a list of replacements;
+    where both are given for a type, the bulk rule is used.
     """
 
-    def __init__(self, embed_rules):
-        self.embed_rules = embed_rules
+    def __init__(self, rules=None, bulk_rules=None):
+        self.rules = rules or {}
+        self.bulk_rules = bulk_rules or {}
 
-    def replace_tag(self, match):
-        attrs = extract_attrs(match.group(1))
+    def get_opening_tag_regex(self):
+        raise NotImplementedError
+
+    def get_tag_type_from_attrs(self, attrs):
+        """
+        Returns the type of the tag with the given attributes, or None if the tag
+        should be left unchanged
+        """
+        raise NotImplementedError
+
+    def get_tag_replacements(self, tag_type, attrs_list):
+        """
+        Returns the replacement HTML for each of the given tags of type ``tag_type``
+        """
         try:
-            rule = self.embed_rules[attrs["embedtype"]]
+            rule = self.bulk_rules[tag_type]
         except KeyError:
-            # silently drop any tags with an unrecognised or missing embedtype attribute
-            return ""
-        return rule(attrs)
+            pass
+        else:
+            return rule(attrs_list)
+
+        try:
+            rule = self.rules[tag_type]
+        except KeyError:
+            return [
+                self.get_unrecognised_tag_replacement(tag_type, attrs)
+                for attrs in attrs_list
+            ]
+
+        return [rule(attrs) for attrs in attrs_list]
+
+    def get_unrecognised_tag_replacement(self, tag_type, attrs):
+        raise NotImplementedError
+
+    def extract_tags(self, html):
+        """
+        Returns a dict mapping tag types to a list of (match, attrs) tuples for
+        each tag of that type found in the HTML
+        """
+        tags_by_type = {}
+        for match in self.get_opening_tag_regex().finditer(html):
+            attrs = extract_attrs(match.group(1))
+            tag_type = self.get_tag_type_from_attrs(attrs)
+            if tag_type is not None:
+                tags_by_type.setdefault(tag_type, []).append((match, attrs))
+        return tags_by_type
 
     def __call__(self, html):
-        return FIND_EMBED_TAG.sub(self.replace_tag, html)
+        tags_by_type = self.extract_tags(html)
+        if not tags_by_type:
+            return html
+
+        replacements = []
+        for tag_type, tags in tags_by_type.items():
+            tag_replacements = self.get_tag_replacements(
+                tag_type, [attrs for match, attrs in tags]
+            )
+            for (match, attrs), replacement in zip(tags, tag_replacements):
+                replacements.append((match.start(), match.end(), replacement))
+
+        # Substitute in document order
+        replacements.sort(key=lambda replacement: replacement[0])
+        parts = []
+        offset = 0
+        for start, end, replacement in replacements:
+            parts.append(html[offset:start])
+            parts.append(replacement)
+            offset = end
+        parts.append(html[offset:])
+        return "".join(parts)
+
+
+class EmbedRewriter(TagRewriter):
+    """
+    Rewrites <embed embedtype="foo" /> tags within rich text into the HTML fragment given by the
+    embed rule for 'foo'. Each embed rule is a function that takes a dict of attributes and
+    returns the HTML fragment.
+    """
+
+    def get_opening_tag_regex(self):
+        return FIND_EMBED_TAG
 
+    def get_tag_type_from_attrs(self, attrs):
+        # tags without an embedtype are given a type of "" so that they are dropped
+        return attrs.get("embedtype", "")
 
-class LinkRewriter:
+    def get_unrecognised_tag_replacement(self, tag_type, attrs):
+        # silently drop any tags with an unrecognised or missing embedtype attribute
+        return ""
+
+
+class LinkRewriter(TagRewriter):
     """
     Rewrites <a linktype="foo"> tags within rich text into the HTML fragment given by the
     rule for 'foo'. Each link rule is a function that takes a dict of attributes and
     returns the HTML fragment for the opening tag (only).
     """
 
-    def __init__(self, link_rules):
-        self.link_rules = link_rules
+    def get_opening_tag_regex(self):
+        return FIND_A_TAG
 
-    def replace_tag(self, match):
-        attrs = extract_attrs(match.group(1))
+    def get_tag_type_from_attrs(self, attrs):
         try:
             link_type = attrs["linktype"]
         except KeyError:
-            link_type = None
             href = attrs.get("href", None)
-            if href:
-                # From href attribute we try to detect only the linktypes that we
-                # currently support (`external` & `email`, `page` has a default handler)
-                # from the link chooser.
-                if href.startswith(("http:", "https:")):
-                    link_type = "external"
-                elif href.startswith("mailto:"):
-                    link_type = "email"
-                elif href.startswith("#"):
-                    link_type = "anchor"
-
-            if not link_type:
-                # otherwise return ordinary links without a linktype unchanged
-                return match.group(0)
-
-        try:
-            rule = self.link_rules[link_type]
-        except KeyError:
-            if link_type in ["email", "external", "anchor"]:
-                # If no rule is registered for supported types
-                # return ordinary links without a linktype unchanged
-                return match.group(0)
-            # unrecognised link type
-            return "<a>"
-
-        return rule(attrs)
-
-    def __call__(self, html):
-        return FIND_A_TAG.sub(self.replace_tag, html)
+            if not href:
+                # otherwise leave ordinary links without a linktype unchanged
+                return None
+
+            # From href attribute we try to detect only the linktypes that we
+            # currently support (`external` & `email`, `page` has a default handler)
+            # from the link chooser.
+            if href.startswith(("http:", "https:")):
+                link_type = "external"
+            elif href.startswith("mailto:"):
+                link_type = "email"
+            elif href.startswith("#"):
+                link_type = "anchor"
+            else:
+                return None
+
+        if link_type in ["email", "external", "anchor"] and not (
+            link_type in self.rules or link_type in self.bulk_rules
+        ):
+            # If no rule is registered for supported types
+            # leave ordinary links without a linktype unchanged
+            return None
+
+        return link_type
+
+    def get_unrecognised_tag_replacement(self, tag_type, attrs):
+        return "<a>"
 
 
 class MultiRuleRewriter:
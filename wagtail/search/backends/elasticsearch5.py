@@ -1,6 +1,8 @@
 import copy
 import json
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from urllib.parse import urlparse
 
 from django.db import DEFAULT_DB_ALIAS, models
@@ -8,7 +10,7 @@ from django.db.models.sql import Query
 from django.db.models.sql.constants import MULTI
 from django.utils.crypto import get_random_string
 from elasticsearch import Elasticsearch, NotFoundError
-from elasticsearch.helpers import bulk
+from elasticsearch.helpers import BulkIndexError, bulk, expand_action
 
 from wagtail.search.backends.base import (
     BaseSearchBackend,
@@ -904,16 +906,11 @@ class Elasticsearch5Index:
             id=mapping.get_document_id(item),
         )
 
-    def add_items(self, model, items):
-        if not class_is_indexed(model):
-            return
-
+    def get_bulk_actions(self, model, items):
         # Get mapping
         mapping = self.mapping_class(model)
         doc_type = mapping.get_document_type()
 
-        # Create list of actions
-        actions = []
         for item in items:
             # Create the action
             action = {
@@ -921,10 +918,21 @@ class Elasticsearch5Index:
                 "_id": mapping.get_document_id(item),
             }
             action.update(mapping.get_document(item))
-            actions.append(action)
+            yield action
+
+    def add_items(self, model, items):
+        if not class_is_indexed(model):
+            return
 
         # Run the actions
-        bulk(self.es, actions, index=self.name)
+        bulk(self.es, list(self.get_bulk_actions(model, items)), index=self.name)
+
+    def bulk_indexer(self):
+        """
+        Returns an ElasticsearchBulkIndexer for adding large numbers of items
+        to this index, using the bulk options configured on the backend
+        """
+        return self.backend.bulk_indexer_class(self, **self.backend.bulk_options)
 
     def delete_item(self, item):
         # Make sure the object can be indexed
@@ -955,6 +963,135 @@ class Elasticsearch5Index:
         self.put()
 
 
+class ElasticsearchBulkIndexer:
+    """
+    Adds items to an index using bulk requests sent on a pool of threads.
+
+    Documents are serialised in the calling thread and grouped into requests
+    of at most ``chunk_size`` documents or ``max_chunk_bytes`` bytes. Up to
+    ``thread_count`` requests are sent concurrently, and at most ``queue_size``
+    further requests are held waiting to be sent; once that limit is reached,
+    ``add_items`` blocks until a request completes. This allows the caller to
+    fetch and serialise the next batch of objects while earlier requests are
+    still in flight, without buffering an unbounded amount of data.
+
+    Use as a context manager, or call ``finish()`` once all items have been
+    added, to wait for outstanding requests and raise any indexing errors.
+    """
+
+    def __init__(
+        self,
+        index,
+        thread_count=4,
+        queue_size=4,
+        chunk_size=500,
+        max_chunk_bytes=10 * 1024 * 1024,
+    ):
+        self.index = index
+        self.es = index.es
+        self.serializer = index.es.transport.serializer
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=thread_count, thread_name_prefix="wagtail-search-bulk"
+        )
+        self.slots = threading.BoundedSemaphore(thread_count + queue_size)
+        # Only used from the thread adding items; worker threads just release slots
+        self.futures = []
+
+        self.lines = []
+        self.line_bytes = 0
+        self.document_count = 0
+
+    def add_items(self, model, items):
+        if not class_is_indexed(model):
+            return
+
+        for action in self.index.get_bulk_actions(model, items):
+            action, data = expand_action(action)
+            lines = [self.serializer.dumps(action), self.serializer.dumps(data)]
+            size = sum(len(line.encode("utf-8")) + 1 for line in lines)
+
+            if self.lines and (
+                self.document_count >= self.chunk_size
+                or self.line_bytes + size > self.max_chunk_bytes
+            ):
+                self.flush()
+
+            self.lines.extend(lines)
+            self.line_bytes += size
+            self.document_count += 1
+
+    def flush(self):
+        if not self.lines:
+            return
+
+        body = "\n".join(self.lines) + "\n"
+        self.lines = []
+        self.line_bytes = 0
+        self.document_count = 0
+
+        # Block until a slot is free, so the caller can't run too far ahead
+        self.slots.acquire()
+        self.raise_errors()
+
+        future = self.executor.submit(self.send, body)
+        self.futures.append(future)
+        future.add_done_callback(self._request_done)
+
+    def send(self, body):
+        response = self.es.bulk(body, index=self.index.name)
+
+        if response.get("errors"):
+            failed = [
+                item
+                for item in response["items"]
+                if not 200 <= list(item.values())[0].get("status", 500) < 300
+            ]
+            raise BulkIndexError(
+                "%i document(s) failed to index." % len(failed), failed
+            )
+
+    def _request_done(self, future):
+        # Called on a worker thread when a request completes (or when it is cancelled)
+        self.slots.release()
+
+    def raise_errors(self):
+        """
+        Raises the error of the first failed request, if any, and forgets the requests that
+        have completed
+        """
+        pending = []
+        for future in self.futures:
+            if not future.done():
+                pending.append(future)
+            elif not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        self.futures = pending
+
+    def finish(self):
+        try:
+            self.flush()
+            wait(self.futures)
+        finally:
+            self.executor.shutdown(wait=True)
+
+        self.raise_errors()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.finish()
+        else:
+            # Don't send any queued requests, but let those in flight complete
+            for future in self.futures:
+                future.cancel()
+            self.executor.shutdown(wait=True)
+
+
 class ElasticsearchIndexRebuilder:
     def __init__(self, index):
         self.index = index
@@ -1035,6 +1172,7 @@ class Elasticsearch5SearchBackend(BaseSearchBackend):
     results_class = Elasticsearch5SearchResults
     mapping_class = Elasticsearch5Mapping
     basic_rebuilder_class = ElasticsearchIndexRebuilder
+    bulk_indexer_class = ElasticsearchBulkIndexer
     atomic_rebuilder_class = ElasticsearchAtomicIndexRebuilder
     catch_indexing_errors = True
 
@@ -1081,6 +1219,12 @@ class Elasticsearch5SearchBackend(BaseSearchBackend):
         self.hosts = params.pop("HOSTS", None)
         self.index_name = params.pop("INDEX", "wagtail")
         self.timeout = params.pop("TIMEOUT", 10)
+        self.bulk_options = {
+            "thread_count": params.pop("BULK_THREAD_COUNT", 4),
+            "queue_size": params.pop("BULK_QUEUE_SIZE", 4),
+            "chunk_size": params.pop("BULK_CHUNK_SIZE", 500),
+            "max_chunk_bytes": params.pop("BULK_MAX_CHUNK_BYTES", 10 * 1024 * 1024),
+        }
 
         if params.pop("ATOMIC_REBUILD", False):
             self.rebuilder_class = self.atomic_rebuilder_class
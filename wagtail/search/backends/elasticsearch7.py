@@ -1,7 +1,6 @@
 from copy import deepcopy
 
 from elasticsearch import NotFoundError
-from elasticsearch.helpers import bulk
 
 from wagtail.search.backends.elasticsearch5 import (
     ElasticsearchAutocompleteQueryCompilerImpl,
@@ -43,23 +42,15 @@ class Elasticsearch7Index(Elasticsearch6Index):
             self.name, mapping.get_document(item), id=mapping.get_document_id(item)
         )
 
-    def add_items(self, model, items):
-        if not class_is_indexed(model):
-            return
-
+    def get_bulk_actions(self, model, items):
         # Get mapping
         mapping = self.mapping_class(model)
 
-        # Create list of actions
-        actions = []
         for item in items:
             # Create the action
             action = {"_id": mapping.get_document_id(item)}
             action.update(mapping.get_document(item))
-            actions.append(action)
-
-        # Run the actions
-        bulk(self.es, actions, index=self.name)
+            yield action
 
     def delete_item(self, item):
         # Make sure the object can be indexed
@@ -1,5 +1,7 @@
 import inspect
 import logging
+import threading
+from contextlib import contextmanager
 
 from django.apps import apps
 from django.core import checks
@@ -12,6 +14,8 @@ from wagtail.search.backends import get_search_backends_with_name
 
 logger = logging.getLogger("wagtail.search.index")
 
+_batch = threading.local()
+
 
 class Indexed:
     @classmethod
@@ -157,7 +161,36 @@ def get_indexed_instance(instance, check_exists=True):
     return indexed_instance
 
 
+@contextmanager
+def batch_updates():
+    """
+    Collects the objects added or updated with ``insert_or_update_object`` within the block (such
+    as by the signal handlers when objects are saved), and adds them to the search backends
+    together at the end of it, once per object.
+    """
+    if getattr(_batch, "instances", None) is not None:
+        # Already collecting updates in an outer block
+        yield
+        return
+
+    _batch.instances = {}
+    try:
+        yield
+    finally:
+        instances, _batch.instances = _batch.instances, None
+        insert_or_update_objects(instances.values())
+
+
 def insert_or_update_object(instance):
+    if getattr(_batch, "instances", None) is not None:
+        indexed_instance = get_indexed_instance(instance, check_exists=False)
+        if indexed_instance and indexed_instance.pk is not None:
+            key = (type(indexed_instance), indexed_instance.pk)
+            # Keep the most recently saved version of the object
+            _batch.instances.pop(key, None)
+            _batch.instances[key] = indexed_instance
+        return
+
     indexed_instance = get_indexed_instance(instance)
 
     if indexed_instance:
@@ -185,10 +218,57 @@ def insert_or_update_object(instance):
                     raise
 
 
+def insert_or_update_objects(instances):
+    """
+    Adds or updates many objects in the search backends, with a single ``add_bulk`` call per
+    model and backend. Objects should be given in their most specific form (e.g. from a
+    ``.specific()`` queryset of pages), as they are not converted individually.
+    """
+    instances_by_model = {}
+    for instance in instances:
+        if class_is_indexed(type(instance)) and instance.pk is not None:
+            instances_by_model.setdefault(type(instance), []).append(instance)
+
+    for model, model_instances in instances_by_model.items():
+        # Make sure that the instances are in their class's indexed objects
+        indexed_pks = set(
+            model.get_indexed_objects()
+            .filter(pk__in=[instance.pk for instance in model_instances])
+            .values_list("pk", flat=True)
+        )
+        model_instances = [
+            instance for instance in model_instances if instance.pk in indexed_pks
+        ]
+        if not model_instances:
+            continue
+
+        for backend_name, backend in get_search_backends_with_name(
+            with_auto_update=True
+        ):
+            try:
+                backend.add_bulk(model, model_instances)
+            except Exception:
+                # Log all errors
+                logger.exception(
+                    "Exception raised while adding %d %s objects into the '%s' search backend",
+                    len(model_instances),
+                    model._meta.label,
+                    backend_name,
+                )
+
+                # Only catch the exception if the backend requires this
+                # See the comments in insert_or_update_object for an explanation
+                if not backend.catch_indexing_errors:
+                    raise
+
+
 def remove_object(instance):
     indexed_instance = get_indexed_instance(instance, check_exists=False)
 
     if indexed_instance:
+        if getattr(_batch, "instances", None) is not None:
+            _batch.instances.pop((type(indexed_instance), indexed_instance.pk), None)
+
         for backend_name, backend in get_search_backends_with_name(
             with_auto_update=True
         ):
@@ -1,4 +1,5 @@
 import collections
+import contextlib
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
@@ -85,24 +86,33 @@ class Command(BaseCommand):
             # Add objects
             object_count = 0
             if not schema_only:
-                for model in models:
-                    self.stdout.write(
-                        "{}: {}.{} ".format(
-                            backend_name, model._meta.app_label, model.__name__
-                        ).ljust(35),
-                        ending="",
-                    )
-
-                    # Add items (chunk_size at a time)
-                    for chunk in self.print_iter_progress(
-                        self.queryset_chunks(
-                            model.get_indexed_objects().order_by("pk"), chunk_size
+                # If the index supports it, send items to the backend on a
+                # separate pool of connections so that the next chunk can be
+                # fetched while the previous one is being indexed
+                if hasattr(index, "bulk_indexer"):
+                    indexer = index.bulk_indexer()
+                else:
+                    indexer = contextlib.nullcontext(index)
+
+                with indexer as indexer:
+                    for model in models:
+                        self.stdout.write(
+                            "{}: {}.{} ".format(
+                                backend_name, model._meta.app_label, model.__name__
+                            ).ljust(35),
+                            ending="",
                         )
-                    ):
-                        index.add_items(model, chunk)
-                        object_count += len(chunk)
 
-                    self.print_newline()
+                        # Add items (chunk_size at a time)
+                        for chunk in self.print_iter_progress(
+                            self.queryset_chunks(
+                                model.get_indexed_objects().order_by("pk"), chunk_size
+                            )
+                        ):
+                            indexer.add_items(model, chunk)
+                            object_count += len(chunk)
+
+                        self.print_newline()
 
             # Finish rebuild
             rebuilder.finish()
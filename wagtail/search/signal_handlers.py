@@ -1,6 +1,7 @@
 from django.db.models.signals import post_delete, post_save
 
 from wagtail.search import index
+from wagtail.signals import post_bulk_page_move
 
 
 def post_save_signal_handler(instance, update_fields=None, **kwargs):
@@ -17,6 +18,14 @@ def post_delete_signal_handler(instance, **kwargs):
     index.remove_object(instance)
 
 
+def post_bulk_page_move_signal_handler(instances, **kwargs):
+    # As when moving a single page, only the moved pages are reindexed; their descendants are
+    # updated by the next run of update_index
+    index.insert_or_update_objects(
+        page for page in instances if getattr(type(page), "search_auto_update", True)
+    )
+
+
 def register_signal_handlers():
     # Loop through list and register signal handlers for each one
     for model in index.get_indexed_models():
@@ -25,3 +34,5 @@ def register_signal_handlers():
 
         post_save.connect(post_save_signal_handler, sender=model)
         post_delete.connect(post_delete_signal_handler, sender=model)
+
+    post_bulk_page_move.connect(post_bulk_page_move_signal_handler)
@@ -1,13 +1,20 @@
 # -*- coding: utf-8 -*-
 import datetime
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 
 from django.db.models import Q
 from django.test import TestCase
+from elasticsearch.helpers import BulkIndexError
 from elasticsearch.serializer import JSONSerializer
 
-from wagtail.search.backends.elasticsearch5 import Elasticsearch5SearchBackend
+from wagtail.search.backends.elasticsearch5 import (
+    Elasticsearch5SearchBackend,
+    ElasticsearchBulkIndexer,
+)
 from wagtail.search.query import MATCH_ALL, Phrase
 from wagtail.test.search import models
 
@@ -1174,3 +1181,160 @@ class TestBackendConfiguration(TestCase):
             ],
             timeout=10,
         )
+
+
+class StubBulkHandler(BaseHTTPRequestHandler):
+    """
+    Responds to Elasticsearch bulk requests, recording the documents received
+    """
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        lines = [json.loads(line) for line in body.splitlines()]
+        actions = lines[::2]
+
+        with self.server.lock:
+            self.server.requests.append((self.path, lines))
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(
+                self.server.max_in_flight, self.server.in_flight
+            )
+
+        time.sleep(0.05)
+
+        items = []
+        for action in actions:
+            status = 400 if action["index"]["_id"] in self.server.fail_ids else 201
+            items.append({"index": dict(action["index"], status=status)})
+
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        response = json.dumps(
+            {
+                "took": 1,
+                "errors": any(i["index"]["status"] >= 300 for i in items),
+                "items": items,
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestElasticsearchBulkIndexer(TestCase):
+    fixtures = ["search"]
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubBulkHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.fail_ids = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.backend = Elasticsearch5SearchBackend(
+            params={"URLS": ["http://127.0.0.1:%d" % self.server.server_port]}
+        )
+        self.index = self.backend.get_index_for_model(models.Book)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_indexed_ids(self):
+        return sorted(
+            int(line["index"]["_id"].split(":")[-1])
+            for path, lines in self.server.requests
+            for line in lines[::2]
+        )
+
+    def test_add_items(self):
+        books = list(models.Book.objects.all())
+
+        with ElasticsearchBulkIndexer(self.index, chunk_size=2) as indexer:
+            indexer.add_items(models.Book, books)
+
+        self.assertEqual(self.get_indexed_ids(), sorted(book.pk for book in books))
+        # Documents are split into requests of at most chunk_size documents
+        self.assertEqual(len(self.server.requests), (len(books) + 1) // 2)
+        for path, lines in self.server.requests:
+            self.assertEqual(path, "/%s/_bulk" % self.index.name)
+            self.assertLessEqual(len(lines), 4)
+
+    def test_requests_are_sent_concurrently(self):
+        books = list(models.Book.objects.all())
+
+        with ElasticsearchBulkIndexer(
+            self.index, thread_count=3, chunk_size=1
+        ) as indexer:
+            indexer.add_items(models.Book, books)
+
+        self.assertEqual(len(self.server.requests), len(books))
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(self.server.max_in_flight, 3)
+
+    def test_max_chunk_bytes(self):
+        books = list(models.Book.objects.all())
+
+        # Every document exceeds the limit, so each is sent on its own
+        with ElasticsearchBulkIndexer(self.index, max_chunk_bytes=1) as indexer:
+            indexer.add_items(models.Book, books)
+
+        self.assertEqual(len(self.server.requests), len(books))
+
+    def test_backpressure(self):
+        books = list(models.Book.objects.all())
+        indexer = ElasticsearchBulkIndexer(
+            self.index, thread_count=1, queue_size=1, chunk_size=1
+        )
+
+        with mock.patch.object(
+            indexer.slots, "acquire", wraps=indexer.slots.acquire
+        ) as acquire:
+            indexer.add_items(models.Book, books)
+            indexer.finish()
+
+        self.assertEqual(acquire.call_count, len(books))
+        self.assertLessEqual(self.server.max_in_flight, 1)
+
+    def test_indexing_errors_are_raised(self):
+        book = models.Book.objects.first()
+        self.server.fail_ids = {"searchtests_book:%d" % book.pk}
+
+        with self.assertRaises(BulkIndexError):
+            with ElasticsearchBulkIndexer(self.index) as indexer:
+                indexer.add_items(models.Book, [book])
+
+    def test_cancelled_requests_are_skipped(self):
+        books = list(models.Book.objects.all())
+
+        with self.assertRaises(ValueError):
+            with ElasticsearchBulkIndexer(
+                self.index, thread_count=1, queue_size=len(books), chunk_size=1
+            ) as indexer:
+                indexer.add_items(models.Book, books)
+                raise ValueError
+
+        # Queued requests were cancelled rather than sent
+        self.assertLess(len(self.server.requests), len(books))
+        self.assertTrue(any(future.cancelled() for future in indexer.futures))
+        indexer.raise_errors()
+
+    def test_bulk_options_from_backend_settings(self):
+        backend = Elasticsearch5SearchBackend(
+            params={"BULK_THREAD_COUNT": 2, "BULK_MAX_CHUNK_BYTES": 1024}
+        )
+        indexer = backend.get_index_for_model(models.Book).bulk_indexer()
+        indexer.finish()
+
+        self.assertIsInstance(indexer, ElasticsearchBulkIndexer)
+        self.assertEqual(indexer.executor._max_workers, 2)
+        self.assertEqual(indexer.max_chunk_bytes, 1024)
+        self.assertEqual(indexer.chunk_size, 500)
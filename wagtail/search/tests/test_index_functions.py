@@ -3,6 +3,7 @@ from unittest import mock
 
 from django.test import TestCase, override_settings
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.models import Page
 from wagtail.search import index
 from wagtail.test.search import models
@@ -104,6 +105,78 @@ class TestInsertOrUpdateObject(TestCase, WagtailTestUtils):
         self.assertIn("ValueError: Test", cm.output[0])
 
 
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    }
+)
+class TestInsertOrUpdateObjects(TestCase, WagtailTestUtils):
+    def test_inserts_objects_by_model(self, backend):
+        book = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        novel = models.Novel.objects.create(
+            title="Test novel",
+            publication_date=date(2017, 10, 18),
+            number_of_pages=100,
+        )
+        unsaved_book = models.Book(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+        hidden_novel = models.Novel.objects.create(
+            title="Don't index me!",
+            publication_date=date(2017, 10, 18),
+            number_of_pages=100,
+        )
+        backend().reset_mock()
+
+        index.insert_or_update_objects([book, novel, unsaved_book, hidden_novel])
+
+        backend().add_bulk.assert_has_calls(
+            [mock.call(models.Book, [book]), mock.call(models.Novel, [novel])]
+        )
+        self.assertEqual(len(backend().add_bulk.mock_calls), 2)
+        self.assertFalse(backend().add.mock_calls)
+
+    def test_batch_updates(self, backend):
+        backend().reset_mock()
+
+        with index.batch_updates():
+            book = models.Book.objects.create(
+                title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+            )
+            book.title = "Updated test"
+            book.save()
+            deleted_book = models.Book.objects.create(
+                title="Deleted", publication_date=date(2017, 10, 18), number_of_pages=1
+            )
+            deleted_book.delete()
+
+            self.assertFalse(backend().add.mock_calls)
+            self.assertFalse(backend().add_bulk.mock_calls)
+
+        backend().add_bulk.assert_called_once_with(models.Book, [book])
+        self.assertEqual(backend().add_bulk.call_args.args[1][0].title, "Updated test")
+
+    def test_catches_index_error(self, backend):
+        obj = models.Book.objects.create(
+            title="Test", publication_date=date(2017, 10, 18), number_of_pages=100
+        )
+
+        backend().add_bulk.side_effect = ValueError("Test")
+        backend().reset_mock()
+
+        with self.assertLogs("wagtail.search.index", level="ERROR") as cm:
+            index.insert_or_update_objects([obj])
+
+        self.assertEqual(len(cm.output), 1)
+        self.assertIn(
+            "Exception raised while adding 1 searchtests.Book objects into the 'default' search backend",
+            cm.output[0],
+        )
+
+
 @mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
 @override_settings(
     WAGTAILSEARCH_BACKENDS={
@@ -201,3 +274,35 @@ class TestSignalHandlers(TestCase, WagtailTestUtils):
         indexed_object = backend().add.call_args[0][0]
         self.assertEqual(indexed_object.title, "Updated test")
         self.assertEqual(indexed_object.publication_date, date(2017, 10, 18))
+
+
+@mock.patch("wagtail.search.tests.DummySearchBackend", create=True)
+@override_settings(
+    WAGTAILSEARCH_BACKENDS={
+        "default": {"BACKEND": "wagtail.search.tests.DummySearchBackend"}
+    }
+)
+class TestBulkPageMoveSignalHandler(TestCase, WagtailTestUtils):
+    def test_reindexes_moved_pages_after_bulk_move(self, backend):
+        root_page = Page.objects.get(id=1)
+        section = root_page.add_child(
+            instance=SimplePage(title="Section", slug="section", content="test")
+        )
+        section.add_child(
+            instance=SimplePage(title="Child", slug="child", content="test")
+        )
+        target = root_page.add_child(
+            instance=SimplePage(title="Target", slug="target", content="test")
+        )
+        backend().reset_mock()
+
+        BulkMovePageAction([section], target).execute()
+        section.refresh_from_db()
+
+        indexed_pages = [
+            page for call in backend().add_bulk.mock_calls for page in call.args[1]
+        ]
+        # As with a single move, only the moved pages are reindexed, not their descendants
+        self.assertEqual([page.id for page in indexed_pages], [section.id])
+        self.assertEqual(indexed_pages[0].url_path, "/target/section/")
+        self.assertIsInstance(indexed_pages[0], SimplePage)
@@ -1,6 +1,7 @@
 from django.urls import include, path
 
 from wagtail import hooks
+from wagtail.search import index
 from wagtail.search.urls import admin as admin_urls
 
 
@@ -9,3 +10,8 @@ def register_admin_urls():
     return [
         path("search/", include(admin_urls, namespace="wagtailsearch_admin")),
     ]
+
+
+@hooks.register("batch_page_changes")
+def batch_search_index_updates():
+    return index.batch_updates()
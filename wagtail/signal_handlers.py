@@ -1,10 +1,25 @@
 import logging
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 from wagtail.coreutils import get_locales_display_names
-from wagtail.models import Locale, Page, Site
+from wagtail.models import (
+    GroupPagePermission,
+    Locale,
+    Page,
+    Site,
+    invalidate_page_permissions_cache,
+)
+from wagtail.rich_text import cache as rich_text_cache
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
 
 logger = logging.getLogger("wagtail")
 
@@ -12,10 +27,12 @@ logger = logging.getLogger("wagtail")
 # Clear the wagtail_site_root_paths from the cache whenever Site records are updated.
 def post_save_site_signal_handler(instance, update_fields=None, **kwargs):
     cache.delete("wagtail_site_root_paths")
+    invalidate_all_rich_text()
 
 
 def post_delete_site_signal_handler(instance, **kwargs):
     cache.delete("wagtail_site_root_paths")
+    invalidate_all_rich_text()
 
 
 def pre_delete_page_unpublish(sender, instance, **kwargs):
@@ -31,6 +48,62 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
 
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     get_locales_display_names.cache_clear()
+    invalidate_all_rich_text()
+
+
+# Invalidate cached rich text (if enabled) when the objects it links to change
+def invalidate_all_rich_text():
+    if rich_text_cache.rich_text_cache_enabled():
+        rich_text_cache.invalidate_all()
+
+
+def invalidate_rich_text_for_pages(pages):
+    rich_text_cache.invalidate_dependency_keys(
+        {
+            rich_text_cache.get_dependency_key(Page, pk)
+            for pk in pages.values_list("pk", flat=True)
+        }
+    )
+
+
+def post_save_invalidate_rich_text(sender, instance, **kwargs):
+    # Saving a page (such as when creating a revision) doesn't change its URL;
+    # page changes that do are handled by the signals below
+    if rich_text_cache.rich_text_cache_enabled() and not isinstance(instance, Page):
+        rich_text_cache.invalidate_instances([instance])
+
+
+def post_delete_invalidate_rich_text(sender, instance, **kwargs):
+    if rich_text_cache.rich_text_cache_enabled():
+        rich_text_cache.invalidate_instances([instance])
+
+
+def page_live_status_invalidate_rich_text(sender, instance, **kwargs):
+    # Links are rendered to the live translation of a page in the active locale,
+    # so publishing or unpublishing any translation affects all of them
+    if rich_text_cache.rich_text_cache_enabled():
+        invalidate_rich_text_for_pages(
+            Page.objects.filter(translation_key=instance.translation_key)
+        )
+
+
+def page_url_change_invalidate_rich_text(sender, instance, **kwargs):
+    if rich_text_cache.rich_text_cache_enabled():
+        if not Page.objects.child_of(instance).exists():
+            # Only the URLs of the page (and so of its translations) change
+            invalidate_rich_text_for_pages(
+                Page.objects.filter(translation_key=instance.translation_key)
+            )
+        else:
+            # The URLs of all descendants change too, so rather than looking them all up,
+            # mark all cached rich text that links to pages as stale
+            rich_text_cache.invalidate_model(Page)
+
+
+# Invalidate cached page permissions (if enabled) when permissions, group
+# memberships or the paths of pages change
+def page_permissions_changed(sender, **kwargs):
+    invalidate_page_permissions_cache()
 
 
 def register_signal_handlers():
@@ -42,3 +115,18 @@ def register_signal_handlers():
 
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
+
+    post_save.connect(post_save_invalidate_rich_text)
+    post_delete.connect(post_delete_invalidate_rich_text)
+    page_published.connect(page_live_status_invalidate_rich_text)
+    page_unpublished.connect(page_live_status_invalidate_rich_text)
+    page_slug_changed.connect(page_url_change_invalidate_rich_text)
+    post_page_move.connect(page_url_change_invalidate_rich_text)
+
+    post_save.connect(page_permissions_changed, sender=GroupPagePermission)
+    post_delete.connect(page_permissions_changed, sender=GroupPagePermission)
+    post_delete.connect(page_permissions_changed, sender=Group)
+    m2m_changed.connect(
+        page_permissions_changed, sender=get_user_model().groups.through
+    )
+    post_page_move.connect(page_permissions_changed)
@@ -17,6 +17,15 @@ pre_page_move = Signal()
 # provides args: instance, parent_page_before, parent_page_after, url_path_before, url_path_after
 post_page_move = Signal()
 
+# Sent once after a set of pages is moved with BulkMovePageAction (after post_page_move has been
+# sent for each page)
+# provides args: instances, parent_page_after, url_paths_before
+post_bulk_page_move = Signal()
+
+# Sent by wagtail.profiling.ServeProfilingMiddleware after a page is served
+# provides args: request, page, profile
+page_served = Signal()
+
 
 # Workflow signals
 
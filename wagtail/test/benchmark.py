@@ -1,32 +1,58 @@
 from __future__ import absolute_import, unicode_literals
 
+import json
+import os
+import platform
+import statistics
 import time
 import tracemalloc
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import wagtail
+
 
 class Benchmark:
+    """
+    Mixin for TestCase classes that runs the ``bench`` method ``repeat`` times,
+    reporting the time taken, memory allocated and number of queries run.
+
+    If the ``WAGTAIL_BENCHMARK_OUTPUT`` environment variable is set (with the
+    ``--bench-output`` option of ``runtests.py``), the results are also appended
+    to the file it names, as one JSON object per line.
+    """
+
     repeat = 10
 
+    def get_benchmark_name(self):
+        return "{}.{}".format(type(self).__module__, type(self).__qualname__)
+
     def test(self):
         timings = []
         memory_usage = []
+        query_counts = []
         tracemalloc.start()
 
         for i in range(self.repeat):
             before_memory = tracemalloc.take_snapshot()
-            start_time = time.time()
 
-            self.bench()
+            with CaptureQueriesContext(connection) as queries:
+                start_time = time.perf_counter()
+                self.bench()
+                end_time = time.perf_counter()
 
-            end_time = time.time()
             after_memory = tracemalloc.take_snapshot()
             timings.append(end_time - start_time)
+            query_counts.append(len(queries))
             memory_usage.append(
                 sum(
                     [t.size for t in after_memory.compare_to(before_memory, "filename")]
                 )
             )
 
+        tracemalloc.stop()
+
         print(
             "time min:",
             min(timings),
@@ -43,3 +69,96 @@ class Benchmark:
             "avg:",
             sum(memory_usage) / len(memory_usage),
         )  # NOQA
+        print("queries min:", min(query_counts), "max:", max(query_counts))  # NOQA
+
+        write_result(
+            {
+                "name": self.get_benchmark_name(),
+                "repeat": self.repeat,
+                "time_min": min(timings),
+                "time_max": max(timings),
+                "time_mean": statistics.mean(timings),
+                "time_median": statistics.median(timings),
+                "memory_mean": statistics.mean(memory_usage),
+                "queries_min": min(query_counts),
+                "queries_max": max(query_counts),
+            }
+        )
+
+
+def write_result(result):
+    path = os.environ.get("WAGTAIL_BENCHMARK_OUTPUT")
+    if not path:
+        return
+
+    result = dict(
+        result,
+        database=connection.vendor,
+        python=platform.python_version(),
+        wagtail=wagtail.__version__,
+    )
+
+    with open(path, "a") as f:
+        f.write(json.dumps(result, sort_keys=True) + "\n")
+
+
+def get_tree_options(**defaults):
+    """
+    Returns the shape of the page tree to build for front-end benchmarks,
+    taking each option from a ``WAGTAIL_BENCHMARK_<OPTION>`` environment
+    variable if set, or the given default otherwise
+    """
+    return {
+        name: int(os.environ.get("WAGTAIL_BENCHMARK_" + name.upper(), default))
+        for name, default in defaults.items()
+    }
+
+
+def build_page_tree(parent, depth, fan_out, stream_blocks, links_per_block):
+    """
+    Builds a tree of ``StreamPage`` pages below ``parent``, ``depth`` levels
+    deep with ``fan_out`` children per page. Each page body has
+    ``stream_blocks`` blocks, alternating between text and rich text that links
+    to ``links_per_block`` other pages in the tree.
+
+    Returns the pages created, in depth-first order.
+    """
+    from wagtail.test.testapp.models import StreamPage
+
+    pages = []
+
+    def add_children(page, level):
+        for i in range(fan_out):
+            child = page.add_child(
+                instance=StreamPage(
+                    title="Page {}".format(len(pages) + 1),
+                    slug="page-{}".format(i + 1),
+                    body="[]",
+                )
+            )
+            pages.append(child)
+            if level < depth:
+                add_children(child, level + 1)
+
+    add_children(parent, 1)
+
+    # The page IDs aren't known until the tree has been built, so the bodies
+    # are filled in afterwards
+    for index, page in enumerate(pages):
+        body = []
+        for block_index in range(stream_blocks):
+            if block_index % 2:
+                links = "".join(
+                    '<a linktype="page" id="{}">link</a> '.format(
+                        pages[(index + block_index + link) % len(pages)].id
+                    )
+                    for link in range(links_per_block)
+                )
+                body.append({"type": "rich_text", "value": "<p>" + links + "</p>"})
+            else:
+                body.append({"type": "text", "value": "Block {}".format(block_index)})
+
+        page.body = json.dumps(body)
+        page.save(update_fields=["body"])
+
+    return pages
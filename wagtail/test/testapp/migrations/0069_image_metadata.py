@@ -0,0 +1,73 @@
+# Generated by Django 4.0.10 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tests", "0068_index_customimage_file_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customimage",
+            name="color_mode",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimage",
+            name="exif_orientation",
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="customimage",
+            name="file_format",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimage",
+            name="is_animated",
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="customimagefilepath",
+            name="color_mode",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimagefilepath",
+            name="exif_orientation",
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="customimagefilepath",
+            name="file_format",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimagefilepath",
+            name="is_animated",
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="customimagewithauthor",
+            name="color_mode",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimagewithauthor",
+            name="exif_orientation",
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="customimagewithauthor",
+            name="file_format",
+            field=models.CharField(blank=True, editable=False, max_length=10),
+        ),
+        migrations.AddField(
+            model_name="customimagewithauthor",
+            name="is_animated",
+            field=models.BooleanField(editable=False, null=True),
+        ),
+    ]
@@ -104,6 +104,7 @@ class WagtailTestUtils:
             yield
         finally:
             hooks._hooks[hook_name].remove((fn, order))
+            hooks._clear_compiled_hooks(hook_name)
 
     def _tag_is_equal(self, tag1, tag2):
         if not hasattr(tag1, "name") or not hasattr(tag2, "name"):
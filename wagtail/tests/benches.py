@@ -0,0 +1,97 @@
+from django.test import RequestFactory, TestCase
+
+from wagtail.models import Page, Site
+from wagtail.rich_text import expand_db_html
+from wagtail.test.benchmark import Benchmark, build_page_tree, get_tree_options
+from wagtail.test.testapp.models import StreamPage
+
+
+class PageTreeBenchmark(Benchmark):
+    """
+    Builds a tree of StreamPages below the default site's homepage, with a shape
+    that can be adjusted through the WAGTAIL_BENCHMARK_DEPTH,
+    WAGTAIL_BENCHMARK_FAN_OUT, WAGTAIL_BENCHMARK_STREAM_BLOCKS and
+    WAGTAIL_BENCHMARK_LINKS_PER_BLOCK environment variables
+    """
+
+    def setUp(self):
+        self.root_page = Site.objects.get(is_default_site=True).root_page
+
+        self.tree_options = get_tree_options(
+            depth=3, fan_out=5, stream_blocks=20, links_per_block=3
+        )
+        self.pages = build_page_tree(self.root_page, **self.tree_options)
+
+        # The first page at the deepest level of the tree
+        self.deepest_page = self.pages[self.tree_options["depth"] - 1]
+        self.deepest_page_url = self.deepest_page.get_url()
+
+    def get_benchmark_name(self):
+        return "{}[{depth}x{fan_out},{stream_blocks}x{links_per_block}]".format(
+            super().get_benchmark_name(), **self.tree_options
+        )
+
+
+class BenchRoute(PageTreeBenchmark, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = RequestFactory().get(self.deepest_page_url)
+        self.path_components = [
+            component for component in self.deepest_page_url.split("/") if component
+        ]
+
+    def bench(self):
+        page, args, kwargs = self.root_page.specific.route(
+            self.request, self.path_components
+        )
+        self.assertEqual(page.id, self.deepest_page.id)
+
+
+class BenchServe(PageTreeBenchmark, TestCase):
+    def bench(self):
+        response = self.client.get(self.deepest_page_url)
+        self.assertEqual(response.status_code, 200)
+
+
+class BenchSitemap(PageTreeBenchmark, TestCase):
+    def bench(self):
+        response = self.client.get("/sitemap.xml")
+        self.assertEqual(response.status_code, 200)
+
+
+class BenchAPIListing(PageTreeBenchmark, TestCase):
+    def bench(self):
+        response = self.client.get(
+            "/api/main/pages/", {"type": "tests.StreamPage", "fields": "body"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class BenchSpecificIterable(PageTreeBenchmark, TestCase):
+    def bench(self):
+        pages = list(Page.objects.descendant_of(self.root_page).specific())
+        self.assertEqual(len(pages), len(self.pages))
+
+
+class BenchStreamValueRender(PageTreeBenchmark, TestCase):
+    def bench(self):
+        page = StreamPage.objects.get(id=self.deepest_page.id)
+        self.assertTrue(str(page.body))
+
+
+class BenchExpandDbHtml(PageTreeBenchmark, TestCase):
+    def setUp(self):
+        super().setUp()
+        page = StreamPage.objects.get(id=self.deepest_page.id)
+        self.html = "".join(
+            block.value.source for block in page.body if block.block_type == "rich_text"
+        )
+
+    def bench(self):
+        self.assertIn("href", expand_db_html(self.html))
+
+
+class BenchGetUrlParts(PageTreeBenchmark, TestCase):
+    def bench(self):
+        for page in self.pages:
+            page.get_url_parts()
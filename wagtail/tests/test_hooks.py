@@ -1,4 +1,6 @@
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
 
 from wagtail import hooks
 from wagtail.test.utils import WagtailTestUtils
@@ -18,6 +20,7 @@ class TestLoginView(TestCase, WagtailTestUtils):
     @classmethod
     def tearDownClass(cls):
         del hooks._hooks["test_hook_name"]
+        hooks._clear_compiled_hooks("test_hook_name")
 
     def test_before_hook(self):
         def before_hook():
@@ -34,3 +37,84 @@ class TestLoginView(TestCase, WagtailTestUtils):
         with self.register_hook("test_hook_name", after_hook, order=1):
             hook_fns = hooks.get_hooks("test_hook_name")
             self.assertEqual(hook_fns, [test_hook, after_hook])
+
+
+class TestCompiledHooks(TestCase):
+    def tearDown(self):
+        hooks.reset_hook_stats()
+
+    def test_hooks_are_sorted_once(self):
+        def first_hook():
+            pass
+
+        def second_hook():
+            pass
+
+        with hooks.register_temporarily("test_compiled_hook", second_hook, order=1):
+            with hooks.register_temporarily("test_compiled_hook", first_hook):
+                self.assertEqual(
+                    hooks.get_hooks("test_compiled_hook"), [first_hook, second_hook]
+                )
+
+                with patch("wagtail.hooks.sorted") as sorted_mock:
+                    self.assertEqual(
+                        hooks.get_hooks("test_compiled_hook"),
+                        [first_hook, second_hook],
+                    )
+                sorted_mock.assert_not_called()
+
+            # Unregistering a hook updates the compiled list
+            self.assertEqual(hooks.get_hooks("test_compiled_hook"), [second_hook])
+
+        self.assertEqual(hooks.get_hooks("test_compiled_hook"), [])
+
+    def test_registering_clears_only_affected_hook(self):
+        hooks.get_hooks("test_compiled_hook")
+        hooks.get_hooks("test_other_compiled_hook")
+
+        with hooks.register_temporarily("test_compiled_hook", test_hook):
+            self.assertNotIn(("test_compiled_hook", False), hooks._compiled_hooks)
+            self.assertIn(("test_other_compiled_hook", False), hooks._compiled_hooks)
+
+    def test_returned_list_can_be_modified(self):
+        with hooks.register_temporarily("test_compiled_hook", test_hook):
+            hooks.get_hooks("test_compiled_hook").append(None)
+            self.assertEqual(hooks.get_hooks("test_compiled_hook"), [test_hook])
+
+    @override_settings(WAGTAIL_HOOKS_INSTRUMENTATION=True)
+    def test_instrumentation(self):
+        def slow_hook(value):
+            return value * 2
+
+        class HookClass:
+            pass
+
+        with hooks.register_temporarily(
+            [("test_compiled_hook", slow_hook), ("test_compiled_hook", HookClass)]
+        ):
+            for i in range(3):
+                instrumented_hook, hook_class = hooks.get_hooks("test_compiled_hook")
+                self.assertEqual(instrumented_hook(i), i * 2)
+
+        self.assertIs(hook_class, HookClass)
+        self.assertEqual(instrumented_hook.__wrapped__, slow_hook)
+
+        stats = hooks.get_hook_stats()
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]["hook_name"], "test_compiled_hook")
+        self.assertEqual(
+            stats[0]["function"],
+            "wagtail.tests.test_hooks.TestCompiledHooks.test_instrumentation.<locals>.slow_hook",
+        )
+        self.assertEqual(stats[0]["calls"], 3)
+        self.assertGreater(stats[0]["total_time"], 0)
+
+        hooks.reset_hook_stats()
+        self.assertEqual(hooks.get_hook_stats(), [])
+
+    def test_no_instrumentation_by_default(self):
+        with hooks.register_temporarily("test_compiled_hook", test_hook):
+            self.assertIs(hooks.get_hooks("test_compiled_hook")[0], test_hook)
+            hooks.get_hooks("test_compiled_hook")[0]()
+
+        self.assertEqual(hooks.get_hook_stats(), [])
@@ -5,10 +5,11 @@ from unittest import mock
 from django.contrib.auth import get_user_model
 from django.core import management
 from django.db import models
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
-from wagtail.models import Collection, Page, PageLogEntry, Revision
+from wagtail.management.commands.purge_revisions import move_comments_from_revisions
+from wagtail.models import Collection, Comment, Page, PageLogEntry, Revision
 from wagtail.signals import page_published, page_unpublished
 from wagtail.test.testapp.models import EventPage, SecretPage, SimplePage
 
@@ -350,6 +351,114 @@ class TestPublishScheduledPagesCommand(TestCase):
             ).exists()
         )
 
+    @override_settings(
+        WAGTAIL_REVISION_DELTA_STORAGE=True, WAGTAIL_REVISION_SNAPSHOT_INTERVAL=5
+    )
+    def test_expired_delta_revisions_are_dropped_from_mod_queue(self):
+        page = SimplePage(
+            title="Hello world!",
+            slug="hello-world",
+            content="hello",
+            live=False,
+        )
+        self.root_page.add_child(instance=page)
+        page.save_revision()
+
+        # Stored as a delta against the first revision
+        page.expire_at = timezone.now() - timedelta(days=1)
+        revision = page.save_revision(submitted_for_moderation=True)
+        self.assertIsNotNone(revision.delta_base_id)
+        self.assertEqual(revision.expire_at, page.expire_at)
+
+        management.call_command("publish_scheduled_pages")
+
+        revision.refresh_from_db()
+        self.assertFalse(revision.submitted_for_moderation)
+
+    @override_settings(
+        WAGTAIL_REVISION_DELTA_STORAGE=True, WAGTAIL_REVISION_SNAPSHOT_INTERVAL=5
+    )
+    def test_dryrun_lists_delta_revisions(self):
+        page = SimplePage(
+            title="Hello world!",
+            slug="hello-world",
+            content="hello",
+            live=False,
+        )
+        self.root_page.add_child(instance=page)
+        page.save_revision()
+
+        page.title = "Goodbye world!"
+        page.expire_at = timezone.now() - timedelta(days=1)
+        revision = page.save_revision(submitted_for_moderation=True)
+        self.assertIsNotNone(revision.delta_base_id)
+
+        page.title = "Hello again"
+        page.expire_at = None
+        revision = page.save_revision(
+            approved_go_live_at=timezone.now() - timedelta(days=1)
+        )
+        self.assertIsNotNone(revision.delta_base_id)
+
+        output = StringIO()
+        management.call_command("publish_scheduled_pages", dryrun=True, stdout=output)
+        output = output.getvalue()
+        self.assertIn("hello-world\tGoodbye world!", output)
+        self.assertIn("hello-world\tHello again", output)
+        self.assertNotIn("None", output)
+
+    def create_scheduled_pages(self, count):
+        pages = []
+        for i in range(count):
+            page = SimplePage(
+                title="Hello world %d" % i,
+                slug="hello-world-%d" % i,
+                content="hello",
+                live=False,
+                go_live_at=timezone.now() - timedelta(days=1),
+            )
+            self.root_page.add_child(instance=page)
+            page.save_revision(approved_go_live_at=timezone.now() - timedelta(days=1))
+            pages.append(page)
+        return pages
+
+    def test_limit(self):
+        pages = self.create_scheduled_pages(3)
+
+        management.call_command("publish_scheduled_pages", batch_size=1, limit=2)
+
+        self.assertEqual(
+            list(
+                Page.objects.filter(id__in=[page.id for page in pages])
+                .order_by("id")
+                .values_list("live", flat=True)
+            ),
+            [True, True, False],
+        )
+
+        # The remaining page is published by the next run
+        management.call_command("publish_scheduled_pages", batch_size=1, limit=2)
+
+        self.assertFalse(
+            Page.objects.filter(id__in=[page.id for page in pages], live=False).exists()
+        )
+
+    def test_search_index_updates_are_batched(self):
+        pages = self.create_scheduled_pages(3)
+
+        with mock.patch(
+            "wagtail.search.index.insert_or_update_objects"
+        ) as insert_or_update_objects:
+            management.call_command("publish_scheduled_pages", batch_size=2)
+
+        insert_or_update_objects.assert_called_once()
+        indexed_pages = list(insert_or_update_objects.call_args.args[0])
+        self.assertEqual(
+            [(type(page), page.id) for page in indexed_pages],
+            [(SimplePage, page.id) for page in pages],
+        )
+        self.assertTrue(all(page.live for page in indexed_pages))
+
 
 class TestPurgeRevisionsCommand(TestCase):
     fixtures = ["test.json"]
@@ -459,6 +568,200 @@ class TestPurgeRevisionsCommand(TestCase):
             old_revision, Revision.page_revisions.filter(object_id=self.page.id)
         )
 
+    def test_dry_run(self):
+        old_revision = self.page.save_revision()
+        self.page.save_revision()
+
+        output = StringIO()
+        management.call_command("purge_revisions", "--dry-run", stdout=output)
+
+        self.assertEqual(output.getvalue().strip(), "1 revisions would be deleted")
+        self.assertIn(
+            old_revision, Revision.page_revisions.filter(object_id=self.page.id)
+        )
+
+    def test_purge_revisions_in_batches(self):
+        revisions = [self.page.save_revision() for i in range(5)]
+
+        output = StringIO()
+        management.call_command(
+            "purge_revisions", "--batch-size=2", verbosity=2, stdout=output
+        )
+
+        self.assertEqual(
+            list(Revision.page_revisions.filter(object_id=self.page.id)),
+            [revisions[-1]],
+        )
+        self.assertIn(
+            "Deleted 2 revisions, up to ID %d" % revisions[1].id, output.getvalue()
+        )
+        self.assertIn(
+            "Deleted 4 revisions, up to ID %d" % revisions[3].id, output.getvalue()
+        )
+
+    def test_purge_revisions_start_after(self):
+        revisions = [self.page.save_revision() for i in range(3)]
+
+        management.call_command(
+            "purge_revisions", "--start-after=%d" % revisions[0].id, stdout=StringIO()
+        )
+
+        self.assertEqual(
+            list(Revision.page_revisions.filter(object_id=self.page.id).order_by("id")),
+            [revisions[0], revisions[2]],
+        )
+
+    def test_comments_moved_to_next_revision(self):
+        revisions = [self.page.save_revision() for i in range(3)]
+        comment = Comment.objects.create(
+            page=self.page,
+            user=get_user_model().objects.first(),
+            text="A comment",
+            contentpath="content",
+            revision_created=revisions[0],
+        )
+
+        self.run_command()
+
+        # both earlier revisions are deleted in the same batch, so the comment
+        # moves to the latest revision rather than the one after its own
+        comment.refresh_from_db()
+        self.assertEqual(comment.revision_created, revisions[2])
+
+    def test_comments_on_many_pages_moved_in_constant_queries(self):
+        user = get_user_model().objects.first()
+        pages = [
+            Page.objects.get(url_path=url_path).specific
+            for url_path in [
+                "/home/about-us/",
+                "/home/events/",
+                "/home/events/christmas/",
+            ]
+        ]
+        revisions_to_delete = []
+        comments = []
+        next_revisions = []
+        for page in pages:
+            revisions = [page.save_revision() for i in range(3)]
+            revisions_to_delete.append(revisions[0])
+            next_revisions.append(revisions[1])
+            comments.append(
+                Comment.objects.create(
+                    page=page,
+                    user=user,
+                    text="A comment",
+                    contentpath="content",
+                    revision_created=revisions[0],
+                )
+            )
+
+        with self.assertNumQueries(3):
+            move_comments_from_revisions(revisions_to_delete)
+
+        for comment, next_revision in zip(comments, next_revisions):
+            comment.refresh_from_db()
+            self.assertEqual(comment.revision_created, next_revision)
+
+
+class TestCompressRevisionsCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.page = Page.objects.get(url_path="/home/about-us/").specific
+        self.revisions = []
+        for i in range(5):
+            self.page.title = "About us %d" % i
+            self.revisions.append(self.page.save_revision())
+
+    def get_stored_revisions(self):
+        return list(
+            Revision.objects.filter(
+                id__in=[revision.id for revision in self.revisions]
+            ).order_by("id")
+        )
+
+    def test_compress_and_expand(self):
+        output = StringIO()
+        management.call_command("compress_revisions", "--interval=2", stdout=output)
+        self.assertIn("Stored 2 revisions as deltas", output.getvalue())
+
+        first, second, third, fourth, fifth = self.get_stored_revisions()
+        self.assertEqual(
+            [
+                revision.delta_base_id
+                for revision in (first, second, third, fourth, fifth)
+            ],
+            [None, first.id, None, third.id, None],
+        )
+        self.assertEqual(
+            [
+                revision.get_content()["title"]
+                for revision in self.get_stored_revisions()
+            ],
+            ["About us %d" % i for i in range(5)],
+        )
+
+        # Running again with a different interval changes the snapshots
+        management.call_command("compress_revisions", "--interval=3", stdout=StringIO())
+        first, second, third, fourth, fifth = self.get_stored_revisions()
+        self.assertEqual(
+            [
+                revision.delta_base_id
+                for revision in (first, second, third, fourth, fifth)
+            ],
+            [None, first.id, first.id, None, fourth.id],
+        )
+        self.assertEqual(
+            [
+                revision.get_content()["title"]
+                for revision in self.get_stored_revisions()
+            ],
+            ["About us %d" % i for i in range(5)],
+        )
+
+        output = StringIO()
+        management.call_command("compress_revisions", "--expand", stdout=output)
+        self.assertIn("Expanded 3 revisions", output.getvalue())
+        self.assertFalse(Revision.objects.filter(delta_base__isnull=False).exists())
+        self.assertEqual(
+            [
+                revision.get_content()["title"]
+                for revision in self.get_stored_revisions()
+            ],
+            ["About us %d" % i for i in range(5)],
+        )
+
+
+class TestFixDescendantCountsCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def get_counts(self, url_path):
+        return (
+            Page.objects.filter(url_path=url_path)
+            .values_list("descendant_count", "live_descendant_count")
+            .get()
+        )
+
+    def test_fix_descendant_counts(self):
+        # The fixture doesn't include counts
+        output = StringIO()
+        management.call_command("fix_descendant_counts", "--dry-run", stdout=output)
+        self.assertIn("Incorrect descendant counts found for pages", output.getvalue())
+        self.assertEqual(self.get_counts("/home/events/"), (0, 0))
+
+        output = StringIO()
+        management.call_command("fix_descendant_counts", stdout=output)
+        self.assertIn("Fixed descendant counts of 5 pages.", output.getvalue())
+        self.assertEqual(self.get_counts("/"), (20, 16))
+        self.assertEqual(self.get_counts("/home/"), (18, 14))
+        self.assertEqual(self.get_counts("/home/events/"), (7, 3))
+        self.assertEqual(self.get_counts("/home/events/businessy-events/"), (1, 0))
+        self.assertEqual(self.get_counts("/home/events/christmas/"), (0, 0))
+
+        output = StringIO()
+        management.call_command("fix_descendant_counts", stdout=output)
+        self.assertIn("No problems found.", output.getvalue())
+
 
 class TestCreateLogEntriesFromRevisionsCommand(TestCase):
     fixtures = ["test.json"]
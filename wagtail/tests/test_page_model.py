@@ -1,5 +1,6 @@
 import datetime
 import unittest
+from io import StringIO
 from unittest.mock import Mock
 
 import pytz
@@ -7,26 +8,40 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.core import management, serializers
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection, transaction
 from django.http import Http404, HttpRequest
 from django.test import Client, TestCase
 from django.test.client import RequestFactory
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils import timezone, translation
 from freezegun import freeze_time
+from treebeard.exceptions import InvalidMoveToDescendant
 
 from wagtail.actions.copy_for_translation import ParentNotTranslatedError
+from wagtail.actions.move_page import BulkMovePageAction
+from wagtail.management.commands.fix_descendant_counts import (
+    find_incorrect_descendant_counts,
+)
 from wagtail.models import (
     Comment,
     Locale,
     Page,
     PageLogEntry,
     PageManager,
+    Revision,
     Site,
     get_page_models,
     get_translatable_models,
 )
-from wagtail.signals import page_published
+from wagtail.signals import (
+    page_published,
+    post_bulk_page_move,
+    post_page_move,
+    pre_page_move,
+)
 from wagtail.test.testapp.models import (
     AbstractPage,
     Advert,
@@ -942,6 +957,154 @@ class TestMovePage(TestCase):
         self.assertEqual(christmas.url_path, "/home/about-us/events/christmas/")
 
 
+@override_settings(WAGTAIL_PAGE_DESCENDANT_COUNTS=True)
+class TestBulkMovePage(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        # Counts aren't included in the fixture
+        management.call_command("fix_descendant_counts", stdout=StringIO())
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+        self.pages = [
+            Page.objects.get(url_path="/home/events/"),
+            # Moved out of the events index, which is also being moved
+            Page.objects.get(url_path="/home/events/businessy-events/"),
+            Page.objects.get(url_path="/home/secret-plans/"),
+        ]
+
+    def get_tree(self):
+        return list(
+            Page.objects.order_by("id").values_list(
+                "id",
+                "path",
+                "depth",
+                "numchild",
+                "url_path",
+                "descendant_count",
+                "live_descendant_count",
+            )
+        )
+
+    def test_bulk_move_matches_move(self):
+        with transaction.atomic():
+            for page in self.pages:
+                Page.objects.get(id=page.id).move(
+                    Page.objects.get(id=self.about_us_page.id), pos="last-child"
+                )
+            expected_tree = self.get_tree()
+            transaction.set_rollback(True)
+
+        BulkMovePageAction(self.pages, self.about_us_page).execute()
+
+        self.assertEqual(self.get_tree(), expected_tree)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        self.assertEqual(find_incorrect_descendant_counts(), [])
+        self.assertEqual(
+            Page.objects.get(id=self.pages[1].id).url_path,
+            "/home/about-us/businessy-events/",
+        )
+        self.assertEqual(
+            Page.objects.get(slug="board-meetings").url_path,
+            "/home/about-us/businessy-events/board-meetings/",
+        )
+
+    def test_bulk_move_signals(self):
+        received = []
+
+        def receiver(signal, sender, **kwargs):
+            received.append((signal, kwargs))
+
+        for signal in [pre_page_move, post_page_move, post_bulk_page_move]:
+            signal.connect(receiver)
+            self.addCleanup(signal.disconnect, receiver)
+
+        BulkMovePageAction(self.pages, self.about_us_page).execute()
+
+        self.assertEqual(
+            [signal for signal, kwargs in received],
+            [pre_page_move] * 3 + [post_page_move] * 3 + [post_bulk_page_move],
+        )
+        pre_kwargs = received[1][1]
+        self.assertEqual(pre_kwargs["instance"], self.pages[1])
+        self.assertEqual(pre_kwargs["parent_page_before"].url_path, "/home/events/")
+        self.assertEqual(pre_kwargs["parent_page_after"], self.about_us_page)
+        self.assertEqual(
+            pre_kwargs["url_path_before"], "/home/events/businessy-events/"
+        )
+        self.assertEqual(
+            pre_kwargs["url_path_after"], "/home/about-us/businessy-events/"
+        )
+
+        post_kwargs = received[4][1]
+        self.assertIsInstance(post_kwargs["instance"], BusinessIndex)
+        self.assertEqual(
+            post_kwargs["instance"].url_path, "/home/about-us/businessy-events/"
+        )
+
+        bulk_kwargs = received[6][1]
+        self.assertEqual(
+            [page.url_path for page in bulk_kwargs["instances"]],
+            [
+                "/home/about-us/events/",
+                "/home/about-us/businessy-events/",
+                "/home/about-us/secret-plans/",
+            ],
+        )
+        self.assertEqual(
+            bulk_kwargs["url_paths_before"][self.pages[2].id], "/home/secret-plans/"
+        )
+
+    def test_bulk_move_logs(self):
+        BulkMovePageAction(self.pages, self.about_us_page).execute()
+
+        log_entry = PageLogEntry.objects.get(page=self.pages[1], action="wagtail.move")
+        self.assertEqual(log_entry.data["source"]["id"], self.pages[0].id)
+        self.assertEqual(log_entry.data["destination"]["id"], self.about_us_page.id)
+
+    def test_bulk_move_queries(self):
+        with transaction.atomic(), CaptureQueriesContext(connection) as queries:
+            for page in self.pages:
+                Page.objects.get(id=page.id).move(
+                    Page.objects.get(id=self.about_us_page.id), pos="last-child"
+                )
+            transaction.set_rollback(True)
+
+        with CaptureQueriesContext(connection) as bulk_queries:
+            BulkMovePageAction(self.pages, self.about_us_page).execute()
+
+        self.assertLess(len(bulk_queries), len(queries))
+
+    def test_cannot_move_to_descendant(self):
+        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
+        with self.assertRaises(InvalidMoveToDescendant):
+            BulkMovePageAction(self.pages, christmas_page).execute()
+
+    def test_bulk_move_site_root_clears_site_root_paths(self):
+        root_page = Page.objects.get(depth=1)
+        new_root = root_page.add_child(
+            instance=SimplePage(title="New root", slug="new-root", content="hello")
+        )
+        self.assertEqual(Site.get_site_root_paths()[0].root_path, "/home/")
+
+        BulkMovePageAction([Page.objects.get(url_path="/home/")], new_root).execute()
+
+        self.assertEqual(Site.get_site_root_paths()[0].root_path, "/new-root/home/")
+
+    def test_bulk_move_keeps_site_root_paths(self):
+        Site.get_site_root_paths()
+
+        BulkMovePageAction(self.pages, self.about_us_page).execute()
+
+        self.assertIsNotNone(cache.get("wagtail_site_root_paths"))
+
+    def test_cannot_move_with_duplicate_slug(self):
+        page = self.pages[0].add_child(
+            instance=SimplePage(title="About us", slug="about-us", content="hello")
+        )
+        with self.assertRaises(ValidationError):
+            BulkMovePageAction([page], self.about_us_page.get_parent()).execute()
+
+
 class TestPrevNextSiblings(TestCase):
     fixtures = ["test.json"]
 
@@ -990,6 +1153,248 @@ class TestSaveRevision(TestCase):
         )
 
 
+@override_settings(
+    WAGTAIL_REVISION_DELTA_STORAGE=True, WAGTAIL_REVISION_SNAPSHOT_INTERVAL=3
+)
+class TestRevisionDeltaStorage(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.page = Page.objects.get(url_path="/home/about-us/").specific
+        self.revisions = []
+        for i in range(5):
+            self.page.title = "About us %d" % i
+            self.revisions.append(self.page.save_revision())
+
+    def test_revisions_stored_against_snapshots(self):
+        first, second, third, fourth, fifth = self.revisions
+        self.assertEqual(
+            [revision.delta_base_id for revision in self.revisions],
+            [None, first.id, first.id, None, fourth.id],
+        )
+
+        # The stored content of a delta only holds the changes
+        stored_content = Revision.objects.filter(id=second.id).values_list(
+            "content", flat=True
+        )[0]
+        self.assertEqual(stored_content["set"]["title"], "About us 1")
+        self.assertNotIn("slug", stored_content["set"])
+
+    def test_content_is_expanded(self):
+        second = Revision.objects.get(id=self.revisions[1].id)
+        self.assertEqual(second.get_content()["title"], "About us 1")
+        self.assertEqual(second.get_content()["slug"], "about-us")
+        self.assertEqual(second.as_object().title, "About us 1")
+
+        self.assertEqual(second.get_previous().get_content()["title"], "About us 0")
+        self.assertEqual(second.get_next().get_content()["title"], "About us 2")
+
+    def test_save_without_content(self):
+        second = Revision.objects.get(id=self.revisions[1].id)
+        second.submitted_for_moderation = True
+        second.save(update_fields=["submitted_for_moderation"])
+
+        second = Revision.objects.get(id=second.id)
+        self.assertEqual(second.delta_base_id, self.revisions[0].id)
+        self.assertEqual(second.get_content()["title"], "About us 1")
+
+    def test_saving_unchanged_snapshot_keeps_deltas(self):
+        first = Revision.objects.get(id=self.revisions[0].id)
+        first.approved_go_live_at = timezone.now() + datetime.timedelta(days=1)
+        first.save()
+
+        self.assertEqual(
+            Revision.objects.get(id=self.revisions[1].id).delta_base_id, first.id
+        )
+
+    def test_changing_snapshot_expands_deltas(self):
+        first = Revision.objects.get(id=self.revisions[0].id)
+        first.content = dict(first.content, title="Changed")
+        first.save()
+
+        second = Revision.objects.get(id=self.revisions[1].id)
+        self.assertIsNone(second.delta_base_id)
+        self.assertEqual(second.get_content()["title"], "About us 1")
+
+    def test_deleting_snapshot_expands_deltas(self):
+        first, second, third = self.revisions[:3]
+        first.delete()
+
+        second = Revision.objects.get(id=second.id)
+        self.assertIsNone(second.delta_base_id)
+        self.assertEqual(second.get_content()["title"], "About us 1")
+        self.assertEqual(
+            Revision.objects.get(id=third.id).get_content()["title"], "About us 2"
+        )
+
+    def test_deleting_snapshot_with_deltas(self):
+        # Deleting a snapshot along with some of its deltas expands the others
+        Revision.objects.filter(id__in=[r.id for r in self.revisions[:2]]).delete()
+
+        third = Revision.objects.get(id=self.revisions[2].id)
+        self.assertIsNone(third.delta_base_id)
+        self.assertEqual(third.get_content()["title"], "About us 2")
+
+    def test_content_holds_stored_delta(self):
+        second = Revision.objects.get(id=self.revisions[1].id)
+        self.assertEqual(second.content["set"]["title"], "About us 1")
+        self.assertEqual(self.revisions[1].content, second.content)
+        self.assertEqual(self.revisions[1].get_content()["title"], "About us 1")
+
+    def test_dump_and_load(self):
+        # Serialized revisions hold the stored deltas along with their delta_base, so they
+        # can be loaded back as long as their snapshots are loaded too
+        data = serializers.serialize(
+            "json", Revision.objects.filter(id__in=[r.id for r in self.revisions])
+        )
+        Revision.objects.filter(id__in=[r.id for r in self.revisions]).update(
+            delta_base=None
+        )
+        Revision.objects.filter(id__in=[r.id for r in self.revisions]).delete()
+
+        for deserialized_object in serializers.deserialize("json", data):
+            deserialized_object.save()
+
+        self.assertEqual(
+            [
+                Revision.objects.get(id=revision.id).get_content()["title"]
+                for revision in self.revisions
+            ],
+            ["About us %d" % i for i in range(5)],
+        )
+
+    @override_settings(WAGTAIL_REVISION_DELTA_STORAGE=False)
+    def test_disabled(self):
+        revision = self.page.save_revision()
+        self.assertIsNone(revision.delta_base_id)
+
+        # Existing deltas can still be read
+        self.assertEqual(
+            Revision.objects.get(id=self.revisions[1].id).get_content()["title"],
+            "About us 1",
+        )
+
+
+@override_settings(WAGTAIL_PAGE_DESCENDANT_COUNTS=True)
+class TestDescendantCounts(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        # Counts aren't included in the fixture
+        management.call_command("fix_descendant_counts", stdout=StringIO())
+        self.root_page = Page.objects.get(depth=1)
+        self.home_page = Page.objects.get(url_path="/home/")
+        self.events_page = Page.objects.get(url_path="/home/events/")
+
+    def get_counts(self, page):
+        return (
+            Page.objects.filter(id=page.id)
+            .values_list("descendant_count", "live_descendant_count")
+            .get()
+        )
+
+    def assertCountsCorrect(self):
+        self.assertEqual(find_incorrect_descendant_counts(), [])
+
+    def test_counts(self):
+        self.assertEqual(self.get_counts(self.events_page), (7, 3))
+        self.assertEqual(self.get_counts(self.home_page), (18, 14))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.events_page.get_descendant_count(), 7)
+            self.assertEqual(self.events_page.get_live_descendant_count(), 3)
+
+    def test_add_page(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        christmas.add_child(
+            instance=SimplePage(title="Live", slug="live", content="hello")
+        )
+        christmas.add_child(
+            instance=SimplePage(
+                title="Draft", slug="draft", content="hello", live=False
+            )
+        )
+
+        self.assertEqual(self.get_counts(christmas), (2, 1))
+        self.assertEqual(self.get_counts(self.events_page), (9, 4))
+        self.assertEqual(self.get_counts(self.home_page), (20, 15))
+        self.assertCountsCorrect()
+
+    def test_saving_stale_instance_keeps_counts(self):
+        self.events_page.add_child(
+            instance=SimplePage(title="New", slug="new", content="hello")
+        )
+
+        # self.home_page was loaded before the page was added
+        self.home_page.title = "Home"
+        self.home_page.save()
+
+        self.assertEqual(self.get_counts(self.home_page), (19, 15))
+
+    def test_unpublish_and_publish(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/").specific
+        christmas.unpublish()
+        self.assertEqual(self.get_counts(self.events_page), (7, 2))
+        self.assertEqual(self.get_counts(self.home_page), (18, 13))
+
+        christmas.save_revision().publish()
+        self.assertEqual(self.get_counts(self.events_page), (7, 3))
+        self.assertEqual(self.get_counts(self.home_page), (18, 14))
+        self.assertCountsCorrect()
+
+    def test_move_page(self):
+        businessy_events = Page.objects.get(url_path="/home/events/businessy-events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        businessy_events.move(about_us, pos="last-child")
+
+        self.assertEqual(self.get_counts(self.events_page), (5, 3))
+        self.assertEqual(self.get_counts(about_us), (2, 0))
+        self.assertEqual(self.get_counts(self.home_page), (18, 14))
+        self.assertCountsCorrect()
+
+    def test_move_page_before_ancestor(self):
+        # Moving the page shifts the paths of its old ancestors
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        christmas.move(self.events_page, pos="left")
+
+        self.assertEqual(self.get_counts(self.events_page), (6, 2))
+        self.assertEqual(self.get_counts(self.home_page), (18, 14))
+        self.assertCountsCorrect()
+
+    def test_delete_page(self):
+        Page.objects.get(url_path="/home/events/businessy-events/").delete()
+
+        self.assertEqual(self.get_counts(self.events_page), (5, 3))
+        self.assertEqual(self.get_counts(self.home_page), (16, 14))
+        self.assertEqual(self.get_counts(self.root_page), (18, 16))
+        self.assertCountsCorrect()
+
+    def test_copy_page(self):
+        self.events_page.copy(
+            recursive=True,
+            update_attrs={"title": "New events", "slug": "new-events"},
+        )
+
+        self.assertEqual(self.get_counts(self.home_page), (26, 18))
+        self.assertCountsCorrect()
+
+    def test_create_alias(self):
+        self.events_page.create_alias(recursive=True, update_slug="events-alias")
+
+        self.assertEqual(self.get_counts(self.home_page), (26, 18))
+        self.assertCountsCorrect()
+
+    @override_settings(WAGTAIL_PAGE_DESCENDANT_COUNTS=False)
+    def test_disabled(self):
+        self.events_page.add_child(
+            instance=SimplePage(title="New", slug="new", content="hello")
+        )
+
+        self.assertEqual(self.get_counts(self.events_page), (7, 3))
+        self.assertEqual(self.events_page.get_descendant_count(), 8)
+        self.assertEqual(self.events_page.get_live_descendant_count(), 4)
+
+
 class TestLiveRevision(TestCase):
     fixtures = ["test.json"]
 
@@ -2179,6 +2584,132 @@ class TestCopyPage(TestCase):
         self.assertIsNone(about_us_alias_copy.alias_of)
 
 
+class TestBulkCopyPage(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.events_index = EventIndex.objects.get(url_path="/home/events/")
+        self.user = get_user_model().objects.get(email="superuser@example.com")
+        christmas = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas.title = "Christmas draft"
+        christmas.save_revision()
+
+    def copy(self, **kwargs):
+        return self.events_index.copy(
+            recursive=True,
+            update_attrs={"title": "New events index", "slug": kwargs.pop("slug")},
+            user=self.user,
+            **kwargs,
+        )
+
+    def describe_tree(self, page):
+        # Everything about the copied descendants that should be the same whichever way they
+        # were copied
+        tree = []
+        for descendant in page.get_descendants().specific():
+            tree.append(
+                {
+                    "depth": descendant.depth,
+                    "numchild": descendant.numchild,
+                    "url_path": descendant.url_path[len(page.url_path) :],
+                    "title": descendant.title,
+                    "draft_title": descendant.draft_title,
+                    "live": descendant.live,
+                    "has_unpublished_changes": descendant.has_unpublished_changes,
+                    "live_revision": descendant.live_revision_id is not None,
+                    "first_published_at": descendant.first_published_at is not None,
+                    "owner": descendant.owner_id,
+                    "content_type": descendant.content_type_id,
+                    "speakers": [
+                        speaker.first_name
+                        for speaker in getattr(
+                            descendant, "speakers", Page.objects.none()
+                        ).all()
+                    ],
+                    "revisions": [
+                        revision.content["title"]
+                        for revision in descendant.revisions.order_by(
+                            "created_at", "id"
+                        )
+                    ],
+                    "log_entries": sorted(
+                        PageLogEntry.objects.filter(page=descendant).values_list(
+                            "action", "user_id"
+                        )
+                    ),
+                }
+            )
+        return tree
+
+    def test_bulk_copy_matches_copy(self):
+        new_events_index = self.copy(slug="copy")
+        bulk_new_events_index = self.copy(slug="bulk-copy", bulk=True)
+
+        tree = self.describe_tree(new_events_index)
+        self.assertEqual(len(tree), 7)
+        self.assertEqual(self.describe_tree(bulk_new_events_index), tree)
+        self.assertEqual(
+            Page.objects.get(id=bulk_new_events_index.id).numchild,
+            self.events_index.numchild,
+        )
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+        christmas = EventPage.objects.get(url_path="/home/bulk-copy/christmas/")
+        self.assertEqual(
+            christmas.get_latest_revision().content["speakers"][0]["pk"],
+            christmas.speakers.get().pk,
+        )
+        self.assertEqual(
+            christmas.get_latest_revision_as_page().title, "Christmas draft"
+        )
+
+    def test_bulk_copy_not_live(self):
+        bulk_new_events_index = self.copy(slug="bulk-copy", bulk=True, keep_live=False)
+
+        descendants = bulk_new_events_index.get_descendants()
+        self.assertEqual(descendants.count(), 7)
+        self.assertFalse(descendants.live().exists())
+        self.assertFalse(descendants.filter(live_revision__isnull=False).exists())
+
+    def test_bulk_copy_signals(self):
+        published_pages = []
+
+        def page_published_handler(sender, instance, revision, **kwargs):
+            self.assertEqual(instance.live_revision, revision)
+            published_pages.append(instance.url_path)
+
+        page_published.connect(page_published_handler)
+        try:
+            self.copy(slug="bulk-copy", bulk=True)
+        finally:
+            page_published.disconnect(page_published_handler)
+
+        self.assertEqual(
+            sorted(published_pages),
+            [
+                "/home/bulk-copy/",
+                "/home/bulk-copy/christmas/",
+                "/home/bulk-copy/final-event/",
+                "/home/bulk-copy/saint-patrick/",
+            ],
+        )
+
+    def test_bulk_copy_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.copy(slug="copy")
+        with CaptureQueriesContext(connection) as bulk_queries:
+            self.copy(slug="bulk-copy", bulk=True)
+
+        self.assertLess(len(bulk_queries), len(queries) / 2)
+
+    @override_settings(WAGTAIL_PAGE_DESCENDANT_COUNTS=True)
+    def test_bulk_copy_descendant_counts(self):
+        management.call_command("fix_descendant_counts", stdout=StringIO())
+        self.copy(slug="bulk-copy", bulk=True)
+
+        self.assertEqual(find_incorrect_descendant_counts(), [])
+
+
 class TestCreateAlias(TestCase):
     fixtures = ["test.json"]
 
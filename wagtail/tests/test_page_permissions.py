@@ -1,7 +1,9 @@
 import json
+import pickle
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import caches
 from django.test import Client, TestCase, override_settings
 from django.utils import timezone
 
@@ -10,6 +12,7 @@ from wagtail.models import (
     GroupPagePermission,
     Locale,
     Page,
+    PagePermissionMatcher,
     UserPagePermissionsProxy,
     Workflow,
     WorkflowTask,
@@ -915,3 +918,166 @@ class TestPagePermissionTesterCanCopyTo(TestCase):
         self.assertFalse(
             singleton_page_perms.can_copy_to(self.singleton_page.get_parent())
         )
+
+
+class TestPagePermissionMatcher(TestCase):
+    def setUp(self):
+        self.matcher = PagePermissionMatcher(
+            [
+                ("edit", "00010001"),
+                ("add", "000100010002"),
+                ("publish", "000100010002"),
+                ("edit", "0001000100020003"),
+                ("lock", "00010003"),
+                ("unlock", "0001000300010001"),
+            ]
+        )
+
+    def test_get_permissions(self):
+        self.assertEqual(self.matcher.get_permissions("0001"), set())
+        self.assertEqual(self.matcher.get_permissions("00010001"), {"edit"})
+        self.assertEqual(
+            self.matcher.get_permissions("00010001000200050001"),
+            {"edit", "add", "publish"},
+        )
+        self.assertEqual(self.matcher.get_permissions("00010002"), set())
+        self.assertEqual(
+            self.matcher.get_permissions("0001000300010001"), {"lock", "unlock"}
+        )
+
+    def test_get_root_paths(self):
+        # Subtrees within other subtrees are left out
+        self.assertEqual(self.matcher.get_root_paths("edit"), ["00010001"])
+        self.assertEqual(
+            self.matcher.get_root_paths("add", "lock"), ["000100010002", "00010003"]
+        )
+        self.assertEqual(
+            self.matcher.get_root_paths("edit", "add", "lock"), ["00010001", "00010003"]
+        )
+        self.assertEqual(self.matcher.get_root_paths("bulk_delete"), [])
+        self.assertIsNone(self.matcher.get_path_filter("bulk_delete"))
+
+    def test_get_ancestor_paths(self):
+        self.assertEqual(
+            self.matcher.get_ancestor_paths(),
+            {"0001", "00010001", "000100010002", "00010003", "000100030001"},
+        )
+
+    def test_get_common_ancestor_path(self):
+        self.assertEqual(self.matcher.get_common_ancestor_path(), "0001")
+        self.assertEqual(
+            PagePermissionMatcher(
+                [("edit", "000100010002"), ("add", "0001000100030004")]
+            ).get_common_ancestor_path(),
+            "00010001",
+        )
+        self.assertEqual(
+            PagePermissionMatcher([("edit", "0001")]).get_common_ancestor_path(), ""
+        )
+
+    def test_pickle(self):
+        matcher = pickle.loads(pickle.dumps(self.matcher))
+        self.assertEqual(matcher.grants, self.matcher.grants)
+        self.assertEqual(
+            matcher.get_permissions("00010001000200050001"), {"edit", "add", "publish"}
+        )
+
+
+class TestUserPagePermissionsProxyMatcher(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.event_editor = get_user_model().objects.get(
+            email="eventeditor@example.com"
+        )
+        self.events_page = Page.objects.get(url_path="/home/events/")
+        self.christmas_page = Page.objects.get(url_path="/home/events/christmas/")
+
+    def test_matcher_is_compiled_once(self):
+        user_perms = UserPagePermissionsProxy(self.event_editor)
+
+        with self.assertNumQueries(1):
+            user_perms.for_page(self.events_page)
+            user_perms.for_page(self.christmas_page)
+            user_perms.can_remove_locks()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                user_perms.for_page(self.christmas_page).permissions, {"add"}
+            )
+
+    def test_explorable_pages_for_user_without_permissions(self):
+        user = get_user_model().objects.create_user(
+            "nopermissions", "nopermissions@example.com", "password"
+        )
+        user_perms = UserPagePermissionsProxy(user)
+        self.assertFalse(user_perms.explorable_pages().exists())
+        self.assertFalse(user_perms.editable_pages().exists())
+        self.assertFalse(user_perms.publishable_pages().exists())
+        self.assertFalse(user_perms.revisions_for_moderation().exists())
+
+
+@override_settings(
+    WAGTAIL_PAGE_PERMISSIONS_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class TestPagePermissionsCache(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.event_editor = get_user_model().objects.get(
+            email="eventeditor@example.com"
+        )
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+
+    def get_about_us_permissions(self):
+        return (
+            UserPagePermissionsProxy(self.event_editor)
+            .for_page(self.about_us_page)
+            .permissions
+        )
+
+    def test_cached_across_proxies(self):
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_about_us_permissions(), set())
+
+    def test_invalidated_when_permissions_change(self):
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+        permission = GroupPagePermission.objects.create(
+            group=Group.objects.get(name="Event editors"),
+            page=self.about_us_page,
+            permission_type="edit",
+        )
+        self.assertEqual(self.get_about_us_permissions(), {"edit"})
+
+        permission.delete()
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+    def test_invalidated_when_group_membership_changes(self):
+        group = Group.objects.create(name="About us editors")
+        GroupPagePermission.objects.create(
+            group=group, page=self.about_us_page, permission_type="edit"
+        )
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+        self.event_editor.groups.add(group)
+        self.assertEqual(self.get_about_us_permissions(), {"edit"})
+
+        self.event_editor.groups.remove(group)
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+    def test_invalidated_when_pages_move(self):
+        events_page = Page.objects.get(url_path="/home/events/")
+        self.assertEqual(self.get_about_us_permissions(), set())
+
+        self.about_us_page.move(events_page, pos="last-child")
+        self.about_us_page.refresh_from_db()
+        self.assertEqual(self.get_about_us_permissions(), {"add"})
@@ -0,0 +1,155 @@
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+
+from wagtail import blocks
+from wagtail.profiling import (
+    QueryBudgetExceeded,
+    ServeProfile,
+    _current_profile,
+    get_profile_stats,
+    profile_phase,
+    reset_profile_stats,
+)
+from wagtail.signals import page_served
+from wagtail.test.testapp.models import EventPage
+
+
+@override_settings(
+    MIDDLEWARE=settings.MIDDLEWARE + ("wagtail.profiling.ServeProfilingMiddleware",),
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class TestServeProfilingMiddleware(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        reset_profile_stats()
+        self.profiles = []
+
+        def receiver(sender, profile, **kwargs):
+            self.profiles.append(profile)
+
+        page_served.connect(receiver)
+        self.addCleanup(page_served.disconnect, receiver)
+
+    def test_profile(self):
+        response = self.client.get("/events/christmas/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(self.profiles), 1)
+        profile = self.profiles[0]
+
+        self.assertIsInstance(profile.page, EventPage)
+        self.assertEqual(profile.page_type, "tests.EventPage")
+        self.assertGreater(profile.queries, 0)
+        self.assertGreater(profile.time, 0)
+
+        for phase in ["route", "before_serve_page", "serve", "get_context", "render"]:
+            self.assertIn(phase, profile.phases)
+            self.assertEqual(profile.phases[phase][0], 1)
+
+        self.assertGreater(profile.phases["route"][2], 0)
+        self.assertLessEqual(
+            sum(profile.phases[phase][2] for phase in ["route", "serve", "render"]),
+            profile.queries,
+        )
+
+    def test_non_page_requests_are_not_profiled(self):
+        response = self.client.get("/admin/login/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.profiles, [])
+        self.assertEqual(get_profile_stats(), {})
+
+    def test_stats(self):
+        self.client.get("/events/christmas/")
+        self.client.get("/events/christmas/")
+        self.client.get("/events/")
+
+        stats = get_profile_stats()
+        self.assertEqual(stats["tests.EventPage"]["requests"], 2)
+        self.assertEqual(stats["tests.EventPage"]["phases"]["route"][0], 2)
+        self.assertEqual(
+            stats["tests.EventPage"]["queries"],
+            sum(p.queries for p in self.profiles[:2]),
+        )
+        self.assertEqual(stats["tests.EventIndex"]["requests"], 1)
+
+        stdout = StringIO()
+        call_command("serve_profile_stats", "--reset", stdout=stdout)
+        self.assertIn("tests.EventPage: 2 requests", stdout.getvalue())
+        self.assertIn("get_context", stdout.getvalue())
+        self.assertEqual(get_profile_stats(), {})
+
+        stdout = StringIO()
+        call_command("serve_profile_stats", stdout=stdout)
+        self.assertEqual(stdout.getvalue(), "No page requests have been profiled\n")
+
+    @override_settings(WAGTAIL_SERVE_PROFILE_STATS=False)
+    def test_stats_disabled(self):
+        self.client.get("/events/christmas/")
+        self.assertEqual(len(self.profiles), 1)
+        self.assertEqual(get_profile_stats(), {})
+
+    @override_settings(WAGTAIL_SERVE_QUERY_BUDGET=1)
+    def test_query_budget_warns(self):
+        with self.assertLogs("wagtail", level="WARNING") as logs:
+            response = self.client.get("/events/christmas/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            "Serving /events/christmas/ (tests.EventPage) ran", logs.output[0]
+        )
+        self.assertEqual(get_profile_stats()["tests.EventPage"]["over_budget"], 1)
+
+    @override_settings(
+        WAGTAIL_SERVE_QUERY_BUDGET=1, WAGTAIL_SERVE_QUERY_BUDGET_ACTION="raise"
+    )
+    def test_query_budget_raises(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get("/events/christmas/")
+
+    @override_settings(WAGTAIL_SERVE_QUERY_BUDGET=1000)
+    def test_within_query_budget(self):
+        with mock.patch("wagtail.profiling.logger") as logger:
+            self.client.get("/events/christmas/")
+
+        logger.warning.assert_not_called()
+        self.assertEqual(get_profile_stats()["tests.EventPage"]["over_budget"], 0)
+
+
+class TestProfilePhase(TestCase):
+    def test_without_profile(self):
+        # Does nothing when no request is being profiled
+        with profile_phase("route"):
+            pass
+
+    def test_blocks_not_profiled_without_middleware(self):
+        block = blocks.ListBlock(blocks.CharBlock())
+        with mock.patch("wagtail.blocks.base.profile_phase") as profile_phase_mock:
+            block.render(["foo", "bar"])
+        profile_phase_mock.assert_not_called()
+
+    @override_settings(
+        MIDDLEWARE=settings.MIDDLEWARE + ("wagtail.profiling.ServeProfilingMiddleware",)
+    )
+    def test_nested_phases(self):
+        profile = ServeProfile(RequestFactory().get("/"))
+        token = _current_profile.set(profile)
+        try:
+            block = blocks.ListBlock(blocks.CharBlock())
+            block.render(["foo", "bar"])
+        finally:
+            _current_profile.reset(token)
+
+        self.assertEqual(profile.phases["block:ListBlock"][0], 1)
+        self.assertEqual(profile.phases["block:CharBlock"][0], 2)
+        self.assertGreaterEqual(
+            profile.phases["block:ListBlock"][1], profile.phases["block:CharBlock"][1]
+        )
@@ -1,13 +1,18 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+from django.core.cache import caches
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import translation
 
-from wagtail.models import Locale, Page
+from wagtail.documents import get_document_model
+from wagtail.models import Locale, Page, Site
 from wagtail.rich_text import RichText, expand_db_html
+from wagtail.rich_text.cache import get_model_dependency_key
 from wagtail.rich_text.feature_registry import FeatureRegistry
 from wagtail.rich_text.pages import PageLinkHandler
-from wagtail.rich_text.rewriters import LinkRewriter, extract_attrs
+from wagtail.rich_text.rewriters import EmbedRewriter, LinkRewriter, extract_attrs
 from wagtail.test.testapp.models import EventPage
 
 
@@ -28,6 +33,31 @@ class TestPageLinktypeHandler(TestCase):
         result = PageLinkHandler.expand_db_attributes({"id": 1})
         self.assertEqual(result, '<a href="None">')
 
+    def test_expand_db_attributes_many(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        events = Page.objects.get(url_path="/home/events/")
+        result = PageLinkHandler.expand_db_attributes_many(
+            [
+                {"id": christmas.id},
+                {"id": 0},
+                {"id": "not-an-id"},
+                {},
+                {"id": str(events.id)},
+                {"id": christmas.id},
+            ]
+        )
+        self.assertEqual(
+            result,
+            [
+                '<a href="/events/christmas/">',
+                "<a>",
+                "<a>",
+                "<a>",
+                '<a href="/events/">',
+                '<a href="/events/christmas/">',
+            ],
+        )
+
 
 @override_settings(
     WAGTAIL_I18N_ENABLED=True,
@@ -70,6 +100,23 @@ class TestPageLinktypeHandlerWithI18N(TestCase):
             result = PageLinkHandler.expand_db_attributes({"id": self.event_page.id})
             self.assertEqual(result, '<a href="/en/events/christmas/">')
 
+    def test_expand_db_attributes_many_autolocalizes(self):
+        with translation.override("fr"):
+            result = PageLinkHandler.expand_db_attributes_many(
+                [{"id": self.event_page.id}, {"id": 0}]
+            )
+        self.assertEqual(result, ['<a href="/fr/events/noel/">', "<a>"])
+
+    def test_expand_db_attributes_many_doesnt_autolocalize_unpublished_page(self):
+        self.fr_event_page.unpublish()
+        self.fr_event_page.save()
+
+        with translation.override("fr"):
+            result = PageLinkHandler.expand_db_attributes_many(
+                [{"id": self.event_page.id}]
+            )
+        self.assertEqual(result, ['<a href="/en/events/christmas/">'])
+
 
 class TestExtractAttrs(TestCase):
     def test_extract_attr(self):
@@ -89,16 +136,203 @@ class TestExpandDbHtml(TestCase):
         result = expand_db_html(html)
         self.assertEqual(result, '<a id="1">foo</a>')
 
-    @patch("wagtail.embeds.embeds.get_embed")
-    def test_expand_db_html_with_embed(self, get_embed):
+    @patch("wagtail.embeds.embeds.get_embeds")
+    def test_expand_db_html_with_embed(self, get_embeds):
         from wagtail.embeds.models import Embed
 
-        get_embed.return_value = Embed(html="test html")
+        get_embeds.return_value = {
+            "http://www.youtube.com/watch": Embed(html="test html")
+        }
         html = '<embed embedtype="media" url="http://www.youtube.com/watch" />'
         result = expand_db_html(html)
         self.assertIn("test html", result)
 
 
+class TestExpandDbHtmlBatching(TestCase):
+    fixtures = ["test.json"]
+
+    def test_page_links_are_resolved_in_bulk(self):
+        pages = Page.objects.filter(depth__gt=1)
+        self.assertGreater(len(pages), 5)
+        html = "".join(
+            '<p><a linktype="page" id="%d">%s</a></p>' % (page.id, page.title)
+            for page in pages
+        )
+
+        # Warm up the site root paths cache
+        Site.get_site_root_paths()
+
+        # One query for the base pages, one per specific page type, one for
+        # the active locale and one (cache) lookup of the site root paths,
+        # regardless of the number of links
+        specific_types = {page.specific_class for page in pages}
+        with self.assertNumQueries(3 + len(specific_types)):
+            result = expand_db_html(html)
+
+        for page in pages:
+            self.assertIn(
+                '<a href="%s">%s</a>' % (page.specific.url, page.title), result
+            )
+
+    def test_replacements_keep_document_order(self):
+        html = (
+            '<a linktype="page" id="4">one</a><a href="#x">two</a>'
+            '<a linktype="page" id="0">three</a><a linktype="page" id="4">four</a>'
+        )
+        result = expand_db_html(html)
+        self.assertEqual(
+            result,
+            '<a href="/events/christmas/">one</a><a href="#x">two</a>'
+            '<a>three</a><a href="/events/christmas/">four</a>',
+        )
+
+
+@override_settings(
+    WAGTAIL_RICH_TEXT_CACHE=True,
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "richtext-tests",
+        }
+    },
+)
+class TestRichTextCache(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        caches["default"].clear()
+        self.christmas = Page.objects.get(url_path="/home/events/christmas/")
+        self.html = '<p><a linktype="page" id="%d">Christmas</a></p>' % (
+            self.christmas.id
+        )
+
+    def assertCached(self, html, expected):
+        with self.assertNumQueries(0):
+            self.assertEqual(expand_db_html(html), expected)
+
+    def test_expanded_html_is_cached(self):
+        result = expand_db_html(self.html)
+        self.assertEqual(result, '<p><a href="/events/christmas/">Christmas</a></p>')
+        self.assertCached(self.html, result)
+
+    def test_cache_disabled_by_default(self):
+        with override_settings(WAGTAIL_RICH_TEXT_CACHE=False):
+            expand_db_html(self.html)
+            with self.assertNumQueries(3):
+                expand_db_html(self.html)
+
+    def test_cache_is_keyed_by_language(self):
+        expand_db_html(self.html)
+        with translation.override("fr"):
+            with CaptureQueriesContext(connection) as queries:
+                expand_db_html(self.html)
+        self.assertTrue(queries.captured_queries)
+
+    def test_slug_change_invalidates(self):
+        expand_db_html(self.html)
+
+        self.christmas.slug = "xmas"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.christmas.save()
+
+        self.assertEqual(
+            expand_db_html(self.html), '<p><a href="/events/xmas/">Christmas</a></p>'
+        )
+
+    def test_ancestor_move_invalidates(self):
+        expand_db_html(self.html)
+
+        events = Page.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        events.move(about_us, pos="last-child")
+
+        self.assertEqual(
+            expand_db_html(self.html),
+            '<p><a href="/about-us/events/christmas/">Christmas</a></p>',
+        )
+
+    def test_ancestor_move_only_replaces_one_key(self):
+        expand_db_html(self.html)
+
+        events = Page.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        with patch(
+            "wagtail.rich_text.cache.invalidate_dependency_keys"
+        ) as invalidate_dependency_keys:
+            events.move(about_us, pos="last-child")
+
+        # Keys for each of the moved pages are not looked up and replaced
+        self.assertEqual(
+            [
+                list(call.args[0])
+                for call in invalidate_dependency_keys.call_args_list
+                if call.args[0]
+            ],
+            [[get_model_dependency_key(Page)]],
+        )
+
+    def test_leaf_page_slug_change_leaves_other_pages_cached(self):
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        other_html = '<a linktype="page" id="%d">' % about_us.id
+        expand_db_html(self.html)
+        expand_db_html(other_html)
+
+        about_us.slug = "about"
+        with self.captureOnCommitCallbacks(execute=True):
+            about_us.save()
+
+        self.assertEqual(expand_db_html(other_html), '<a href="/about/">')
+        self.assertCached(
+            self.html, '<p><a href="/events/christmas/">Christmas</a></p>'
+        )
+
+    def test_unpublish_invalidates(self):
+        expand_db_html(self.html)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.christmas.unpublish()
+        # Only cache reads are needed for an unrelated page
+        other_html = (
+            '<a linktype="page" id="%d">'
+            % Page.objects.get(url_path="/home/about-us/").id
+        )
+        expand_db_html(other_html)
+        self.assertCached(other_html, '<a href="/about-us/">')
+
+        with self.assertNumQueries(3):
+            expand_db_html(self.html)
+
+    def test_unrelated_page_change_does_not_invalidate(self):
+        result = expand_db_html(self.html)
+
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        about_us.slug = "about"
+        with self.captureOnCommitCallbacks(execute=True):
+            about_us.save()
+
+        self.assertCached(self.html, result)
+
+    def test_document_change_invalidates(self):
+        document = get_document_model().objects.create(
+            title="Test document", file="example.doc"
+        )
+        html = '<a linktype="document" id="%d">document</a>' % document.id
+        self.assertIn("example.doc", expand_db_html(html))
+
+        document.file = "updated.doc"
+        document.save()
+
+        self.assertIn("updated.doc", expand_db_html(html))
+
+    def test_site_change_invalidates(self):
+        expand_db_html(self.html)
+        Site.objects.create(hostname="other.example.com", root_page_id=1)
+
+        self.assertEqual(
+            expand_db_html(self.html),
+            '<p><a href="http://localhost/events/christmas/">Christmas</a></p>',
+        )
+
+
 class TestRichTextValue(TestCase):
     fixtures = ["test.json"]
 
@@ -225,6 +459,48 @@ class TestLinkRewriterTagReplacing(TestCase):
         )
 
 
+class TestLinkRewriterBulkRules(TestCase):
+    def test_bulk_rule_receives_all_tags_of_type(self):
+        bulk_rule = Mock(
+            side_effect=lambda attrs_list: [
+                '<a href="/bulk/{}">'.format(attrs["id"]) for attrs in attrs_list
+            ]
+        )
+        rewriter = LinkRewriter(
+            rules={"page": lambda attrs: "<a>"},
+            bulk_rules={"page": bulk_rule},
+        )
+
+        result = rewriter(
+            '<a linktype="page" id="1">a</a> <a href="#top">b</a> '
+            '<a linktype="page" id="2">c</a>'
+        )
+
+        bulk_rule.assert_called_once_with(
+            [{"linktype": "page", "id": "1"}, {"linktype": "page", "id": "2"}]
+        )
+        self.assertEqual(
+            result,
+            '<a href="/bulk/1">a</a> <a href="#top">b</a> <a href="/bulk/2">c</a>',
+        )
+
+    def test_embed_rewriter_bulk_rules(self):
+        rewriter = EmbedRewriter(
+            bulk_rules={
+                "image": lambda attrs_list: [
+                    '<img src="{}">'.format(attrs["id"]) for attrs in attrs_list
+                ]
+            }
+        )
+
+        result = rewriter(
+            '<embed embedtype="image" id="1"/><embed embedtype="unknown" id="2"/>'
+            '<embed id="3"/><embed embedtype="image" id="4"/>'
+        )
+
+        self.assertEqual(result, '<img src="1"><img src="4">')
+
+
 class TestRichTextField(TestCase):
     fixtures = ["test.json"]
 
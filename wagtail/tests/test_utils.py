@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*
+import json
+
 from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
 from django.test import TestCase, override_settings
 from django.utils.text import slugify
@@ -18,6 +20,7 @@ from wagtail.coreutils import (
     string_to_ascii,
 )
 from wagtail.models import Page, Site
+from wagtail.utils.json_delta import apply_delta, make_delta
 from wagtail.utils.utils import deep_update
 
 
@@ -441,3 +444,39 @@ class TestDeepUpdate(TestCase):
                 "starship": "enterprise",
             },
         )
+
+
+class TestJsonDelta(TestCase):
+    def test_make_and_apply_delta(self):
+        base = {"title": "Hello", "slug": "hello", "live": True}
+        content = {"title": "Hello world", "live": True, "seo_title": "Hi"}
+
+        delta = make_delta(base, content)
+
+        self.assertEqual(
+            delta,
+            {"unset": ["slug"], "set": {"title": "Hello world", "seo_title": "Hi"}},
+        )
+        self.assertEqual(apply_delta(base, delta), content)
+
+    def test_unchanged(self):
+        base = {"title": "Hello", "body": "x" * 1000}
+        self.assertEqual(make_delta(base, dict(base)), {})
+        self.assertEqual(apply_delta(base, {}), base)
+
+    def test_long_text_delta(self):
+        blocks = [
+            '{"type": "paragraph", "value": "<p>Paragraph %d</p>", "id": "%d"}' % (i, i)
+            for i in range(100)
+        ]
+        base = {"body": "[" + ", ".join(blocks) + "]"}
+        blocks[50] = '{"type": "paragraph", "value": "<p>Changed</p>", "id": "50"}'
+        blocks.insert(80, '{"type": "heading", "value": "New", "id": "new"}')
+        content = {"body": "[" + ", ".join(blocks) + "]"}
+
+        delta = make_delta(base, content)
+
+        # Only the changed parts of the text are stored
+        self.assertEqual(list(delta), ["text"])
+        self.assertLess(len(json.dumps(delta)), len(content["body"]) // 10)
+        self.assertEqual(apply_delta(base, delta), content)
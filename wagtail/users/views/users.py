@@ -2,7 +2,6 @@ from django.conf import settings
 from django.contrib.auth import get_user_model, update_session_auth_hash
 from django.contrib.auth.models import Group
 from django.core.exceptions import PermissionDenied
-from django.core.paginator import Paginator
 from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404, redirect
@@ -14,6 +13,7 @@ from django.views.decorators.vary import vary_on_headers
 from wagtail import hooks
 from wagtail.admin import messages
 from wagtail.admin.auth import any_permission_required, permission_required
+from wagtail.admin.counts import CachedCountPaginator
 from wagtail.admin.forms.search import SearchForm
 from wagtail.compat import AUTH_USER_APP_LABEL, AUTH_USER_MODEL_NAME
 from wagtail.log_actions import log
@@ -109,7 +109,9 @@ def index(request, *args):
     else:
         ordering = "name"
 
-    paginator = Paginator(users.select_related("wagtail_userprofile"), per_page=20)
+    paginator = CachedCountPaginator(
+        users.select_related("wagtail_userprofile"), per_page=20
+    )
     users = paginator.get_page(request.GET.get("p"))
 
     if request.headers.get("x-requested-with") == "XMLHttpRequest":
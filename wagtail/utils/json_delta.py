@@ -0,0 +1,111 @@
+"""
+Compact deltas between JSON objects, as used to store revisions as changes against an earlier
+snapshot of the same object.
+
+A delta is a dict with any of the following keys:
+
+- ``set`` - a dict of keys that were added or whose values changed
+- ``unset`` - a list of keys that were removed
+- ``text`` - a dict of keys whose long string values changed, mapping each key to a list of edit
+  operations. Each operation is either a ``[start, end]`` pair, to copy that slice of the original
+  string, or a string to insert.
+
+Long strings are compared in chunks that end at a ``,``, ``}`` or ``>`` character, so that a small
+change to a large serialised StreamField or rich text value only stores the chunks around it.
+"""
+import re
+from difflib import SequenceMatcher
+
+# Strings shorter than this are replaced rather than diffed
+TEXT_DELTA_MIN_LENGTH = 256
+
+TEXT_CHUNK_RE = re.compile(r"(?<=[,}>])")
+
+
+def _split_text(text):
+    return TEXT_CHUNK_RE.split(text)
+
+
+def make_text_delta(base, text):
+    """
+    Returns a list of operations that turn the string ``base`` into ``text``
+    """
+    base_chunks = _split_text(base)
+    chunks = _split_text(text)
+
+    # Character offset of the start of each chunk of base
+    offsets = [0]
+    for chunk in base_chunks:
+        offsets.append(offsets[-1] + len(chunk))
+
+    operations = []
+    matcher = SequenceMatcher(None, base_chunks, chunks, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            start, end = offsets[i1], offsets[i2]
+            if operations and isinstance(operations[-1], list):
+                # Extend the previous copy if it ends where this one starts
+                if operations[-1][1] == start:
+                    operations[-1][1] = end
+                    continue
+            operations.append([start, end])
+        elif j1 != j2:
+            inserted = "".join(chunks[j1:j2])
+            if operations and isinstance(operations[-1], str):
+                operations[-1] += inserted
+            else:
+                operations.append(inserted)
+
+    return operations
+
+
+def apply_text_delta(base, operations):
+    return "".join(
+        base[operation[0] : operation[1]] if isinstance(operation, list) else operation
+        for operation in operations
+    )
+
+
+def make_delta(base, content):
+    """
+    Returns a delta that turns the dict ``base`` into ``content``. Both should contain only values
+    that can be represented in JSON.
+    """
+    delta = {}
+
+    unset = [key for key in base if key not in content]
+    if unset:
+        delta["unset"] = unset
+
+    for key, value in content.items():
+        if key in base and base[key] == value:
+            continue
+
+        base_value = base.get(key)
+        if (
+            isinstance(value, str)
+            and isinstance(base_value, str)
+            and len(value) >= TEXT_DELTA_MIN_LENGTH
+        ):
+            delta.setdefault("text", {})[key] = make_text_delta(base_value, value)
+        else:
+            delta.setdefault("set", {})[key] = value
+
+    return delta
+
+
+def apply_delta(base, delta):
+    """
+    Returns a new dict with the changes in ``delta`` applied to ``base``
+    """
+    content = dict(base)
+
+    for key in delta.get("unset", []):
+        content.pop(key, None)
+
+    content.update(delta.get("set", {}))
+
+    for key, operations in delta.get("text", {}).items():
+        content[key] = apply_text_delta(base[key], operations)
+
+    return content
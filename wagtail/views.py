@@ -1,12 +1,18 @@
 from django.conf import settings
 from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.template.response import SimpleTemplateResponse
 from django.urls import reverse
 from django.utils.http import url_has_allowed_host_and_scheme
 
 from wagtail import hooks
 from wagtail.forms import PasswordViewRestrictionForm
 from wagtail.models import Page, PageViewRestriction, Site
+from wagtail.profiling import (
+    get_current_profile,
+    profile_phase,
+    profile_template_response,
+)
 
 
 def serve(request, path):
@@ -16,16 +22,28 @@ def serve(request, path):
         raise Http404
 
     path_components = [component for component in path.split("/") if component]
-    page, args, kwargs = site.root_page.localized.specific.route(
-        request, path_components
-    )
+    with profile_phase("route"):
+        page, args, kwargs = site.root_page.localized.specific.route(
+            request, path_components
+        )
+
+    profile = get_current_profile()
+    if profile is not None:
+        profile.page = page
+
+    with profile_phase("before_serve_page"):
+        for fn in hooks.get_hooks("before_serve_page"):
+            result = fn(page, request, args, kwargs)
+            if isinstance(result, HttpResponse):
+                return result
+
+    with profile_phase("serve"):
+        response = page.serve(request, *args, **kwargs)
 
-    for fn in hooks.get_hooks("before_serve_page"):
-        result = fn(page, request, args, kwargs)
-        if isinstance(result, HttpResponse):
-            return result
+    if profile is not None and isinstance(response, SimpleTemplateResponse):
+        profile_template_response(response)
 
-    return page.serve(request, *args, **kwargs)
+    return response
 
 
 def authenticate_with_password(request, page_view_restriction_id, page_id):